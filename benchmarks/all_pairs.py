@@ -0,0 +1,61 @@
+"""Compares DijkstraAllPairsSP with ParallelAllPairsSP, in one process and in
+a pool of worker processes, on a random sparse edge-weighted digraph, and
+reports the peak memory allocated by Python for each.
+
+Usage: python benchmarks/all_pairs.py [number of vertices] [processes]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from itu.algs4.graphs.dijkstra_all_pairs_sp import DijkstraAllPairsSP
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.parallel_all_pairs_sp import ParallelAllPairsSP
+
+
+def random_digraph(V, E):
+    random.seed(0)
+    G = EdgeWeightedDigraph(V)
+    for _ in range(E):
+        G.add_edge(
+            DirectedEdge(random.randrange(V), random.randrange(V), random.random())
+        )
+    return G
+
+
+def measure(name, build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:32} {:8.2f}s {:9.1f} MB".format(name, elapsed, peak / 2**20))
+    return result
+
+
+def main():
+    V = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    G = random_digraph(V, 5 * V)
+    print("{} vertices, {} edges".format(G.V(), G.E()))
+    old = measure("DijkstraAllPairsSP", lambda: DijkstraAllPairsSP(G))
+    serial = measure(
+        "ParallelAllPairsSP, 1 process", lambda: ParallelAllPairsSP(G, processes=1)
+    )
+    parallel = measure(
+        "ParallelAllPairsSP, pool", lambda: ParallelAllPairsSP(G, processes)
+    )
+    for s in range(0, V, max(1, V // 20)):
+        for t in range(V):
+            assert abs(old.dist(s, t) - serial.dist(s, t)) < 1e-9 or not old.has_path(
+                s, t
+            )
+            assert serial.dist(s, t) == parallel.dist(s, t)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compares the number of settled vertices and the time per query of
+Dijkstra's algorithm and A* with the Euclidean and landmark heuristics on a
+spatial graph: random points in the unit square, each connected to its
+nearest neighbours by roads slightly longer than the straight line.
+
+Usage: python benchmarks/astar.py [number of vertices] [number of queries]
+"""
+
+import math
+import random
+import sys
+import time
+
+from itu.algs4.graphs.astar_sp import AStarSP, LandmarkHeuristic, euclidean_heuristic
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+
+
+def spatial_digraph(V, neighbours=4):
+    # connects every point to its nearest points in a grid of buckets
+    random.seed(0)
+    coordinates = [(random.random(), random.random()) for _ in range(V)]
+    side = max(1, int(math.sqrt(V / 2)))
+    buckets = {}
+    for v, (x, y) in enumerate(coordinates):
+        buckets.setdefault((int(x * side), int(y * side)), []).append(v)
+    G = EdgeWeightedDigraph(V)
+    for v, (x, y) in enumerate(coordinates):
+        bx, by = int(x * side), int(y * side)
+        near = [
+            w
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            for w in buckets.get((bx + dx, by + dy), [])
+            if w != v
+        ]
+        near.sort(key=lambda w: math.dist(coordinates[v], coordinates[w]))
+        for w in near[:neighbours]:
+            length = math.dist(coordinates[v], coordinates[w])
+            weight = length * random.uniform(1.0, 1.3)
+            G.add_edge(DirectedEdge(v, w, weight))
+            G.add_edge(DirectedEdge(w, v, weight))
+    return G, coordinates
+
+
+def zero_heuristic(v, t):
+    return 0.0
+
+
+def main():
+    V = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    G, coordinates = spatial_digraph(V)
+    start = time.perf_counter()
+    landmarks = LandmarkHeuristic(G, LandmarkHeuristic.choose_landmarks(G, 8))
+    print(
+        "{} vertices, {} edges, {} queries, landmarks in {:.2f}s".format(
+            G.V(), G.E(), count, time.perf_counter() - start
+        )
+    )
+    random.seed(1)
+    queries = [(random.randrange(V), random.randrange(V)) for _ in range(count)]
+    heuristics = [
+        ("Dijkstra", zero_heuristic),
+        ("A* Euclidean", euclidean_heuristic(coordinates)),
+        ("A* landmarks", landmarks),
+    ]
+    expected = None
+    for name, heuristic in heuristics:
+        settled = 0
+        dists = []
+        start = time.perf_counter()
+        for s, t in queries:
+            sp = AStarSP(G, s, t, heuristic)
+            settled += sp.settled()
+            dists.append(sp.dist_to(t))
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = dists
+        for a, b in zip(expected, dists):
+            assert abs(a - b) < 1e-9 or a == b
+        print(
+            "{:14} {:9.0f} settled per query {:9.2f} ms per query".format(
+                name, settled / count, 1000 * elapsed / count
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compares KruskalMST with presorted edges with BoruvkaMST, in one process
+and in a pool of worker processes, on a random edge-weighted graph.
+
+Usage: python benchmarks/boruvka.py [number of vertices] [number of edges] [processes]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.graphs.boruvka_mst import BoruvkaMST
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.kruskal_mst import KruskalMST
+
+
+def random_graph(V, E):
+    random.seed(0)
+    G = EdgeWeightedGraph(V)
+    for _ in range(E):
+        G.add_edge(Edge(random.randrange(V), random.randrange(V), random.random()))
+    return G
+
+
+def main():
+    V = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    E = int(sys.argv[2]) if len(sys.argv) > 2 else 10 * V
+    processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    G = random_graph(V, E)
+    print("{} vertices, {} edges".format(G.V(), G.E()))
+    weights = []
+    for label, build in (
+        ("KruskalMST, presort", lambda: KruskalMST(G, presort=True)),
+        ("BoruvkaMST, 1 process", lambda: BoruvkaMST(G, processes=1)),
+        ("BoruvkaMST, pool", lambda: BoruvkaMST(G, processes)),
+    ):
+        start = time.perf_counter()
+        mst = build()
+        print("{:24} {:8.2f}s".format(label, time.perf_counter() - start))
+        weights.append(mst.weight())
+    assert max(weights) - min(weights) < 1e-6
+
+
+if __name__ == "__main__":
+    main()
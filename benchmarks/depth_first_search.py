@@ -0,0 +1,147 @@
+"""Compares the depth-first graph clients, which run on the explicit-stack
+search of graphs/nonrecursive_dfs.py, against the recursive code from the
+book on a random graph and digraph.
+
+Usage: python -O benchmarks/depth_first_search.py [vertices] [edges]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.fundamentals.queue import Queue
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.depth_first_order import DepthFirstOrder
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.kosaraju_sharir_scc import KosarajuSharirSCC
+
+
+class RecursiveCC:
+    # the original CC
+    def __init__(self, G):
+        self._marked = [False] * G.V()
+        self._id = [None] * G.V()
+        self._size = [0] * G.V()
+        self._count = 0
+        for v in range(G.V()):
+            if not self._marked[v]:
+                self._dfs(G, v)
+                self._count += 1
+
+    def _dfs(self, G, v):
+        self._marked[v] = True
+        self._id[v] = self._count
+        self._size[self._count] += 1
+        for w in G.adj(v):
+            if not self._marked[w]:
+                self._dfs(G, w)
+
+
+class RecursiveDepthFirstOrder:
+    # the original DepthFirstOrder, for digraphs
+    def __init__(self, G):
+        self._pre = [0] * G.V()
+        self._post = [0] * G.V()
+        self._preorder = Queue()
+        self._postorder = Queue()
+        self._marked = [False] * G.V()
+        self._pre_counter = 0
+        self._post_counter = 0
+        for v in range(G.V()):
+            if not self._marked[v]:
+                self._dfs(G, v)
+
+    def _dfs(self, G, v):
+        self._marked[v] = True
+        self._pre[v] = self._pre_counter
+        self._pre_counter += 1
+        self._preorder.enqueue(v)
+        for w in G.adj(v):
+            if not self._marked[w]:
+                self._dfs(G, w)
+        self._postorder.enqueue(v)
+        self._post[v] = self._post_counter
+        self._post_counter += 1
+
+    def reverse_post(self):
+        reverse = Stack()
+        for v in self._postorder:
+            reverse.push(v)
+        return reverse
+
+
+class RecursiveKosarajuSharirSCC:
+    # the original KosarajuSharirSCC
+    def __init__(self, G):
+        self._marked = [False] * G.V()
+        self._id = [0] * G.V()
+        self._count = 0
+        dfo = RecursiveDepthFirstOrder(G.reverse())
+        for v in dfo.reverse_post():
+            if not self._marked[v]:
+                self._dfs(G, v)
+                self._count += 1
+
+    def _dfs(self, G, v):
+        self._marked[v] = True
+        self._id[v] = self._count
+        for w in G.adj(v):
+            if not self._marked[w]:
+                self._dfs(G, w)
+
+
+def timed(make):
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        result = make()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    V = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    E = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * V
+    # the recursive versions need a frame per vertex on the longest path
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), V + 100))
+    random.seed(0)
+    edges = [(random.randrange(V), random.randrange(V)) for _ in range(E)]
+    G = Graph(V)
+    D = Digraph(V)
+    for v, w in edges:
+        G.add_edge(v, w)
+        D.add_edge(v, w)
+    print("{} vertices, {} edges, best of 3".format(V, E))
+    cases = [
+        ("CC", RecursiveCC, CC, G, lambda c: c._id),
+        (
+            "DepthFirstOrder",
+            RecursiveDepthFirstOrder,
+            DepthFirstOrder,
+            D,
+            lambda d: (d._pre, d._post),
+        ),
+        (
+            "KosarajuSharirSCC",
+            RecursiveKosarajuSharirSCC,
+            KosarajuSharirSCC,
+            D,
+            lambda s: s._id,
+        ),
+    ]
+    for name, old, new, graph, result in cases:
+        old_time, old_result = timed(lambda: old(graph))
+        new_time, new_result = timed(lambda: new(graph))
+        assert result(old_result) == result(new_result)
+        print(
+            "{:20} recursive {:7.3f}s   explicit stack {:7.3f}s   speedup {:5.2f}x".format(
+                name, old_time, new_time, old_time / new_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
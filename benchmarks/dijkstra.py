@@ -0,0 +1,72 @@
+"""Compares Dijkstra's algorithm with an IndexMinPQ against the lazy heapq
+version on road-network style graphs: a square grid where every vertex is
+connected to its neighbours in both directions, with random travel times.
+
+Usage: python benchmarks/dijkstra.py [grid side]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.graphs.csr_graph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.dijkstra_undirected_sp import DijkstraUndirectedSP
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+
+
+def grid_roads(n):
+    # the roads of an n-by-n grid as (v, w, travel time) triples
+    random.seed(0)
+    roads = []
+    for row in range(n):
+        for col in range(n):
+            v = row * n + col
+            if col + 1 < n:
+                roads.append((v, v + 1, random.uniform(1.0, 10.0)))
+            if row + 1 < n:
+                roads.append((v, v + n, random.uniform(1.0, 10.0)))
+    return roads
+
+
+def timed(sp_class, G, s, lazy):
+    start = time.perf_counter()
+    sp = sp_class(G, s, lazy=lazy)
+    return time.perf_counter() - start, sp
+
+
+def compare(name, sp_class, G, s):
+    old_time, old = timed(sp_class, G, s, lazy=False)
+    new_time, new = timed(sp_class, G, s, lazy=True)
+    for v in range(G.V()):
+        assert abs(old.dist_to(v) - new.dist_to(v)) < 1e-9
+    print(
+        "{:24} IndexMinPQ {:7.3f}s   heapq {:7.3f}s   speedup {:5.1f}x".format(
+            name, old_time, new_time, old_time / new_time
+        )
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    roads = grid_roads(n)
+    digraph = EdgeWeightedDigraph(n * n)
+    graph = EdgeWeightedGraph(n * n)
+    for v, w, weight in roads:
+        digraph.add_edge(DirectedEdge(v, w, weight))
+        digraph.add_edge(DirectedEdge(w, v, weight))
+        graph.add_edge(Edge(v, w, weight))
+    s = n * n // 2 + n // 2  # the centre of the grid
+    print("{} vertices, {} roads".format(n * n, len(roads)))
+    compare("DijkstraSP", DijkstraSP, digraph, s)
+    compare(
+        "DijkstraSP (CSR)", DijkstraSP, CSREdgeWeightedDigraph.from_graph(digraph), s
+    )
+    compare("DijkstraUndirectedSP", DijkstraUndirectedSP, graph, s)
+
+
+if __name__ == "__main__":
+    main()
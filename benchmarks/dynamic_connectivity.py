@@ -0,0 +1,77 @@
+"""Compares OfflineDynamicConnectivity with rebuilding CC before every query,
+on a random timeline of edge insertions, deletions and connectivity queries.
+
+Usage: python benchmarks/dynamic_connectivity.py [number of vertices] [number of operations]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.dynamic_connectivity import OfflineDynamicConnectivity
+from itu.algs4.graphs.graph import Graph
+
+
+def random_timeline(V, count):
+    random.seed(0)
+    present = []
+    timeline = []
+    for _ in range(count):
+        op = random.random()
+        if op < 0.4 or not present:
+            edge = (random.randrange(V), random.randrange(V))
+            present.append(edge)
+            timeline.append(("+", edge))
+        elif op < 0.7:
+            timeline.append(("-", present.pop(random.randrange(len(present)))))
+        else:
+            timeline.append(("?", (random.randrange(V), random.randrange(V))))
+    return timeline
+
+
+def rebuild(V, timeline):
+    present = {}
+    answers = []
+    for op, edge in timeline:
+        if op == "+":
+            present[edge] = present.get(edge, 0) + 1
+        elif op == "-":
+            present[edge] -= 1
+        else:
+            G = Graph(V)
+            for (v, w), copies in present.items():
+                for _ in range(copies):
+                    G.add_edge(v, w)
+            cc = CC(G)
+            answers.append(cc.connected(*edge))
+    return answers
+
+
+def offline(V, timeline):
+    dc = OfflineDynamicConnectivity(Graph(V))
+    for op, (v, w) in timeline:
+        if op == "+":
+            dc.add_edge(v, w)
+        elif op == "-":
+            dc.remove_edge(v, w)
+        else:
+            dc.connected(v, w)
+    return dc.answers()
+
+
+def main():
+    V = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    timeline = random_timeline(V, count)
+    print("{} vertices, {} operations".format(V, count))
+    results = []
+    for name, solve in (("rebuild CC", rebuild), ("offline", offline)):
+        start = time.perf_counter()
+        results.append(solve(V, timeline))
+        print("{:12} {:8.2f}s".format(name, time.perf_counter() - start))
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Compares the time it takes to load a graph from a text file with the bulk
+reader used by from_stream() against reading it one token at a time.
+
+Usage: python benchmarks/graph_loading.py [number of edges]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from itu.algs4.graphs.csr_graph import CSRGraph
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.stdlib.instream import InStream
+
+
+def per_token_graph(stream):
+    # the original Graph.from_stream(): one readInt() call per vertex
+    g = Graph(stream.readInt())
+    E = stream.readInt()
+    for _ in range(E):
+        v = stream.readInt()
+        w = stream.readInt()
+        g._validateVertex(v)
+        g._validateVertex(w)
+        g.add_edge(v, w)
+    return g
+
+
+def per_token_digraph(stream):
+    # the original Digraph.from_stream()
+    g = Digraph(stream.readInt())
+    E = stream.readInt()
+    for _ in range(E):
+        v = stream.readInt()
+        w = stream.readInt()
+        g._validateVertex(v)
+        g._validateVertex(w)
+        g.add_edge(v, w)
+    return g
+
+
+def per_token_edge_weighted_digraph(stream):
+    # the original EdgeWeightedDigraph.from_stream()
+    g = EdgeWeightedDigraph(stream.readInt())
+    E = stream.readInt()
+    for _ in range(E):
+        v = stream.readInt()
+        w = stream.readInt()
+        g._validate_vertex(v)
+        g._validate_vertex(w)
+        weight = stream.readFloat()
+        g.add_edge(DirectedEdge(v, w, weight))
+    return g
+
+
+def write_graph(path, V, E, weighted):
+    random.seed(0)
+    with open(path, "w") as f:
+        f.write("{}\n{}\n".format(V, E))
+        for _ in range(E):
+            v, w = random.randrange(V), random.randrange(V)
+            if weighted:
+                f.write("{} {} {:.5f}\n".format(v, w, random.random()))
+            else:
+                f.write("{} {}\n".format(v, w))
+
+
+def timed(load, path):
+    start = time.perf_counter()
+    G = load(InStream(path))
+    return time.perf_counter() - start, G
+
+
+def main():
+    E = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    V = max(1, E // 8)
+    with tempfile.TemporaryDirectory() as tmp:
+        unweighted = os.path.join(tmp, "graph.txt")
+        weighted = os.path.join(tmp, "ewd.txt")
+        write_graph(unweighted, V, E, weighted=False)
+        write_graph(weighted, V, E, weighted=True)
+        cases = [
+            ("Graph", per_token_graph, Graph.from_stream, unweighted),
+            ("Digraph", per_token_digraph, Digraph.from_stream, unweighted),
+            (
+                "EdgeWeightedDigraph",
+                per_token_edge_weighted_digraph,
+                EdgeWeightedDigraph.from_stream,
+                weighted,
+            ),
+        ]
+        print("{} vertices, {} edges".format(V, E))
+        for name, old, new, path in cases:
+            old_time, old_graph = timed(old, path)
+            new_time, new_graph = timed(new, path)
+            assert repr(old_graph) == repr(new_graph)
+            print(
+                "{:20} per token {:7.3f}s   bulk {:7.3f}s   speedup {:5.1f}x".format(
+                    name, old_time, new_time, old_time / new_time
+                )
+            )
+        csr_time, _ = timed(CSRGraph.from_stream, unweighted)
+        print("{:20} bulk {:7.3f}s".format("CSRGraph", csr_time))
+
+
+if __name__ == "__main__":
+    main()
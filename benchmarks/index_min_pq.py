@@ -0,0 +1,55 @@
+"""Compares IndexMinPQ with DaryIndexMinPQ for several arities, with and
+without argument validation, on a decrease-key heavy workload like that of
+Dijkstra's and Prim's algorithms.
+
+Usage: python benchmarks/index_min_pq.py [number of indices]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.sorting.index_min_pq import DaryIndexMinPQ, IndexMinPQ
+
+
+def workload(pq, n):
+    # n inserts, 2n decrease-keys of random indices still on the heap, and n
+    # delete-the-minimums interleaved with them
+    random.seed(1)
+    for i in range(n):
+        pq.insert(i, random.random())
+    order = []
+    for _ in range(n):
+        for _ in range(2):
+            i = random.randrange(n)
+            if pq.contains(i):
+                pq.decrease_key(i, pq.key_of(i) * 0.9)
+        order.append(pq.del_min())
+    return order
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    heaps = [("IndexMinPQ", lambda: IndexMinPQ(n))]
+    for d in (2, 4, 8):
+        heaps.append(
+            ("DaryIndexMinPQ, d={}".format(d), lambda d=d: DaryIndexMinPQ(n, d))
+        )
+        heaps.append(
+            (
+                "DaryIndexMinPQ, d={}, fast".format(d),
+                lambda d=d: DaryIndexMinPQ(n, d, validate=False),
+            )
+        )
+    expected = None
+    for name, create in heaps:
+        start = time.perf_counter()
+        order = workload(create(), n)
+        print("{:30} {:8.2f}s".format(name, time.perf_counter() - start))
+        if expected is None:
+            expected = order
+        assert order == expected
+
+
+if __name__ == "__main__":
+    main()
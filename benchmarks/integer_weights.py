@@ -0,0 +1,60 @@
+"""Times DijkstraSP and PrimMST on a grid with small integer travel times,
+where they use a RadixHeap and a BucketQueue, and on the same grid with
+0.5 added to every weight, where they use a DaryIndexMinPQ.
+
+Usage: python -O benchmarks/integer_weights.py [grid side]
+
+Run with -O to skip the optimality check of PrimMST, which takes time
+proportional to E V.
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.prim_mst import PrimMST
+
+
+def grid_roads(side):
+    random.seed(0)
+    roads = []
+    for r in range(side):
+        for c in range(side):
+            v = r * side + c
+            if c + 1 < side:
+                roads.append((v, v + 1, random.randint(1, 100)))
+            if r + 1 < side:
+                roads.append((v, v + side, random.randint(1, 100)))
+    return roads
+
+
+def measure(name, build):
+    start = time.perf_counter()
+    result = build()
+    print("{:32} {:8.3f}s".format(name, time.perf_counter() - start))
+    return result
+
+
+def main():
+    side = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+    roads = grid_roads(side)
+    V = side * side
+    print("{} vertices, {} roads".format(V, len(roads)))
+    for label, offset in (("integer weights", 0), ("fractional weights", 0.5)):
+        G = EdgeWeightedDigraph(V)
+        H = EdgeWeightedGraph(V)
+        for v, w, time_ in roads:
+            G.add_edge(DirectedEdge(v, w, time_ + offset))
+            G.add_edge(DirectedEdge(w, v, time_ + offset))
+            H.add_edge(Edge(v, w, time_ + offset))
+        measure("DijkstraSP, " + label, lambda: DijkstraSP(G, 0))
+        measure("PrimMST, " + label, lambda: PrimMST(H))
+
+
+if __name__ == "__main__":
+    main()
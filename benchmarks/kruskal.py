@@ -0,0 +1,43 @@
+"""Compares KruskalMST with a priority queue, KruskalMST with presorted
+edges and FilterKruskalMST on random sparse and dense edge-weighted graphs.
+
+Usage: python benchmarks/kruskal.py [number of vertices]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.kruskal_mst import FilterKruskalMST, KruskalMST
+
+
+def random_graph(V, E):
+    random.seed(0)
+    G = EdgeWeightedGraph(V)
+    for _ in range(E):
+        G.add_edge(Edge(random.randrange(V), random.randrange(V), random.random()))
+    return G
+
+
+def main():
+    V = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for name, E in (("sparse", 4 * V), ("dense", V * V // 20)):
+        G = random_graph(V, E)
+        print("{}: {} vertices, {} edges".format(name, G.V(), G.E()))
+        weights = []
+        for label, build in (
+            ("KruskalMST", lambda: KruskalMST(G)),
+            ("KruskalMST, presort", lambda: KruskalMST(G, presort=True)),
+            ("FilterKruskalMST", lambda: FilterKruskalMST(G)),
+        ):
+            start = time.perf_counter()
+            mst = build()
+            print("  {:22} {:8.2f}s".format(label, time.perf_counter() - start))
+            weights.append(mst.weight())
+        assert max(weights) - min(weights) < 1e-9
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compares merge_sorted() with sorting the concatenation of the shards and
+with heapq.merge(), and top_k() with sorting the whole stream and with
+heapq.nlargest(), and reports the peak memory allocated by Python for each.
+
+Usage: python benchmarks/multiway.py [number of shards] [items per shard] [k]
+"""
+
+import heapq
+import itertools
+import random
+import sys
+import time
+import tracemalloc
+
+from itu.algs4.sorting.multiway import merge_sorted, top_k
+
+
+def measure(name, run):
+    # times the run, then repeats it to measure its memory, since tracing
+    # every allocation slows down Python code much more than C code
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:36} {:8.3f}s {:9.1f} MB".format(name, elapsed, peak / 2**20))
+    return result
+
+
+def shard(seed, size):
+    # a sorted shard generated lazily, as if read from a file
+    rng = random.Random(seed)
+    x = 0.0
+    for _ in range(size):
+        x += rng.random()
+        yield x
+
+
+def stream(n):
+    rng = random.Random(0)
+    return (rng.random() for _ in range(n))
+
+
+def main():
+    shards = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    n = shards * size
+    print("{} shards of {} items, k = {}".format(shards, size, k))
+
+    def inputs():
+        return [shard(i, size) for i in range(shards)]
+
+    a = measure("sorted(chain(shards))", lambda: sorted(itertools.chain(*inputs())))
+    b = measure("heapq.merge(shards)", lambda: list(heapq.merge(*inputs())))
+    c = measure("merge_sorted(shards)", lambda: list(merge_sorted(*inputs())))
+    assert a == b == c
+    count = measure(
+        "merge_sorted(shards), counted only",
+        lambda: sum(1 for _ in merge_sorted(*inputs())),
+    )
+    assert count == n
+
+    a = measure("sorted(stream)[-k:]", lambda: sorted(stream(n))[-k:][::-1])
+    b = measure("heapq.nlargest(k, stream)", lambda: heapq.nlargest(k, stream(n)))
+    c = measure("top_k(stream, k)", lambda: list(top_k(stream(n), k)))
+    assert a == b == c
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compares parallel_sort.sort() with list.sort() and merge_bu.sort() on
+ints, floats and strings, for a range of numbers of processes. The speedup
+depends on the number of cores of the machine.
+
+Usage: python benchmarks/parallel_sort.py [number of items] [max processes]
+"""
+
+import os
+import random
+import sys
+import time
+
+from itu.algs4.sorting import merge_bu, parallel_sort
+
+
+def measure(name, sort, data):
+    a = list(data)
+    start = time.perf_counter()
+    sort(a)
+    elapsed = time.perf_counter() - start
+    print("  {:28} {:8.3f}s".format(name, elapsed))
+    return a
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    rng = random.Random(0)
+    inputs = [
+        ("ints", [rng.randrange(1 << 62) for _ in range(n)], True),
+        ("floats", [rng.random() for _ in range(n)], True),
+        (
+            "strings",
+            ["{:x}".format(rng.randrange(1 << 62)) for _ in range(n // 10)],
+            False,
+        ),
+    ]
+    print("{} processor(s)".format(os.cpu_count()))
+    for name, data, numeric in inputs:
+        print("{} ({} items)".format(name, len(data)))
+        expected = measure("list.sort()", lambda a: a.sort(), data)
+        if not numeric:
+            assert measure("merge_bu.sort()", merge_bu.sort, data) == expected
+        processes = 1
+        while processes <= max(max_processes, 2):
+            result = measure(
+                "parallel_sort, {} processes".format(processes),
+                lambda a: parallel_sort.sort(a, processes),
+                data,
+            )
+            assert result == expected
+            processes *= 2
+
+
+if __name__ == "__main__":
+    main()
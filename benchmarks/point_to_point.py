@@ -0,0 +1,71 @@
+"""Compares the time per shortest path query between two random vertices of
+a road-network style grid: a full run of DijkstraSP, a run that stops at the
+target, and BidirectionalDijkstraSP.
+
+Usage: python benchmarks/point_to_point.py [grid side] [number of queries]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.graphs.bidirectional_dijkstra_sp import BidirectionalDijkstraSP
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+
+
+def grid_digraph(n):
+    # an n-by-n grid with roads in both directions and random travel times
+    random.seed(0)
+    G = EdgeWeightedDigraph(n * n)
+    for row in range(n):
+        for col in range(n):
+            v = row * n + col
+            neighbours = []
+            if col + 1 < n:
+                neighbours.append(v + 1)
+            if row + 1 < n:
+                neighbours.append(v + n)
+            for w in neighbours:
+                weight = random.uniform(1.0, 10.0)
+                G.add_edge(DirectedEdge(v, w, weight))
+                G.add_edge(DirectedEdge(w, v, weight))
+    return G
+
+
+def per_query(name, query, queries):
+    start = time.perf_counter()
+    dists = [query(s, t) for s, t in queries]
+    elapsed = time.perf_counter() - start
+    print("{:28} {:9.2f} ms per query".format(name, 1000 * elapsed / len(queries)))
+    return dists
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    G = grid_digraph(n)
+    random.seed(1)
+    queries = [(random.randrange(G.V()), random.randrange(G.V())) for _ in range(count)]
+    # nearby targets, as in most routing queries
+    nearby = [(s, min(G.V() - 1, s + 3 * n + 3)) for s, _ in queries]
+    bidirectional = BidirectionalDijkstraSP(G)
+    print("{} vertices, {} edges, {} queries".format(G.V(), G.E(), count))
+    for title, pairs in [("random pairs", queries), ("nearby pairs", nearby)]:
+        print(title)
+        full = per_query(
+            "DijkstraSP", lambda s, t: DijkstraSP(G, s, lazy=True).dist_to(t), pairs
+        )
+        early = per_query(
+            "DijkstraSP with target",
+            lambda s, t: DijkstraSP(G, s, lazy=True, target=t).dist_to(t),
+            pairs,
+        )
+        both = per_query("BidirectionalDijkstraSP", bidirectional.dist, pairs)
+        for a, b, c in zip(full, early, both):
+            assert abs(a - b) < 1e-9 and abs(a - c) < 1e-9
+
+
+if __name__ == "__main__":
+    main()
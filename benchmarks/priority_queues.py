@@ -0,0 +1,62 @@
+"""Compares building a MinPQ by repeated insert() with the heapify
+constructor, removing keys by repeated del_min() with pop_many(), and
+keeping the k largest keys with insert()/del_min() against pushpop().
+
+Usage: python benchmarks/priority_queues.py [number of keys] [k]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.sorting.min_pq import MinPQ
+
+
+def measure(name, run):
+    start = time.perf_counter()
+    result = run()
+    print("{:36} {:8.3f}s".format(name, time.perf_counter() - start))
+    return result
+
+
+def build_by_insert(keys):
+    pq = MinPQ()
+    for x in keys:
+        pq.insert(x)
+    return pq
+
+
+def top_k_by_insert(keys, k):
+    pq = MinPQ()
+    for x in keys:
+        pq.insert(x)
+        if pq.size() > k:
+            pq.del_min()
+    return sorted(pq.del_min() for _ in range(pq.size()))
+
+
+def top_k_by_pushpop(keys, k):
+    pq = MinPQ(keys=keys[:k])
+    for x in keys[k:]:
+        pq.pushpop(x)
+    return pq.pop_many(k)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    random.seed(0)
+    keys = [random.random() for _ in range(n)]
+    print("{} keys, k = {}".format(n, k))
+    a = measure("build with insert()", lambda: build_by_insert(keys))
+    b = measure("build with MinPQ(keys=...)", lambda: MinPQ(keys=keys))
+    x = measure("drain with del_min()", lambda: [a.del_min() for _ in range(n)])
+    y = measure("drain with pop_many()", lambda: b.pop_many(n))
+    assert x == y == sorted(keys)
+    x = measure("top k with insert() and del_min()", lambda: top_k_by_insert(keys, k))
+    y = measure("top k with pushpop()", lambda: top_k_by_pushpop(keys, k))
+    assert x == y == sorted(keys)[-k:]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compares the LSD radix sorts of lsd.sort_ints() and lsd.sort_bytes(),
+with and without NumPy, to sorted() and to NumPy's own sorts, on 8-byte
+keys, and reports the throughput in MB of keys per second.
+
+Usage: python benchmarks/radix_sort.py [number of keys]
+"""
+
+import random
+import sys
+import time
+from array import array
+
+from itu.algs4.strings import lsd
+
+
+def measure(name, run, n):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(
+        "  {:36} {:8.3f}s {:9.1f} MB/s".format(name, elapsed, 8 * n / elapsed / 2**20)
+    )
+    return result
+
+
+def main():
+    import numpy
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    small = min(n, 100000)  # the loop of the pure Python sort is slow
+    rng = random.Random(0)
+    values = [rng.randrange(-(2**63), 2**63) for _ in range(n)]
+    timestamps = [1500000000000 + rng.randrange(10**9) for _ in range(n)]
+    for name, data in [("random int64", values), ("timestamps", timestamps)]:
+        print("{} ({} keys)".format(name, n))
+        expected = measure("sorted()", lambda: sorted(data), n)
+        a = numpy.array(data, dtype=numpy.int64)
+        measure("numpy.sort()", lambda: numpy.sort(a), n)
+        measure(
+            "numpy.argsort(kind='stable')", lambda: numpy.argsort(a, kind="stable"), n
+        )
+        b = array("q", data)
+        measure("sort_ints(array)", lambda: lsd.sort_ints(b), n)
+        assert b.tolist() == expected
+        measure(
+            "sort_ints(array, argsort=True)", lambda: lsd.sort_ints(a, argsort=True), n
+        )
+        c = array("q", data[:small])
+        measure(
+            "sort_ints(array, vectorized=False)",
+            lambda: lsd.sort_ints(c, vectorized=False),
+            small,
+        )
+        assert c.tolist() == sorted(data[:small])
+
+    keys = [x.to_bytes(8, "big", signed=False) for x in timestamps]
+    print("8-byte big-endian bytes keys ({} keys)".format(n))
+    expected = measure("sorted()", lambda: sorted(keys), n)
+    a = list(keys)
+    measure("sort_bytes()", lambda: lsd.sort_bytes(a), n)
+    assert a == expected
+    a = keys[:small]
+    measure(
+        "sort_bytes(vectorized=False)",
+        lambda: lsd.sort_bytes(a, vectorized=False),
+        small,
+    )
+    assert a == sorted(keys[:small])
+
+
+if __name__ == "__main__":
+    main()
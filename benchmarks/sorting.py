@@ -0,0 +1,88 @@
+"""Measures the throughput of every sort in the sorting package, in
+thousands of items per second, on random, sorted, reversed and
+many-duplicates inputs. The quadratic sorts are run on at most 2000 items.
+With --checked, the sorts run in checked mode (see the validation module),
+which shows the cost of their invariant checks.
+
+Usage: python benchmarks/sorting.py [number of items] [--checked]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.sorting import (
+    heap,
+    insertion_sort,
+    merge,
+    merge_bu,
+    quick3way,
+    quicksort,
+    selection,
+    shellsort,
+    timsort,
+    validation,
+)
+
+QUADRATIC_LIMIT = 2000
+
+SORTS = [
+    ("insertion_sort", insertion_sort.sort, True),
+    ("selection", selection.sort, True),
+    ("shellsort", shellsort.sort, False),
+    ("merge", merge.sort, False),
+    ("merge_bu", merge_bu.sort, False),
+    ("quicksort", quicksort.sort, False),
+    ("quicksort intro", lambda a: quicksort.sort(a, introsort=True), False),
+    ("quick3way", quick3way.sort, False),
+    ("heap", heap.sort, False),
+    ("timsort", timsort.sort, False),
+    ("sorted()", lambda a: a.sort(), False),
+]
+
+
+def distributions(n):
+    rng = random.Random(0)
+    return [
+        ("random", [rng.random() for _ in range(n)]),
+        ("sorted", list(range(n))),
+        ("reversed", list(range(n, 0, -1))),
+        ("duplicates", [rng.randrange(10) for _ in range(n)]),
+    ]
+
+
+def throughput(sort, data):
+    # thousands of items per second, over the fastest of three runs
+    best = float("inf")
+    for _ in range(3):
+        a = list(data)
+        start = time.perf_counter()
+        sort(a)
+        best = min(best, time.perf_counter() - start)
+        assert a == sorted(data)
+    return len(data) / best / 1000
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--checked"]
+    n = int(args[0]) if args else 20000
+    validation.set_checked("--checked" in sys.argv)
+    inputs = distributions(n)
+    small = distributions(min(n, QUADRATIC_LIMIT))
+    print(
+        "{} items, checked mode {}; thousands of items per second".format(
+            n, "on" if validation.is_checked() else "off"
+        )
+    )
+    print("{:16}".format("") + "".join("{:>12}".format(name) for name, _ in inputs))
+    for name, sort, quadratic in SORTS:
+        row = "{:16}".format(name + ("*" if quadratic else ""))
+        for _, data in small if quadratic else inputs:
+            row += "{:12.1f}".format(throughput(sort, data))
+        print(row)
+    if n > QUADRATIC_LIMIT:
+        print("* on {} items".format(QUADRATIC_LIMIT))
+
+
+if __name__ == "__main__":
+    main()
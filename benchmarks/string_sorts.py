@@ -0,0 +1,63 @@
+"""Compares msd.sort() and quick3string.sort() with sorted() on URL-like
+keys, as str, as bytes and as memoryviews into one buffer.
+
+Usage: python benchmarks/string_sorts.py [number of keys]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.strings import msd, quick3string
+
+
+def measure(name, sort, data):
+    a = list(data)
+    start = time.perf_counter()
+    sort(a)
+    elapsed = time.perf_counter() - start
+    print("  {:28} {:8.3f}s".format(name, elapsed))
+    return a
+
+
+def urls(n):
+    rng = random.Random(0)
+    hosts = [
+        "https://www.{}.com/".format(rng.randrange(10**6)) for _ in range(n // 100 + 1)
+    ]
+    words = ["news", "article", "2018", "sports", "index.html", "img", "q?id="]
+    return [
+        rng.choice(hosts)
+        + "/".join(rng.choice(words) for _ in range(rng.randrange(1, 5)))
+        + str(rng.randrange(1000))
+        for _ in range(n)
+    ]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    keys = urls(n)
+    raw = [key.encode() for key in keys]
+    buffer = memoryview(b"".join(raw))
+    views = []
+    start = 0
+    for key in raw:
+        views.append(buffer[start : start + len(key)])
+        start += len(key)
+    for name, data in [("str", keys), ("bytes", raw), ("memoryview", views)]:
+        print("{} ({} keys)".format(name, n))
+        expected = sorted(raw)
+        if name != "memoryview":
+            measure("sorted()", lambda a: a.sort(), data)
+        for sort_name, sort in [
+            ("msd.sort()", msd.sort),
+            ("quick3string.sort()", quick3string.sort),
+        ]:
+            result = measure(sort_name, sort, data)
+            assert [
+                bytes(key, "utf-8") if name == "str" else bytes(key) for key in result
+            ] == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Builds a SuffixArray of a generated text of words, with and without
+NumPy, and compares counting the occurrences of patterns with it to
+bytes.count(), which rescans the text for every pattern.
+
+Usage: python benchmarks/suffix_array.py [length of the text in MB] [patterns]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.strings.suffix_array import SuffixArray
+
+
+def measure(name, run):
+    start = time.perf_counter()
+    result = run()
+    print("  {:36} {:8.3f}s".format(name, time.perf_counter() - start))
+    return result
+
+
+def main():
+    size = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    patterns = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(0)
+    words = [
+        "".join(
+            rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randrange(2, 9))
+        )
+        for _ in range(5000)
+    ]
+    chunks = []
+    length = 0
+    while length < size * 2**20:
+        chunk = " ".join(rng.choice(words) for _ in range(1000)).encode() + b" "
+        chunks.append(chunk)
+        length += len(chunk)
+    text = b"".join(chunks)
+    queries = [rng.choice(words).encode() for _ in range(patterns)]
+    print("{} bytes of text, {} patterns".format(len(text), patterns))
+
+    sa = measure("SuffixArray(text)", lambda: SuffixArray(text))
+    if size <= 1:
+        measure("SuffixArray(text, vectorized=False)", lambda: SuffixArray(text, False))
+    counts = measure(
+        "count(), with the suffix array", lambda: [sa.count(q) for q in queries]
+    )
+    # bytes.count() does not count overlapping occurrences, which words
+    # delimited by spaces do not have
+    expected = measure(
+        "bytes.count()", lambda: [text.count(b" " + q + b" ") for q in queries]
+    )
+    assert all(c >= e for c, e in zip(counts, expected))
+    measure("locate(), with the suffix array", lambda: [sa.locate(q) for q in queries])
+    lrs = measure("longest_repeated_substring()", sa.longest_repeated_substring)
+    print("  longest repeated substring: {} bytes".format(len(lrs)))
+
+
+if __name__ == "__main__":
+    main()
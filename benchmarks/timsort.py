@@ -0,0 +1,63 @@
+"""Compares timsort.sort() with the other sorts of the sorting package and
+with sorted() on random data and on mostly-sorted time series: sorted
+batches of timestamps with a few late arrivals, and appended sorted batches.
+
+Usage: python benchmarks/timsort.py [number of items]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.sorting import merge, quicksort, timsort
+
+
+def measure(name, sort, data):
+    a = list(data)
+    start = time.perf_counter()
+    sort(a)
+    elapsed = time.perf_counter() - start
+    print("  {:28} {:8.3f}s".format(name, elapsed))
+    return a
+
+
+def late_arrivals(n, rng):
+    # increasing timestamps, of which 1% arrive up to 100 places late
+    a = list(range(n))
+    for _ in range(n // 100):
+        i = rng.randrange(n)
+        a.insert(min(n - 1, i + rng.randrange(100)), a.pop(i))
+    return a
+
+
+def batches(n, rng):
+    # sorted batches of 1000 overlapping timestamps
+    a = []
+    for b in range(0, n, 1000):
+        a.extend(sorted(b + rng.randrange(2000) for _ in range(min(1000, n - b))))
+    return a
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = random.Random(0)
+    inputs = [
+        ("random", [rng.random() for _ in range(n)]),
+        ("late arrivals", late_arrivals(n, rng)),
+        ("sorted batches", batches(n, rng)),
+        ("descending", list(range(n, 0, -1))),
+    ]
+    for name, data in inputs:
+        print("{} ({} items)".format(name, n))
+        expected = measure("sorted()", lambda a: a.sort(), data)
+        for sort_name, sort in [
+            ("merge.sort()", merge.sort),
+            ("quicksort.sort()", quicksort.sort),
+            ("timsort.sort()", timsort.sort),
+            ("timsort.sort(key=)", lambda a: timsort.sort(a, key=float)),
+        ]:
+            assert measure(sort_name, sort, data) == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Compares TransitiveClosure, which ORs bitsets over the strong component
+DAG, with running DirectedDFS from every vertex, on a random dependency
+graph: a DAG with a few cycles added.
+
+Usage: python benchmarks/transitive_closure.py [number of vertices]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_dfs import DirectedDFS
+from itu.algs4.graphs.transitive_closure import TransitiveClosure
+
+
+def dependency_digraph(V, E, cycles):
+    random.seed(0)
+    G = Digraph(V)
+    for _ in range(E):
+        v, w = random.randrange(V), random.randrange(V)
+        G.add_edge(max(v, w), min(v, w))
+    for _ in range(cycles):
+        v, w = random.randrange(V), random.randrange(V)
+        G.add_edge(min(v, w), max(v, w))
+    return G
+
+
+def main():
+    V = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    G = dependency_digraph(V, 10 * V, 5)
+    print("{} vertices, {} edges".format(G.V(), G.E()))
+
+    start = time.perf_counter()
+    dfs = [DirectedDFS(G, v) for v in range(G.V())]
+    print("DirectedDFS per vertex {:8.2f}s".format(time.perf_counter() - start))
+
+    start = time.perf_counter()
+    tc = TransitiveClosure(G)
+    print("TransitiveClosure      {:8.2f}s".format(time.perf_counter() - start))
+
+    for v in range(0, G.V(), max(1, G.V() // 50)):
+        for w in range(G.V()):
+            assert tc.reachable(v, w) == dfs[v].is_marked(w)
+
+
+if __name__ == "__main__":
+    main()
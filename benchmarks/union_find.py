@@ -0,0 +1,61 @@
+"""Compares the union-find implementations in fundamentals/uf.py on random
+unions followed by random finds.
+
+Usage: python benchmarks/union_find.py [number of sites] [number of pairs]
+"""
+
+import random
+import sys
+import time
+
+from itu.algs4.fundamentals.uf import UF, ArrayUF, WeightedQuickUnionUF
+
+
+def timed(name, run):
+    start = time.perf_counter()
+    result = run()
+    print("{:36} {:7.3f}s".format(name, time.perf_counter() - start))
+    return result
+
+
+def one_at_a_time(uf, pairs, sites):
+    for p, q in pairs:
+        uf.union(p, q)
+    return [uf.find(p) for p in sites]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 400000
+    random.seed(0)
+    pairs = [(random.randrange(n), random.randrange(n)) for _ in range(m)]
+    sites = [random.randrange(n) for _ in range(m)]
+    print("{} sites, {} unions, {} finds".format(n, m, m))
+
+    timed(
+        "WeightedQuickUnionUF",
+        lambda: one_at_a_time(WeightedQuickUnionUF(n), pairs, sites),
+    )
+    timed("UF", lambda: one_at_a_time(UF(n), pairs, sites))
+    timed("ArrayUF", lambda: one_at_a_time(ArrayUF(n), pairs, sites))
+
+    def batch():
+        uf = ArrayUF(n)
+        uf.union_many(pairs)
+        return uf.find_many(sites)
+
+    timed("ArrayUF union_many/find_many", batch)
+    try:
+
+        def vectorized():
+            uf = ArrayUF(n, vectorized=True)
+            uf.union_many(pairs)
+            return uf.find_many(sites)
+
+        timed("ArrayUF union_many/find_many, NumPy", vectorized)
+    except ImportError:
+        print("NumPy is not installed")
+
+
+if __name__ == "__main__":
+    main()
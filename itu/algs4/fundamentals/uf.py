@@ -16,9 +16,10 @@ through n-1. The is-connected-to relation must be an equivalence relation:
                        p is connected to r.
 
 """
-import sys
 
-from itu.algs4.stdlib import stdio
+import sys
+from array import array
+from itertools import chain
 
 
 class UF:
@@ -260,6 +261,15 @@ class WeightedQuickUnionUF:
     def count(self) -> int:
         return self._count
 
+    def size(self, p: int) -> int:
+        """Returns the number of sites in the component containing site p.
+
+        :param p: the integer representing one site
+        :return: the number of sites in the component containing site p
+
+        """
+        return self._size[self.find(p)]
+
 
 class QuickFindUF:
     """
@@ -339,6 +349,386 @@ class QuickFindUF:
         return self._count
 
 
+class ArrayUF:
+    """
+    This is an implementation of the union-find data structure - see module documentation for
+    more info.
+
+    This implementation uses union by rank with full path compression, and stores the parent
+    links in an array('l') and the ranks in an array('b') instead of Python lists. The batch
+    operations union_many and find_many validate all sites of a batch at once and then run
+    without per-call validation or method calls; batches with at least n/4 sites work on list
+    copies of the arrays, since indexing a list is faster than indexing an array.
+
+    With vectorized=True, NumPy (which must be installed) is used to look up many sites at once
+    in find_many and snapshot, by repeatedly replacing each link by the link of its parent.
+    The NumPy array shares its memory with the array('l'). Unions are always done one at a
+    time, since each one depends on the previous ones.
+
+    The snapshot operation returns the component identifier of every site, and restore turns
+    such a snapshot back into the components it describes.
+
+    Initializing a data structure with n sites takes linear time. Afterwards, the amortized
+    time per union, find, and connected operation has inverse Ackermann complexity, and the
+    count operation takes constant time.
+    """
+
+    def __init__(self, n: int, vectorized: bool = False) -> None:
+        """Initializes an empty union-find data structure with n sites, 0
+        through n-1. Each site is initially in its own component.
+
+        :param n: the number of sites
+        :param vectorized: if True, use NumPy in find_many and snapshot
+
+        """
+        self._count = n
+        self._parent = array("l", range(n))
+        self._rank = array("b", bytes(n))
+        self._np = None
+        if vectorized:
+            import numpy
+
+            self._np = numpy
+            self._np_parent = numpy.frombuffer(
+                self._parent, dtype="i{}".format(self._parent.itemsize)
+            )
+
+    def _validate(self, p: int) -> None:
+        # validate that p is a valid index
+        n = len(self._parent)
+        if p < 0 or p >= n:
+            raise ValueError("index {} is not between 0 and {}".format(p, n - 1))
+
+    def _validate_all(self, sites) -> None:
+        # validate a whole batch of sites at once
+        if len(sites) > 0:
+            lo = min(sites)
+            hi = max(sites)
+            self._validate(lo)
+            self._validate(hi)
+
+    def union(self, p: int, q: int) -> None:
+        """Merges the component containing site p with the component containing
+        site q.
+
+        :param p: the integer representing one site
+        :param q: the integer representing the other site
+
+        """
+        root_p = self.find(p)
+        root_q = self.find(q)
+        if root_p == root_q:
+            return
+        link_roots(self._parent, self._rank, root_p, root_q)
+        self._count -= 1
+
+    def find(self, p: int) -> int:
+        """Returns the component identifier for the component containing site
+        p.
+
+        :param p: the integer representing one site
+        :return: the component identifier for the component containing site p
+
+        """
+        self._validate(p)
+        return find_root(self._parent, p)
+
+    def connected(self, p: int, q: int) -> bool:
+        """Returns true if the two sites are in the same component.
+
+        :param p: the integer representing one site
+        :param q: the integer representing the other site
+        :return: true if the two sites p and q are in the same component; false otherwise
+
+        """
+        return self.find(p) == self.find(q)
+
+    def count(self) -> int:
+        return self._count
+
+    def union_many(self, pairs) -> int:
+        """Merges the components of p and q for every pair (p, q), in order.
+
+        :param pairs: an iterable of pairs of sites
+        :return: the number of pairs whose sites were in different components
+        :raises ValueError: if any site is not between 0 and n-1; then no
+                            pair is merged
+
+        """
+        pairs = list(pairs)
+        self._validate_all(list(chain.from_iterable(pairs)))
+        if self._large_batch(len(pairs)):
+            parent = self._parent.tolist()
+            rank = self._rank.tolist()
+            merged = _union_pairs(parent, rank, pairs)
+            self._parent[:] = array("l", parent)
+            self._rank[:] = array("b", rank)
+        else:
+            merged = _union_pairs(self._parent, self._rank, pairs)
+        self._count -= merged
+        return merged
+
+    def find_many(self, sites):
+        """Returns the component identifiers of many sites.
+
+        :param sites: an iterable of sites
+        :return: the component identifier of each site, as an array('l'), or
+                 as a NumPy array in vectorized mode
+        :raises ValueError: if any site is not between 0 and n-1
+
+        """
+        if self._np is not None:
+            return self._find_many_vectorized(sites)
+        sites = list(sites)
+        self._validate_all(sites)
+        if self._large_batch(len(sites)):
+            parent = self._parent.tolist()
+            roots = _find_sites(parent, sites)
+            self._parent[:] = array("l", parent)
+        else:
+            roots = _find_sites(self._parent, sites)
+        return array("l", roots)
+
+    def _large_batch(self, size: int) -> bool:
+        # indexing a list is faster than indexing an array, so large batches
+        # run on list copies of the arrays, which are copied back afterwards
+        return 4 * size >= len(self._parent)
+
+    def _find_many_vectorized(self, sites):
+        # follows the links of all sites in lockstep until they reach a root
+        parent = self._np_parent
+        sites = self._np.asarray(sites, dtype=parent.dtype)
+        if len(sites) > 0:
+            self._validate(int(sites.min()))
+            self._validate(int(sites.max()))
+        roots = parent[sites]
+        while True:
+            up = parent[roots]
+            if (up == roots).all():
+                break
+            roots = up
+        parent[sites] = roots
+        return roots
+
+    def snapshot(self) -> array:
+        """Returns the component identifier of every site. All parent links
+        are compressed to point directly at their root in the process.
+
+        :return: an array('l') with the component identifier of site i at
+                 index i
+
+        """
+        parent = self._parent
+        if self._np is not None:
+            np_parent = self._np_parent
+            while True:
+                up = np_parent[np_parent]
+                if (up == np_parent).all():
+                    break
+                np_parent[:] = up
+        else:
+            for p in range(len(parent)):
+                root = parent[p]
+                while root != parent[root]:
+                    root = parent[root]
+                parent[p] = root
+        return array("l", parent)
+
+    def restore(self, labels) -> None:
+        """Replaces the components by those of a snapshot: sites with the
+        same component identifier are in the same component.
+
+        :param labels: the component identifier of each site, as returned by
+                       snapshot()
+        :raises ValueError: if the number of labels is not n, or if the label
+                            of a site is a site with a different label
+
+        """
+        labels = array("l", labels)
+        n = len(self._parent)
+        if len(labels) != n:
+            raise ValueError("expected {} labels, got {}".format(n, len(labels)))
+        self._validate_all(labels)
+        count = 0
+        for p, root in enumerate(labels):
+            if labels[root] != root:
+                raise ValueError("label {} of site {} is not a root".format(root, p))
+            if p == root:
+                count += 1
+        rank = array("b", bytes(n))
+        for p, root in enumerate(labels):
+            if p != root:
+                rank[root] = 1
+        self._parent[:] = labels
+        self._rank = rank
+        self._count = count
+
+
+class RollbackUF:
+    """
+    This is an implementation of the union-find data structure - see module documentation for
+    more info.
+
+    This implementation uses weighted quick union by size without path compression, so that
+    every union changes only two entries and can be undone. The checkpoint operation marks
+    the current components, and the rollback operation undoes all unions since the most
+    recent checkpoint that has not been rolled back yet; checkpoints can be nested.
+
+    Initializing a data structure with n sites takes linear time. Afterwards, the union, find,
+    and connected operations take logarithmic time (in the worst case), the count and
+    checkpoint operations take constant time, and rollback takes time proportional to the
+    number of unions it undoes.
+    """
+
+    def __init__(self, n: int) -> None:
+        """Initializes an empty union-find data structure with n sites, 0
+        through n-1. Each site is initially in its own component.
+
+        :param n: the number of sites
+
+        """
+        self._count = n
+        self._parent = list(range(n))
+        self._size = [1] * n
+        self._history = []  # the roots that were linked below another root
+        self._checkpoints = []  # the length of the history at each checkpoint
+
+    def _validate(self, p: int) -> None:
+        # validate that p is a valid index
+        n = len(self._parent)
+        if p < 0 or p >= n:
+            raise ValueError("index {} is not between 0 and {}".format(p, n - 1))
+
+    def union(self, p: int, q: int) -> None:
+        """Merges the component containing site p with the component containing
+        site q.
+
+        :param p: the integer representing one site
+        :param q: the integer representing the other site
+
+        """
+        root_p = self.find(p)
+        root_q = self.find(q)
+        if root_p == root_q:
+            return
+
+        # make root of smaller size point to root of larger size
+        if self._size[root_p] < self._size[root_q]:
+            small, large = root_p, root_q
+        else:
+            small, large = root_q, root_p
+
+        self._parent[small] = large
+        self._size[large] += self._size[small]
+        self._history.append(small)
+        self._count -= 1
+
+    def find(self, p: int) -> int:
+        """Returns the component identifier for the component containing site
+        p.
+
+        :param p: the integer representing one site
+        :return: the component identifier for the component containing site p
+
+        """
+        self._validate(p)
+        while p != self._parent[p]:
+            p = self._parent[p]
+        return p
+
+    def connected(self, p: int, q: int) -> bool:
+        """Returns true if the two sites are in the same component.
+
+        :param p: the integer representing one site
+        :param q: the integer representing the other site
+        :return: true if the two sites p and q are in the same component; false otherwise
+
+        """
+        return self.find(p) == self.find(q)
+
+    def count(self) -> int:
+        return self._count
+
+    def checkpoint(self) -> None:
+        """Marks the current components, so that rollback() can return to
+        them."""
+        self._checkpoints.append(len(self._history))
+
+    def rollback(self) -> None:
+        """Undoes all unions since the most recent checkpoint, and removes that
+        checkpoint.
+
+        :raises ValueError: if there is no checkpoint
+
+        """
+        if not self._checkpoints:
+            raise ValueError("no checkpoint to roll back to")
+        mark = self._checkpoints.pop()
+        while len(self._history) > mark:
+            small = self._history.pop()
+            large = self._parent[small]
+            self._size[large] -= self._size[small]
+            self._parent[small] = small
+            self._count += 1
+
+
+def find_root(parent, p: int) -> int:
+    """Returns the root of site p in a union-find forest, and compresses the
+    path from p so that every site on it links directly to the root. The
+    union-find of ArrayUF, and the ones of Kruskal's and Borůvka's algorithms,
+    are made of this function and link_roots() on plain parent and rank
+    sequences, without validation.
+
+    :param parent: the parent links of the sites (a list or array)
+    :param p: the site
+    :return: the root of the tree that contains p
+
+    """
+    root = p
+    while root != parent[root]:
+        root = parent[root]
+    while p != root:  # full path compression
+        parent[p], p = root, parent[p]
+    return root
+
+
+def link_roots(parent, rank, root_p: int, root_q: int) -> None:
+    """Merges the trees of two different roots in a union-find forest, by
+    making the root of smaller rank point to the root of larger rank.
+
+    :param parent: the parent links of the sites (a list or array)
+    :param rank: the ranks of the roots (a list or array)
+    :param root_p: the root of one tree
+    :param root_q: the root of the other tree
+
+    """
+    if rank[root_p] < rank[root_q]:
+        parent[root_p] = root_q
+    elif rank[root_p] > rank[root_q]:
+        parent[root_q] = root_p
+    else:
+        parent[root_q] = root_p
+        rank[root_p] += 1
+
+
+def _union_pairs(parent, rank, pairs) -> int:
+    # union by rank with full path compression of every pair, on the given
+    # parent and rank sequences; returns the number of merges
+    merged = 0
+    for p, q in pairs:
+        root_p = find_root(parent, p)
+        root_q = find_root(parent, q)
+        if root_p != root_q:
+            link_roots(parent, rank, root_p, root_q)
+            merged += 1
+    return merged
+
+
+def _find_sites(parent, sites):
+    # the roots of the given sites, with full path compression
+    return [find_root(parent, p) for p in sites]
+
+
 # Reads in a an integer n and a sequence of pairs of integers
 # (between 0 and n-1) from standard input or a file
 # supplied as argument to the program, where each integer
@@ -350,6 +740,8 @@ if __name__ == "__main__":
             sys.stdin = open(sys.argv[1])
         except IOError:
             print("File not found, using standard input instead")
+    from itu.algs4.stdlib import stdio
+
     n = stdio.readInt()
     uf = UF(n)
     while not stdio.isEmpty():
@@ -0,0 +1,325 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements A* search for shortest paths between two vertices
+of an edge-weighted digraph, together with two heuristics: the Euclidean
+distance between vertex coordinates, and landmark (ALT) lower bounds
+computed from the distances to and from a few chosen vertices."""
+
+import math
+import sys
+from array import array
+from heapq import heappop, heappush
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.stdlib.instream import InStream
+
+
+class AStarSP:
+    """The AStarSP class represents a data type for finding a shortest path
+    from a source vertex s to a target vertex t in an edge-weighted digraph
+    where the edge weights are nonnegative.
+
+    This implementation uses the A* algorithm: Dijkstra's algorithm where
+    the vertices on the heap are ordered by their distance from s plus a
+    heuristic estimate heuristic(v, t) of their distance to t. The search
+    stops as soon as t is removed from the heap. The better the estimate,
+    the fewer vertices are settled before reaching t; with the estimate 0,
+    it settles the same vertices as DijkstraSP with a target.
+
+    The heuristic must never overestimate the distance from v to t
+    (it must be admissible), otherwise the path found may not be a
+    shortest one. It may return float('inf') if t cannot be reached from v.
+    The heap is a heapq binary heap with lazy deletion (see DijkstraSP).
+
+    Afterwards, dist_to() and has_path_to() take constant time and path_to()
+    takes time proportional to the number of edges in the path returned.
+    They are exact for the target t; for other vertices, dist_to() is only
+    an upper bound and has_path_to() may return False even if there is a
+    path.
+
+    """
+
+    def __init__(self, G, s, t, heuristic):
+        """Computes a shortest path from the source vertex s to the target
+        vertex t in the edge-weighted digraph G.
+
+        :param G: the edge-weighted digraph
+        :param s: the source vertex
+        :param t: the target vertex
+        :param heuristic: a function that takes vertices v and t and returns
+                          a lower bound on the distance from v to t
+        :raises IllegalArgumentException: if an edge weight that is examined
+                                          is negative
+        :raises IllegalArgumentException: unless 0 <= s < V and 0 <= t < V
+
+        """
+        self._dist_to = [float("inf")] * G.V()
+        self._edge_to = [None] * G.V()
+        self._validate_vertex(s)
+        self._validate_vertex(t)
+        self._settled = 0
+        self._astar(G, s, t, heuristic)
+
+    def _astar(self, G, s, t, heuristic):
+        """Runs the A* search from s to t.
+
+        :param G: the edge-weighted digraph
+        :param s: the source vertex
+        :param t: the target vertex
+        :param heuristic: the estimate of the distance to t
+
+        """
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        estimate = {}  # the heuristic of every vertex seen so far
+        dist_to[s] = 0.0
+        pq = [(heuristic(s, t), 0.0, s)]
+        while pq:
+            _, d, v = heappop(pq)
+            if d > dist_to[v]:
+                continue  # v was already removed with a smaller distance
+            self._settled += 1
+            if v == t:
+                break
+            for e in G.adj(v):
+                w = e.to_vertex()
+                weight = e.weight()
+                if weight < 0:
+                    raise IllegalArgumentException(
+                        "edge {} has negative weight".format(e)
+                    )
+                dist = d + weight
+                if dist < dist_to[w]:
+                    dist_to[w] = dist
+                    edge_to[w] = e
+                    if w not in estimate:
+                        estimate[w] = heuristic(w, t)
+                    heappush(pq, (dist + estimate[w], dist, w))
+
+    def settled(self):
+        """Returns the number of vertices removed from the heap, including
+        vertices removed more than once if the heuristic is not consistent.
+
+        :return: the number of vertices settled by the search
+        :rtype: int
+
+        """
+        return self._settled
+
+    def dist_to(self, v):
+        """Returns the length of a shortest path from the source vertex s to
+        vertex v.
+
+        :param v: the destination vertex
+        :return: the length of a shortest path from the source vertex s to vertex v
+        :rtype: float
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._dist_to[v]
+
+    def has_path_to(self, v):
+        """Returns True if there is a path from the source vertex s to vertex
+        v.
+
+        :param v: the destination vertex
+        :return: True if there is a path from the source vertex s to vertex v.
+                 Otherwise returns False
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._dist_to[v] < float("inf")
+
+    def path_to(self, v):
+        """Returns a shortest path from the source vertex s to vertex v.
+
+        :param v: the destination vertex
+        :return: a shortest path from the source vertex s to vertex v
+        :rtype: collections.iterable[DirectedEdge]
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        if not self.has_path_to(v):
+            return None
+        path = Stack()
+        e = self._edge_to[v]
+        while e is not None:
+            path.push(e)
+            e = self._edge_to[e.from_vertex()]
+        return path
+
+    def _validate_vertex(self, v):
+        """Raises an IllegalArgumentException unless 0 <= v < V.
+
+        :param v: the vertex to be validated
+
+        """
+        V = len(self._dist_to)
+        if v < 0 or v >= V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, V - 1)
+            )
+
+
+def euclidean_heuristic(coordinates):
+    """Returns the heuristic that estimates the distance from v to t as the
+    straight-line distance between their coordinates. It never overestimates
+    if no edge is shorter than the distance between its endpoints.
+
+    :param coordinates: the (x, y) coordinates of each vertex
+    :return: a heuristic for AStarSP
+    :rtype: function
+
+    """
+
+    def heuristic(v, t):
+        x1, y1 = coordinates[v]
+        x2, y2 = coordinates[t]
+        return math.hypot(x1 - x2, y1 - y2)
+
+    return heuristic
+
+
+class LandmarkHeuristic:
+    """The LandmarkHeuristic class represents the ALT heuristic for AStarSP,
+    which estimates distances using the triangle inequality on the known
+    distances to and from a few landmark vertices.
+
+    For a landmark L, the distance from v to t is at least
+    dist(L, t) - dist(L, v) and at least dist(v, L) - dist(t, L); the
+    heuristic is the largest of these bounds over all landmarks. Landmarks
+    at the edge of the digraph, behind the vertices as seen from the target,
+    give the best bounds.
+
+    The constructor runs DijkstraSP from every landmark in the digraph and
+    in its reverse, and stores the distances in arrays of floats, so it
+    takes time proportional to k E log V and uses space proportional to kV,
+    where k is the number of landmarks. Each estimate takes time
+    proportional to k.
+
+    """
+
+    def __init__(self, G, landmarks):
+        """Computes the distances to and from the landmarks in the
+        edge-weighted digraph G.
+
+        :param G: the edge-weighted digraph
+        :param landmarks: the landmark vertices
+        :raises IllegalArgumentException: if an edge weight is negative
+        :raises IllegalArgumentException: unless 0 <= L < V for every landmark L
+
+        """
+        R = G.reverse()
+        self._landmarks = list(landmarks)
+        self._dist = []  # (dist(L, v) for every v, dist(v, L) for every v)
+        for L in self._landmarks:
+            from_landmark = DijkstraSP(G, L, lazy=True)
+            to_landmark = DijkstraSP(R, L, lazy=True)
+            self._dist.append(
+                (
+                    array("d", (from_landmark.dist_to(v) for v in range(G.V()))),
+                    array("d", (to_landmark.dist_to(v) for v in range(G.V()))),
+                )
+            )
+
+    @staticmethod
+    def choose_landmarks(G, k, start=0):
+        """Chooses k landmarks that are far apart: the first one is the
+        vertex farthest from start, and every next one is the vertex whose
+        distance from the landmarks chosen so far is the largest.
+
+        :param G: the edge-weighted digraph
+        :param k: the number of landmarks
+        :param start: the vertex from which to start
+        :return: the landmarks
+        :rtype: list
+        :raises IllegalArgumentException: if an edge weight is negative
+
+        """
+        inf = float("inf")
+        sp = DijkstraSP(G, start, lazy=True)
+        nearest = [sp.dist_to(v) for v in range(G.V())]  # distance to compare
+        landmarks = []
+        while len(landmarks) < k:
+            farthest = max(
+                (v for v in range(G.V()) if nearest[v] < inf and v not in landmarks),
+                key=lambda v: nearest[v],
+                default=None,
+            )
+            if farthest is None:
+                break
+            landmarks.append(farthest)
+            if len(landmarks) == k:
+                break
+            sp = DijkstraSP(G, farthest, lazy=True)
+            if len(landmarks) == 1:
+                # from now on, the distance from the nearest landmark
+                nearest = [sp.dist_to(v) for v in range(G.V())]
+            else:
+                for v in range(G.V()):
+                    nearest[v] = min(nearest[v], sp.dist_to(v))
+        return landmarks
+
+    def landmarks(self):
+        """Returns the landmark vertices.
+
+        :return: the landmark vertices
+        :rtype: list
+
+        """
+        return list(self._landmarks)
+
+    def __call__(self, v, t):
+        """Returns a lower bound on the distance from v to t.
+
+        :param v: the vertex
+        :param t: the target vertex
+        :return: a lower bound on the distance from v to t; float('inf') if
+                 the landmarks show that t cannot be reached from v
+        :rtype: float
+
+        """
+        h = 0.0
+        for from_landmark, to_landmark in self._dist:
+            # comparisons with NaN (inf - inf) are False, so those are skipped
+            bound = from_landmark[t] - from_landmark[v]
+            if bound > h:
+                h = bound
+            bound = to_landmark[v] - to_landmark[t]
+            if bound > h:
+                h = bound
+        return h
+
+
+def main():
+    """Creates an EdgeWeightedDigraph from the input file and prints a
+    shortest path from the given source vertex to the given target vertex,
+    found with A* and four landmarks."""
+    if len(sys.argv) == 4:
+        stream = InStream(sys.argv[1])
+        G = EdgeWeightedDigraph.from_stream(stream)
+        s = int(sys.argv[2])
+        t = int(sys.argv[3])
+        heuristic = LandmarkHeuristic(G, LandmarkHeuristic.choose_landmarks(G, 4))
+        sp = AStarSP(G, s, t, heuristic)
+        if sp.has_path_to(t):
+            print("{} to {} ({:.2f})  ".format(s, t, sp.dist_to(t)), end="")
+            for e in sp.path_to(t):
+                print(e, end="   ")
+            print()
+        else:
+            print("{} to {}         no path".format(s, t))
+        print("{} vertices settled".format(sp.settled()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a data type for answering shortest path queries
+between two vertices of an edge-weighted digraph with bidirectional
+Dijkstra's algorithm."""
+
+import sys
+from heapq import heappop, heappush
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.stdlib.instream import InStream
+
+
+class BidirectionalDijkstraSP:
+    """The BidirectionalDijkstraSP class represents a data type for solving
+    the point-to-point shortest path problem in edge-weighted digraphs where
+    the edge weights are nonnegative.
+
+    Each query from a source vertex s to a target vertex t runs two searches
+    of Dijkstra's algorithm at the same time: one from s in the digraph and
+    one from t in its reverse. The search with the smaller distance on its
+    heap takes the next step. Whenever an edge connects the two searches,
+    the length of the path through it is recorded, and the query stops as
+    soon as the sum of the smallest distances on the two heaps is at least
+    as large as the shortest such path. Both searches only look at the
+    vertices roughly half as far from their origin as s is from t, so a
+    query typically visits a small fraction of a large digraph.
+
+    The heaps are heapq binary heaps with lazy deletion (see DijkstraSP),
+    and the distances of each query are kept in dictionaries, so the time of
+    a query does not depend on the size of the parts of the digraph it does
+    not visit. The constructor takes time proportional to V + E. The
+    methods dist(), has_path() and path() run a query, unless it is the
+    same as the previous query.
+
+    """
+
+    def __init__(self, G, reverse=None):
+        """Prepares the edge-weighted digraph G for shortest path queries.
+
+        :param G: the edge-weighted digraph
+        :param reverse: the reverse of G, if it is already known
+        :raises IllegalArgumentException: if an edge weight is negative
+
+        """
+        for v in range(G.V()):
+            for e in G.adj(v):
+                if e.weight() < 0:
+                    raise IllegalArgumentException(
+                        "edge {} has negative weight".format(e)
+                    )
+        self._G = G
+        self._R = G.reverse() if reverse is None else reverse
+        self._query = None  # the last (source, target) pair
+        self._dist = float("inf")  # the length of its shortest path
+        self._path = None  # its shortest path
+
+    def dist(self, source, target):
+        """Returns the length of a shortest path from the source vertex to the
+        target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: the length of a shortest path from the source vertex to the
+                  target vertex; float('inf') if no such path
+        :raises IllegalArgumentException: unless 0 <= source, target < V
+
+        """
+        self._search(source, target)
+        return self._dist
+
+    def has_path(self, source, target):
+        """Is there a path from the source vertex to the target vertex?
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: True if there is a path from the source to the target, and
+                  False otherwise
+        :raises IllegalArgumentException: unless 0 <= source, target < V
+
+        """
+        return self.dist(source, target) < float("inf")
+
+    def path(self, source, target):
+        """Returns a shortest path from the source vertex to the target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: a shortest path from the source vertex to the target vertex
+                  as an iterable of edges, and None if no such path
+        :rtype: collections.iterable[DirectedEdge]
+        :raises IllegalArgumentException: unless 0 <= source, target < V
+
+        """
+        self._search(source, target)
+        return self._path
+
+    def _search(self, s, t):
+        """Computes a shortest path from s to t, unless it is already known.
+
+        :param s: the source vertex
+        :param t: the target vertex
+
+        """
+        if self._query == (s, t):
+            return
+        self._validate_vertex(s)
+        self._validate_vertex(t)
+        inf = float("inf")
+        forward = ({s: 0.0}, {s: None}, [(0.0, s)], self._G)
+        backward = ({t: 0.0}, {t: None}, [(0.0, t)], self._R)
+        best = 0.0 if s == t else inf  # the shortest path found so far
+        middle = s  # the vertex at which that path leaves the forward search
+        pq_f = forward[2]
+        pq_b = backward[2]
+        while pq_f and pq_b and pq_f[0][0] + pq_b[0][0] < best:
+            if pq_f[0][0] <= pq_b[0][0]:
+                side, other = forward, backward
+            else:
+                side, other = backward, forward
+            dist_to, edge_to, pq, G = side
+            other_dist_to = other[0]
+            d, v = heappop(pq)
+            if d > dist_to[v]:
+                continue  # v was already removed with a smaller distance
+            for e in G.adj(v):
+                w = e.to_vertex()
+                dist = d + e.weight()
+                if dist < dist_to.get(w, inf):
+                    dist_to[w] = dist
+                    edge_to[w] = e
+                    heappush(pq, (dist, w))
+                    if w in other_dist_to and dist + other_dist_to[w] < best:
+                        best = dist + other_dist_to[w]
+                        middle = w
+
+        self._query = (s, t)
+        self._dist = best
+        self._path = None
+        if best < inf:
+            self._path = self._build_path(middle, forward[1], backward[1])
+
+    def _build_path(self, middle, edge_to_f, edge_to_b):
+        """Joins the paths s->middle of the forward search and middle->t of
+        the backward search.
+
+        :param middle: the vertex where the paths meet
+        :param edge_to_f: the last edge on the path from s to each vertex
+        :param edge_to_b: the last edge of the reverse on the path from t to
+                          each vertex
+        :returns: the path from s to t
+        :rtype: Stack
+
+        """
+        # the edges of the reverse are turned around into edges of G
+        back = []
+        e = edge_to_b[middle]
+        while e is not None:
+            back.append(DirectedEdge(e.to_vertex(), e.from_vertex(), e.weight()))
+            e = edge_to_b[e.from_vertex()]
+        path = Stack()
+        for e in reversed(back):
+            path.push(e)
+        e = edge_to_f[middle]
+        while e is not None:
+            path.push(e)
+            e = edge_to_f[e.from_vertex()]
+        return path
+
+    def _validate_vertex(self, v):
+        """Raises an IllegalArgumentException unless 0 <= v < V.
+
+        :param v: the vertex to be validated
+
+        """
+        V = self._G.V()
+        if v < 0 or v >= V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, V - 1)
+            )
+
+
+def main():
+    """Creates an EdgeWeightedDigraph from the input file and prints a
+    shortest path from the given source vertex to the given target vertex."""
+    if len(sys.argv) == 4:
+        stream = InStream(sys.argv[1])
+        G = EdgeWeightedDigraph.from_stream(stream)
+        s = int(sys.argv[2])
+        t = int(sys.argv[3])
+        sp = BidirectionalDijkstraSP(G)
+        if sp.has_path(s, t):
+            print("{} to {} ({:.2f})  ".format(s, t, sp.dist(s, t)), end="")
+            for e in sp.path(s, t):
+                print(e, end="   ")
+            print()
+        else:
+            print("{} to {}         no path".format(s, t))
+
+
+if __name__ == "__main__":
+    main()
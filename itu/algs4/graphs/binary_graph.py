@@ -0,0 +1,170 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a compact binary file format for the graph data
+types in this package, and loads such files through a memory map.
+
+A file consists of a fixed-size header followed by the compressed sparse
+row representation of the graph (see csr_graph.py):
+
+    magic        8 bytes   b"ALGS4GRF"
+    version      uint32    currently 1
+    kind         uint32    GRAPH, DIGRAPH, EDGE_WEIGHTED_GRAPH or
+                           EDGE_WEIGHTED_DIGRAPH
+    byte order   uint32    0x01020304 as written by the machine that saved it
+    reserved     uint32
+    V            int64     number of vertices
+    entries      int64     length of the adjacency arrays (2E for
+                           undirected graphs, E for directed graphs)
+    offsets      (V + 1) int64
+    targets      entries int32, padded to a multiple of 8 bytes
+    weights      entries float64, only for edge-weighted graphs
+
+Loading a file does not parse or copy anything: the arrays of the returned
+CSR graph are views into the memory-mapped file, so startup takes constant
+time and pages are only read from disk when they are used. Several
+processes that load the same file share its pages through the operating
+system's page cache.
+
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from itu.algs4.graphs.csr_graph import (
+    CSRDigraph,
+    CSREdgeWeightedDigraph,
+    CSREdgeWeightedGraph,
+    CSRGraph,
+)
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.graph import Graph
+
+GRAPH = 0
+DIGRAPH = 1
+EDGE_WEIGHTED_GRAPH = 2
+EDGE_WEIGHTED_DIGRAPH = 3
+
+_MAGIC = b"ALGS4GRF"
+_VERSION = 1
+_BYTE_ORDER = 0x01020304
+_HEADER = struct.Struct("=8sIIIIqq")
+
+
+def _kind_of(G):
+    # the kind of graph G in the file format, and its CSR version
+    if isinstance(G, (Graph, CSRGraph)):
+        return GRAPH, CSRGraph
+    if isinstance(G, (Digraph, CSRDigraph)):
+        return DIGRAPH, CSRDigraph
+    if isinstance(G, (EdgeWeightedGraph, CSREdgeWeightedGraph)):
+        return EDGE_WEIGHTED_GRAPH, CSREdgeWeightedGraph
+    if isinstance(G, (EdgeWeightedDigraph, CSREdgeWeightedDigraph)):
+        return EDGE_WEIGHTED_DIGRAPH, CSREdgeWeightedDigraph
+    raise ValueError("cannot save a {}".format(type(G).__name__))
+
+
+def _padding(nbytes):
+    # number of bytes needed to pad nbytes to a multiple of 8
+    return -nbytes % 8
+
+
+def _write(f, typecode, data):
+    # writes the array or memoryview data without copying it if possible
+    if getattr(data, "typecode", getattr(data, "format", None)) != typecode:
+        data = array(typecode, data)
+    f.write(data)
+
+
+def save(G, filename):
+    """Writes the graph G to a file in the binary graph format.
+
+    :param G: a Graph, Digraph, EdgeWeightedGraph or EdgeWeightedDigraph,
+              or one of their CSR versions
+    :param filename: the name of the file to write
+    :raises ValueError: if G is not one of the supported graph types
+
+    """
+    kind, csr_class = _kind_of(G)
+    if not isinstance(G, csr_class):
+        G = csr_class.from_graph(G)
+    targets = G._targets
+    with open(filename, "wb") as f:
+        f.write(
+            _HEADER.pack(_MAGIC, _VERSION, kind, _BYTE_ORDER, 0, G.V(), len(targets))
+        )
+        _write(f, "q", G._offsets)
+        _write(f, "i", targets)
+        f.write(bytes(_padding(4 * len(targets))))
+        if kind in (EDGE_WEIGHTED_GRAPH, EDGE_WEIGHTED_DIGRAPH):
+            _write(f, "d", G._weights)
+
+
+def load(filename):
+    """Opens a graph that was written by save() through a memory map.
+
+    The file must not be modified while the returned graph is in use.
+
+    :param filename: the name of the file to read
+    :return: a CSRGraph, CSRDigraph, CSREdgeWeightedGraph or
+             CSREdgeWeightedDigraph, depending on the kind of graph saved
+    :raises ValueError: if the file is not in the binary graph format
+
+    """
+    with open(filename, "rb") as f:
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    if len(buffer) < _HEADER.size:
+        raise ValueError("{} is not a binary graph file".format(filename))
+    header = _HEADER.unpack_from(buffer)
+    swapped = header[3] != _BYTE_ORDER
+    if swapped:
+        # saved on a machine with the other byte order
+        other = "<" if sys.byteorder == "big" else ">"
+        header = struct.unpack_from(other + _HEADER.format[1:], buffer)
+    magic, version, kind, _, _, V, n = header
+    if magic != _MAGIC or version != _VERSION or kind > EDGE_WEIGHTED_DIGRAPH:
+        raise ValueError("{} is not a binary graph file".format(filename))
+
+    weighted = kind in (EDGE_WEIGHTED_GRAPH, EDGE_WEIGHTED_DIGRAPH)
+    targets_start = _HEADER.size + 8 * (V + 1)
+    weights_start = targets_start + 4 * n + _padding(4 * n)
+    if len(buffer) < weights_start + (8 * n if weighted else 0):
+        raise ValueError("{} is truncated".format(filename))
+    offsets = buffer[_HEADER.size : targets_start].cast("q")
+    targets = buffer[targets_start : targets_start + 4 * n].cast("i")
+    weights = (
+        buffer[weights_start : weights_start + 8 * n].cast("d") if weighted else None
+    )
+
+    if swapped:
+        # the arrays cannot be used in place, so swap them into memory
+        offsets, targets = array("q", offsets), array("i", targets)
+        offsets.byteswap()
+        targets.byteswap()
+        if weighted:
+            weights = array("d", weights)
+            weights.byteswap()
+
+    if kind == GRAPH:
+        return CSRGraph(V, offsets, targets)
+    if kind == DIGRAPH:
+        return CSRDigraph(V, offsets, targets)
+    if kind == EDGE_WEIGHTED_GRAPH:
+        return CSREdgeWeightedGraph(V, offsets, targets, weights)
+    return CSREdgeWeightedDigraph(V, offsets, targets, weights)
+
+
+def main():
+    """Opens the binary graph file given as argument and prints the graph."""
+    if len(sys.argv) > 1:
+        G = load(sys.argv[1])
+        print(G)
+
+
+if __name__ == "__main__":
+    main()
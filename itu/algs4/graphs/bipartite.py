@@ -4,6 +4,7 @@
 
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.nonrecursive_dfs import NONTREE, PREORDER, walk
 
 
 class Bipartite:
@@ -13,7 +14,8 @@ class Bipartite:
     color operation determines a bipartition if not, the oddCycle operation
     determines a cycle with an odd number of edges.
 
-    This implementation uses depth-first search. The constructor takes
+    This implementation uses depth-first search with an explicit stack
+    (see nonrecursive_dfs.py). The constructor takes
     time proportional to V + E (in the worst case), where V is the
     number of vertices and E is the number of edges. Afterwards, the
     isBipartite and color operations take constant time the oddCycle
@@ -44,25 +46,20 @@ class Bipartite:
         for v in range(G.V()):
             if not self._marked[v]:
                 self._dfs(G, v)
+                # short circuit if odd-length cycle found
+                if self._cycle is not None:
+                    break
 
         assert self._check(G)
 
-    def _dfs(self, G, v):
-        self._marked[v] = True
-
-        for w in G.adj(v):
-            # short circuit if odd-length cycle found
-            if self._cycle is not None:
-                return
-
-            # found uncolored vertex, so recur
-            if not self._marked[w]:
-                self._edge_to[w] = v
-                self._color[w] = not self._color[v]
-                self._dfs(G, w)
+    def _dfs(self, G, s):
+        for event, v, w in walk(G, s, self._marked, self._edge_to):
+            # found uncolored vertex
+            if event == PREORDER and v != s:
+                self._color[v] = not self._color[self._edge_to[v]]
 
             # if v-w create an odd-length cycle, find it
-            elif self._color[w] == self._color[v]:
+            elif event == NONTREE and self._color[w] == self._color[v]:
                 self._is_bipartite = False
                 self._cycle = Stack()
                 self._cycle.push(
@@ -74,6 +71,7 @@ class Bipartite:
                     x = self._edge_to[x]
 
                 self._cycle.push(w)
+                return
 
     def is_bipartite(self):
         """Returns True if the graph is bipartite.
@@ -0,0 +1,221 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements Borůvka's algorithm for minimum spanning trees,
+with the scan for the cheapest edge leaving every component split across a
+pool of worker processes."""
+
+import os
+import sys
+from array import array
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
+
+from itu.algs4.fundamentals.queue import Queue
+from itu.algs4.fundamentals.uf import find_root, link_roots
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.stdlib.instream import InStream
+
+PARALLEL_CUTOFF = 1 << 15  # graphs with fewer edges are run in this process
+
+_edges = None  # the shared edge arrays of a worker process, set by _share()
+
+
+def _view(shared, typecode):
+    # a memoryview of a shared ctypes array with the given native item type
+    return memoryview(shared).cast("B").cast(typecode)
+
+
+def _shared(typecode, values):
+    # a shared ctypes array with a copy of the given array
+    shared = RawArray(typecode, len(values))
+    _view(shared, typecode)[:] = values
+    return shared
+
+
+def _share(weights, tails, heads, labels):
+    # runs once in each worker: keeps views of the shared arrays
+    global _edges
+    _edges = (
+        _view(weights, "d"),
+        _view(tails, "i"),
+        _view(heads, "i"),
+        _view(labels, "i"),
+    )
+
+
+def _cheapest(bounds, edges=None):
+    """Finds the cheapest edge leaving every component among the edges with
+    indices lo to hi - 1. Ties are broken by the smaller edge index, so all
+    workers agree on the same order of the edges.
+
+    :param bounds: the pair (lo, hi)
+    :param edges: the arrays of weights, tails, heads and component labels;
+                  the shared arrays of the worker process if None
+    :return: the pairs (component, edge index) for every component that has
+             an edge leaving it in the range
+
+    """
+    weights, tails, heads, labels = _edges if edges is None else edges
+    lo, hi = bounds
+    best = {}  # component -> index of its cheapest edge so far
+    for i in range(lo, hi):
+        cv = labels[tails[i]]
+        cw = labels[heads[i]]
+        if cv == cw:
+            continue
+        weight = weights[i]
+        j = best.get(cv)
+        if j is None or weight < weights[j]:
+            best[cv] = i
+        j = best.get(cw)
+        if j is None or weight < weights[j]:
+            best[cw] = i
+    return list(best.items())
+
+
+class BoruvkaMST:
+    """The BoruvkaMST class represents a data type for computing a minimum
+    spanning tree in an edge-weighted graph. The edge weights can be
+    positive, zero, or negative and need not be distinct. If the graph is
+    not connected, it computes a minimum spanning forest, which is the union
+    of minimum spanning trees in each connected component. The weight()
+    method returns the weight of a minimum spanning tree and the edges()
+    method returns its edges.
+
+    This implementation uses Borůvka's algorithm: in every round, each
+    component adds the cheapest edge leaving it, which at least halves the
+    number of components. The edges are copied once into shared arrays of
+    weights and endpoints, which every worker process of a pool can read
+    without copying. In every round, the main process publishes the
+    component of every vertex in another shared array, the workers scan
+    disjoint ranges of the edges for the cheapest edge leaving each
+    component, and the main process combines their results and merges the
+    components. Ties between equal weights are broken by the position of
+    the edge in the arrays, so the chosen edges never form a cycle. Graphs
+    with fewer than PARALLEL_CUTOFF edges, for which starting a pool costs
+    more than it saves, are run in the calling process on plain arrays.
+
+    The constructor takes time proportional to (E log V) divided by the
+    number of processes, plus V log V for merging, and uses extra space
+    proportional to E + V. Afterwards, the weight() method takes constant
+    time and the edges() method takes time proportional to V.
+
+    """
+
+    def __init__(self, G, processes=None):
+        """Computes a minimum spanning tree (or forest) of an edge-weighted
+        graph.
+
+        :param G: the edge-weighted graph (or CSR edge-weighted graph)
+        :param processes: the number of worker processes; os.cpu_count() if
+                          None, and no pool at all if 1 or if the graph has
+                          fewer than PARALLEL_CUTOFF edges
+
+        """
+        self._weight = 0
+        self._mst = Queue()
+        edges = []  # the Edge objects, in the order of the shared arrays
+        weights = array("d")
+        tails = array("i")
+        heads = array("i")
+        for v in range(G.V()):
+            for e in G.adj(v):
+                w = e.other(v)
+                if w > v:  # self-loops are never in a spanning forest
+                    edges.append(e)
+                    weights.append(e.weight())
+                    tails.append(v)
+                    heads.append(w)
+        labels = array("i", range(G.V()))
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+        E = len(edges)
+        if processes == 1 or E == 0 or E < PARALLEL_CUTOFF:
+            # a pool would cost more than it saves: scan the arrays directly
+            views = (weights, tails, heads, labels)
+            self._boruvka(G.V(), edges, views, lambda: [_cheapest((0, E), views)])
+            return
+        shared = (
+            _shared("d", weights),
+            _shared("i", tails),
+            _shared("i", heads),
+            _shared("i", labels),
+        )
+        del weights, tails, heads, labels
+        chunk = -(-E // processes)
+        ranges = [(lo, min(lo + chunk, E)) for lo in range(0, E, chunk)]
+        with Pool(processes, initializer=_share, initargs=shared) as pool:
+            views = tuple(_view(a, c) for a, c in zip(shared, "diii"))
+            self._boruvka(G.V(), edges, views, lambda: pool.map(_cheapest, ranges))
+
+    def _boruvka(self, V, edges, views, scan):
+        """Runs the rounds of Borůvka's algorithm.
+
+        :param V: the number of vertices
+        :param edges: the Edge objects
+        :param views: the arrays of weights, tails, heads and component
+                      labels, or the views of their shared copies
+        :param scan: the function that returns the results of _cheapest()
+                     for all ranges of edges
+
+        """
+        weights, tails, heads, labels = views
+        # the union-find of ArrayUF, on plain lists
+        parent = list(range(V))
+        rank = [0] * V
+        while self._mst.size() < V - 1:
+            # the cheapest edge leaving every component, over all ranges
+            best = {}
+            for result in scan():
+                for c, i in result:
+                    j = best.get(c)
+                    if j is None or (weights[i], i) < (weights[j], j):
+                        best[c] = i
+            if not best:
+                break  # every component is a tree of the forest
+            for i in set(best.values()):
+                v = find_root(parent, tails[i])
+                w = find_root(parent, heads[i])
+                if v != w:
+                    link_roots(parent, rank, v, w)
+                    self._mst.enqueue(edges[i])
+                    self._weight += weights[i]
+            for v in range(V):
+                labels[v] = find_root(parent, v)
+
+    def edges(self):
+        """Returns the edges in a minimum spanning tree (or forest).
+
+        :return: the edges in a minimum spanning tree (or forest)
+
+        """
+        return self._mst
+
+    def weight(self):
+        """Returns the sum of the edge weights in a minimum spanning tree (or
+        forest).
+
+        :return: the sum of the edge weights in a minimum spanning tree (or forest)
+
+        """
+        return self._weight
+
+
+def main():
+    """Creates an edge-weighted graph from an input file, runs Borůvka's
+    algorithm on it, and prints the edges of the MST and the sum of the edge
+    weights."""
+    if len(sys.argv) > 1:
+        stream = InStream(sys.argv[1])
+        G = EdgeWeightedGraph.from_stream(stream)
+        mst = BoruvkaMST(G)
+        for e in mst.edges():
+            print(e)
+        print("{:.5f}".format(mst.weight()))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 # see README.md for details
 # This is python3
 
+from itu.algs4.graphs.nonrecursive_dfs import reach
+
 
 class CC:
     """The CC class represents a data type for determining the connected
@@ -16,7 +18,8 @@ class CC:
     vertices in the connected component: two vertices have the same component
     identifier if and only if they are in the same connected component.
 
-    This implementation uses depth-first search.
+    This implementation uses depth-first search with an explicit stack
+    (see nonrecursive_dfs.py).
     The constructor takes time proportional to V + E
     (in the worst case),
     where V is the number of vertices and E is the number of edges.
@@ -38,18 +41,12 @@ class CC:
 
         for v in range(G.V()):
             if not self._marked[v]:
-                self._dfs(G, v)
+                component = reach(G, v, self._marked)
+                for w in component:
+                    self._id[w] = self._count
+                self._size[self._count] = len(component)
                 self._count += 1
 
-    def _dfs(self, G, v):
-        # depth-first search for a Graph
-        self._marked[v] = True
-        self._id[v] = self._count
-        self._size[self._count] += 1
-        for w in G.adj(v):
-            if not self._marked[w]:
-                self._dfs(G, w)
-
     def id(self, v):
         """Returns the component id of the connected component containing
         vertex v.
@@ -0,0 +1,836 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements frozen versions of the Graph, Digraph,
+EdgeWeightedGraph and EdgeWeightedDigraph data types that use a compressed sparse row (CSR)
+representation instead of a vertex-indexed array of Bag objects.
+
+The adjacency lists of all vertices are stored back to back in a single
+array of targets (and, for edge-weighted graphs, a parallel array of
+weights). An array of V + 1 offsets marks where the adjacency list of
+each vertex starts and ends. This uses a few bytes per edge instead of
+one linked-list node object per edge, and iterating over the vertices
+adjacent to a vertex is a scan over a contiguous slice of memory.
+
+The classes expose the same V(), E(), adj() and degree() methods as their
+Bag-based counterparts, so clients such as DepthFirstSearch,
+BreadthFirstPaths and DijkstraSP run on them unchanged. The adjacency
+lists are returned in the same order as the graph they were built from.
+
+"""
+
+import sys
+from array import array
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_list import read_edge_list
+from itu.algs4.stdlib.instream import InStream
+
+
+def _validate_vertices(V, vertices, error):
+    # throw an error unless 0 <= v < V for every v, like read_edge_list()
+    if len(vertices) > 0:
+        lo = min(vertices)
+        hi = max(vertices)
+        if lo < 0 or hi >= V:
+            v = lo if lo < 0 else hi
+            raise error("vertex {} is not between 0 and {}".format(v, V - 1))
+
+
+def _compress(V, tails, heads, weights=None, error=ValueError):
+    """Groups the directed entries tails[i]->heads[i] by tail vertex.
+
+    The entries are assumed to be given in the order in which they were
+    added to the graph. Since a Bag returns its items in reverse order of
+    insertion, the entries of each vertex are laid out in reverse order,
+    too, so that the adjacency lists match those of the Bag-based graphs.
+
+    :param V: the number of vertices
+    :param tails: the tail vertex of each entry
+    :param heads: the head vertex of each entry
+    :param weights: the weight of each entry, or None
+    :param error: the exception class to raise on invalid input
+    :return: the offsets, targets and weights arrays (weights may be None)
+    :raises error: if V < 0 or any entry is not between 0 and V - 1
+
+    """
+    if V < 0:
+        raise error("Number of vertices must be nonnegative")
+    _validate_vertices(V, tails, error)
+    _validate_vertices(V, heads, error)
+    n = len(tails)
+    offsets = array("q", bytes(8 * (V + 1)))
+    for v in tails:
+        offsets[v + 1] += 1
+    for v in range(V):
+        offsets[v + 1] += offsets[v]
+
+    # fill each slice from its end, so the first entry added ends up last
+    end = offsets[1:]
+    targets = array("i", bytes(4 * n))
+    if weights is None:
+        for v, w in zip(tails, heads):
+            k = end[v] - 1
+            end[v] = k
+            targets[k] = w
+        return offsets, targets, None
+
+    csr_weights = array("d", bytes(8 * n))
+    for v, w, weight in zip(tails, heads, weights):
+        k = end[v] - 1
+        end[v] = k
+        targets[k] = w
+        csr_weights[k] = weight
+    return offsets, targets, csr_weights
+
+
+class CSRGraph:
+    """The CSRGraph class represents a frozen undirected graph of vertices
+    named 0 through V - 1.
+
+    It supports iterating over all of the vertices adjacent to a vertex,
+    and provides methods for returning the number of vertices V and the
+    number of edges E. Parallel edges and self-loops are permitted. By
+    convention, a self-loop v-v appears in the adjacency list of v twice
+    and contributes two to the degree of v. Edges cannot be added after
+    construction.
+
+    This implementation uses a compressed sparse row representation,
+    which stores the adjacency lists back to back in an array of 2E
+    targets, indexed by an array of V + 1 offsets. All operations take
+    constant time except iterating over the vertices adjacent to a given
+    vertex, which takes time proportional to the number of such vertices.
+
+    """
+
+    def __init__(self, V, offsets, targets):
+        """Initializes a graph from its compressed sparse row representation.
+        The vertices adjacent to v are targets[offsets[v]:offsets[v + 1]].
+
+        :param V: number of vertices
+        :param offsets: the V + 1 offsets into targets
+        :param targets: the concatenated adjacency lists
+        :raises ValueError: if V < 0
+
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative")
+        self._V = V
+        self._E = len(targets) // 2
+        self._offsets = offsets
+        self._targets = targets
+
+    @staticmethod
+    def from_edges(V, tails, heads):
+        """Initializes a graph with V vertices and the undirected edges
+        tails[i]-heads[i], added in the given order.
+
+        :param V: number of vertices
+        :param tails: one endpoint of each edge
+        :param heads: the other endpoint of each edge
+        :returns: new graph with the given edges
+        :raises ValueError: if V < 0 or any endpoint is not between 0 and V - 1
+
+        """
+        # every edge v-w is added as v->w followed by w->v, like Graph.add_edge()
+        tails = array("i", tails)
+        heads = array("i", heads)
+        entry_tails = array("i", bytes(8 * len(tails)))
+        entry_heads = array("i", bytes(8 * len(tails)))
+        entry_tails[0::2] = entry_heads[1::2] = tails
+        entry_tails[1::2] = entry_heads[0::2] = heads
+        offsets, targets, _ = _compress(V, entry_tails, entry_heads)
+        return CSRGraph(V, offsets, targets)
+
+    @staticmethod
+    def from_graph(G):
+        """Initializes a new CSR graph with the same vertices, edges and
+        adjacency order as the graph G.
+
+        :param G: the graph to copy
+        :returns: copy of G
+
+        """
+        offsets = array("q", [0])
+        targets = array("i")
+        for v in range(G.V()):
+            targets.extend(G.adj(v))
+            offsets.append(len(targets))
+        return CSRGraph(G.V(), offsets, targets)
+
+    @staticmethod
+    def from_stream(stream):
+        """Initializes a graph from the specified input stream. The format is
+        the number of vertices V, followed by the number of edges E, followed
+        by E pairs of vertices, with each entry separated by whitespace.
+
+        :param stream: the input stream
+        :returns: new graph from stream
+        :raises ValueError: if the endpoints of any edge are not in prescribed range
+        :raises ValueError: if the number of vertices or edges is negative
+        :raises ValueError: if the input stream is in the wrong format
+
+        """
+        V, tails, heads, _ = read_edge_list(stream)
+        return CSRGraph.from_edges(V, tails, heads)
+
+    def V(self):
+        """Returns the number of vertices in this graph.
+
+        :returns: the number of vertices in this graph.
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in this graph.
+
+        :returns: the number of edges in this graph.
+
+        """
+        return self._E
+
+    def _validateVertex(self, v):
+        # throw a ValueError unless 0 <= v < V
+        if v < 0 or v >= self._V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, self._V))
+
+    def adj(self, v):
+        """Returns the vertices adjacent to vertex v.
+
+        :param v: the vertex
+        :returns: the vertices adjacent to vertex v, as an iterable
+        :raises ValueError: unless  0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._targets[self._offsets[v] : self._offsets[v + 1]]
+
+    def degree(self, v):
+        """Returns the degree of vertex v.
+
+        :param v: the vertex
+        :returns: the degree of vertex v
+        :raises ValueError:  unless 0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def __repr__(self):
+        """Returns a string representation of this graph.
+
+        :returns: the number of vertices V, followed by the number of edges E,
+                    followed by the V adjacency lists
+
+        """
+        s = ["{} vertices, {} edges\n".format(self._V, self._E)]
+        for v in range(self._V):
+            s.append("%d : " % (v))
+            for w in self.adj(v):
+                s.append("%d " % (w))
+            s.append("\n")
+
+        return "".join(s)
+
+
+class CSRDigraph:
+    """The CSRDigraph class represents a frozen directed graph of vertices
+    named 0 through V - 1.
+
+    It supports iterating over all of the vertices adjacent from a vertex,
+    and provides methods for returning the number of vertices V and the
+    number of edges E. Parallel edges and self-loops are permitted. Edges
+    cannot be added after construction.
+
+    This implementation uses a compressed sparse row representation,
+    which stores the adjacency lists back to back in an array of E
+    targets, indexed by an array of V + 1 offsets. All operations take
+    constant time except iterating over the vertices adjacent from a given
+    vertex, which takes time proportional to the number of such vertices.
+
+    """
+
+    def __init__(self, V, offsets, targets):
+        """Initializes a digraph from its compressed sparse row representation.
+        The vertices adjacent from v are targets[offsets[v]:offsets[v + 1]].
+
+        :param V: number of vertices
+        :param offsets: the V + 1 offsets into targets
+        :param targets: the concatenated adjacency lists
+        :raises ValueError: if V < 0
+
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative")
+        self._V = V
+        self._E = len(targets)
+        self._offsets = offsets
+        self._targets = targets
+
+    @staticmethod
+    def from_edges(V, tails, heads):
+        """Initializes a digraph with V vertices and the directed edges
+        tails[i]->heads[i], added in the given order.
+
+        :param V: number of vertices
+        :param tails: the tail vertex of each edge
+        :param heads: the head vertex of each edge
+        :returns: new digraph with the given edges
+        :raises ValueError: if V < 0 or any endpoint is not between 0 and V - 1
+
+        """
+        offsets, targets, _ = _compress(V, tails, heads)
+        return CSRDigraph(V, offsets, targets)
+
+    @staticmethod
+    def from_graph(G):
+        """Initializes a new CSR digraph with the same vertices, edges and
+        adjacency order as the digraph G.
+
+        :param G: the digraph to copy
+        :returns: copy of G
+
+        """
+        offsets = array("q", [0])
+        targets = array("i")
+        for v in range(G.V()):
+            targets.extend(G.adj(v))
+            offsets.append(len(targets))
+        return CSRDigraph(G.V(), offsets, targets)
+
+    @staticmethod
+    def from_stream(stream):
+        """Initializes a digraph from the specified input stream. The format
+        is the number of vertices V, followed by the number of edges E,
+        followed by E pairs of vertices, with each entry separated by
+        whitespace.
+
+        :param stream: the input stream
+        :returns: new digraph from stream
+        :raises ValueError: if the endpoints of any edge are not in prescribed range
+        :raises ValueError: if the number of vertices or edges is negative
+        :raises ValueError: if the input stream is in the wrong format
+
+        """
+        V, tails, heads, _ = read_edge_list(stream)
+        return CSRDigraph.from_edges(V, tails, heads)
+
+    def V(self):
+        """Returns the number of vertices in this digraph.
+
+        :returns: the number of vertices in this digraph.
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in this digraph.
+
+        :returns: the number of edges in this digraph.
+
+        """
+        return self._E
+
+    def _validateVertex(self, v):
+        # throw a ValueError unless 0 <= v < V
+        if v < 0 or v >= self._V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, self._V))
+
+    def adj(self, v):
+        """Returns the vertices adjacent from vertex v.
+
+        :param v: the vertex
+        :returns: the vertices adjacent from vertex v, as an iterable
+        :raises ValueError: unless  0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._targets[self._offsets[v] : self._offsets[v + 1]]
+
+    def degree(self, v):
+        """Returns the number of directed edges incident from vertex v.
+
+        :param v: the vertex
+        :returns: the outdegree of vertex v
+        :raises ValueError:  unless 0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def reverse(self):
+        """Returns the reverse of the digraph.
+
+        :returns: the reverse of the digraph
+
+        """
+        # same order of insertion as Digraph.reverse()
+        tails = array("i")
+        heads = array("i")
+        for v in range(self._V):
+            adj = self.adj(v)
+            heads.extend([v] * len(adj))
+            tails.extend(adj)
+        return CSRDigraph.from_edges(self._V, tails, heads)
+
+    def __repr__(self):
+        """Returns a string representation of this digraph.
+
+        :returns: the number of vertices V, followed by the number of edges E,
+                    followed by the V adjacency lists
+
+        """
+        s = ["{} vertices, {} edges\n".format(self._V, self._E)]
+        for v in range(self._V):
+            s.append("%d : " % (v))
+            for w in self.adj(v):
+                s.append("%d " % (w))
+            s.append("\n")
+
+        return "".join(s)
+
+
+class CSREdgeWeightedGraph:
+    """The CSREdgeWeightedGraph class represents a frozen edge-weighted graph
+    of vertices named 0 through V-1, where each undirected edge has a
+    real-valued weight.
+
+    It supports iterating over all of the edges incident to a vertex, and
+    provides methods for returning the number of vertices V and the number
+    of edges E. Parallel edges and self-loops are permitted. By convention,
+    a self-loop v-v appears in the adjacency list of v twice and
+    contributes two to the degree of v. Edges cannot be added after
+    construction.
+
+    This implementation uses a compressed sparse row representation,
+    which stores the other endpoints and weights of the edges back to back
+    in two parallel arrays of length 2E, indexed by an array of V + 1
+    offsets. Edge objects are only created while iterating over adj() or
+    edges(), so the two entries of an edge do not share one Edge object.
+    All operations take constant time except iterating over the edges
+    incident to a given vertex, which takes time proportional to the
+    number of such edges.
+
+    """
+
+    def __init__(self, V, offsets, targets, weights):
+        """Initializes an edge-weighted graph from its compressed sparse row
+        representation. The edges incident to v go to the vertices
+        targets[offsets[v]:offsets[v + 1]] with the weights
+        weights[offsets[v]:offsets[v + 1]].
+
+        :param V: the number of vertices
+        :param offsets: the V + 1 offsets into targets and weights
+        :param targets: the concatenated other endpoints of the edges
+        :param weights: the concatenated weights of the edges
+        :raises IllegalArgumentException: if V < 0
+
+        """
+        if V < 0:
+            raise IllegalArgumentException("Number of vertices must be nonnegative")
+        self._V = V
+        self._E = len(targets) // 2
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+
+    @staticmethod
+    def from_edges(V, tails, heads, weights):
+        """Initializes an edge-weighted graph with V vertices and the
+        undirected edges tails[i]-heads[i] of weight weights[i], added in the
+        given order.
+
+        :param V: the number of vertices
+        :param tails: one endpoint of each edge
+        :param heads: the other endpoint of each edge
+        :param weights: the weight of each edge
+        :return: the edge-weighted graph
+        :rtype: CSREdgeWeightedGraph
+        :raises IllegalArgumentException: if V < 0 or any endpoint is not
+            between 0 and V - 1
+
+        """
+        # every edge v-w is added to the lists of v and w, like add_edge()
+        tails = array("i", tails)
+        heads = array("i", heads)
+        weights = array("d", weights)
+        entry_tails = array("i", bytes(8 * len(tails)))
+        entry_heads = array("i", bytes(8 * len(tails)))
+        entry_weights = array("d", bytes(16 * len(tails)))
+        entry_tails[0::2] = entry_heads[1::2] = tails
+        entry_tails[1::2] = entry_heads[0::2] = heads
+        entry_weights[0::2] = entry_weights[1::2] = weights
+        offsets, targets, csr_weights = _compress(
+            V, entry_tails, entry_heads, entry_weights, IllegalArgumentException
+        )
+        return CSREdgeWeightedGraph(V, offsets, targets, csr_weights)
+
+    @staticmethod
+    def from_graph(G):
+        """Initializes a new CSR edge-weighted graph with the same vertices,
+        edges and adjacency order as the edge-weighted graph G.
+
+        :param G: the edge-weighted graph to copy
+        :return: the copy of the edge-weighted graph G
+        :rtype: CSREdgeWeightedGraph
+
+        """
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("d")
+        for v in range(G.V()):
+            for e in G.adj(v):
+                targets.append(e.other(v))
+                weights.append(e.weight())
+            offsets.append(len(targets))
+        return CSREdgeWeightedGraph(G.V(), offsets, targets, weights)
+
+    @staticmethod
+    def from_stream(stream):
+        """Initializes an edge-weighted graph from an input stream. The format
+        is the number of vertices V, followed by the number of edges E,
+        followed by E pairs of vertices and edge weights, with each entry
+        separated by whitespace.
+
+        :param stream: the input stream
+        :raises IllegalArgumentException: if the endpoints of any edge are not in prescribed range
+        :raises IllegalArgumentException: if the number of vertices or edges is negative
+        :return: the edge-weighted graph
+        :rtype: CSREdgeWeightedGraph
+
+        """
+        V, tails, heads, weights = read_edge_list(
+            stream, weighted=True, error=IllegalArgumentException
+        )
+        return CSREdgeWeightedGraph.from_edges(V, tails, heads, weights)
+
+    def V(self):
+        """Returns the number of vertices in this edge-weighted graph.
+
+        :return: the number of vertices in this edge-weighted graph
+        :rtype: int
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in this edge-weighted graph.
+
+        :return: the number of edges in this edge-weighted graph
+        :rtype: int
+
+        """
+        return self._E
+
+    def _validate_vertex(self, v):
+        """Raises an IllegalArgumentException unless 0 <= v < V.
+
+        :param v: the vertex to be validated
+
+        """
+        if v < 0 or v >= self._V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, self._V - 1)
+            )
+
+    def adj(self, v):
+        """Returns the edges incident on vertex v.
+
+        :param v: the vertex
+        :return: the edges incident on vertex v
+        :rtype: collections.iterable[Edge]
+
+        """
+        self._validate_vertex(v)
+        lo = self._offsets[v]
+        hi = self._offsets[v + 1]
+        return [
+            Edge(v, w, weight)
+            for w, weight in zip(self._targets[lo:hi], self._weights[lo:hi])
+        ]
+
+    def degree(self, v):
+        """Returns the degree of vertex v.
+
+        :param v: the vertex
+        :return: the degree of vertex v
+        :rtype: int
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def edges(self):
+        """Returns all edges in this edge-weighted graph.
+
+        :return: all edges in this edge-weighted graph
+
+        """
+        for v in range(self._V):
+            self_loops = 0
+            for e in self.adj(v):
+                w = e.other(v)
+                if w > v:
+                    yield e
+                elif w == v:
+                    if self_loops % 2 == 0:
+                        yield e
+                    self_loops += 1
+
+    def __repr__(self):
+        """Returns a string representation of the edge-weighted graph.
+
+        This method takes time proportional to E + V.
+        :return: the number of vertices, followed by the number of edges,
+        followed by the V adjacency lists of edges
+
+        """
+        s = ["{} {} \n".format(self._V, self._E)]
+        for v in range(self._V):
+            s.append("{}: ".format(v))
+            for e in self.adj(v):
+                s.append("{}: ".format(e))
+            s.append("\n")
+        return "".join(s)
+
+
+class CSREdgeWeightedDigraph:
+    """The CSREdgeWeightedDigraph class represents a frozen edge-weighted
+    digraph of vertices named 0 through V-1, where each directed edge has a
+    real-valued weight.
+
+    It supports iterating over all edges incident from a given vertex, and
+    provides methods for returning the number of vertices V and the number
+    of edges E. Parallel edges and self-loops are permitted. Edges cannot
+    be added after construction.
+
+    This implementation uses a compressed sparse row representation,
+    which stores the heads and weights of the edges back to back in two
+    parallel arrays of length E, indexed by an array of V + 1 offsets.
+    DirectedEdge objects are only created while iterating over adj() or
+    edges(). All operations take constant time except iterating over the
+    edges incident from a given vertex, which takes time proportional to
+    the number of such edges.
+
+    """
+
+    def __init__(self, V, offsets, targets, weights):
+        """Initializes an edge-weighted digraph from its compressed sparse row
+        representation. The edges incident from v go to the vertices
+        targets[offsets[v]:offsets[v + 1]] with the weights
+        weights[offsets[v]:offsets[v + 1]].
+
+        :param V: the number of vertices
+        :param offsets: the V + 1 offsets into targets and weights
+        :param targets: the concatenated heads of the edges
+        :param weights: the concatenated weights of the edges
+        :raises IllegalArgumentException: if V < 0
+
+        """
+        if V < 0:
+            raise IllegalArgumentException(
+                "Number of vertices in a Digraph must be nonnegative"
+            )
+        self._V = V
+        self._E = len(targets)
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        self._indegree = None  # computed on first use
+
+    @staticmethod
+    def from_edges(V, tails, heads, weights):
+        """Initializes an edge-weighted digraph with V vertices and the
+        directed edges tails[i]->heads[i] of weight weights[i], added in the
+        given order.
+
+        :param V: the number of vertices
+        :param tails: the tail vertex of each edge
+        :param heads: the head vertex of each edge
+        :param weights: the weight of each edge
+        :return: the edge-weighted digraph
+        :rtype: CSREdgeWeightedDigraph
+        :raises IllegalArgumentException: if V < 0 or any endpoint is not
+            between 0 and V - 1
+
+        """
+        offsets, targets, csr_weights = _compress(
+            V, tails, heads, weights, IllegalArgumentException
+        )
+        return CSREdgeWeightedDigraph(V, offsets, targets, csr_weights)
+
+    @staticmethod
+    def from_graph(G):
+        """Initializes a new CSR edge-weighted digraph with the same vertices,
+        edges and adjacency order as the edge-weighted digraph G.
+
+        :param G: the edge-weighted digraph to copy
+        :return: a copy of graph G
+        :rtype: CSREdgeWeightedDigraph
+
+        """
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("d")
+        for v in range(G.V()):
+            for e in G.adj(v):
+                targets.append(e.to_vertex())
+                weights.append(e.weight())
+            offsets.append(len(targets))
+        return CSREdgeWeightedDigraph(G.V(), offsets, targets, weights)
+
+    @staticmethod
+    def from_stream(stream):
+        """Initializes an edge-weighted digraph from the specified input
+        stream. The format is the number of vertices V, followed by the number
+        of edges E, followed by E pairs of vertices and edge weights, with each
+        entry seperated by whitespace.
+
+        :param stream: the input stream
+        :raises IllegalArgumentException: if the endpoints of any edge are not in prescribed range
+        :raises IllegalArgumentException: if the number of vertices or edges is negative
+        :return: the edge-weighted digraph
+        :rtype: CSREdgeWeightedDigraph
+
+        """
+        V, tails, heads, weights = read_edge_list(
+            stream, weighted=True, error=IllegalArgumentException
+        )
+        return CSREdgeWeightedDigraph.from_edges(V, tails, heads, weights)
+
+    def V(self):
+        """Returns the number of vertices in this edge-weighted digraph.
+
+        :return: the number of vertices in this edge-weighted digraph
+        :rtype: int
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in this edge-weighted digraph.
+
+        :return: the number of edges in this edge-weighted digraph
+        :rtype: int
+
+        """
+        return self._E
+
+    def _validate_vertex(self, v):
+        """Raises an IllegalArgumentException unless 0 <= v < V.
+
+        :param v: the vertex to validate
+
+        """
+        if v < 0 or v >= self._V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, self._V - 1)
+            )
+
+    def adj(self, v):
+        """Returns the directed edges incident from vertex v.
+
+        :param v: the vertex
+        :return: the directed edges incident from vertex v.
+        :rtype: collections.iterable[DirectedEdge]
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        lo = self._offsets[v]
+        hi = self._offsets[v + 1]
+        return [
+            DirectedEdge(v, w, weight)
+            for w, weight in zip(self._targets[lo:hi], self._weights[lo:hi])
+        ]
+
+    def outdegree(self, v):
+        """Returns the number of directed edges incident from vertex v. This is
+        known as the outdegree of vertex v.
+
+        :param v: the vertex
+        :return: the outdegree of vertex v
+        :rtype: int
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def indegree(self, v):
+        """Returns the number of directed edges incident to vertex v. This is
+        known as the indegree of vertex v.
+
+        :param v: the vertex
+        :return: the indegree of vertex v
+        :rtype: int
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        if self._indegree is None:
+            self._indegree = array("i", bytes(4 * self._V))
+            for w in self._targets:
+                self._indegree[w] += 1
+        return self._indegree[v]
+
+    def edges(self):
+        """Returns all directed edges in this edge-weighted digraph.
+
+        :return: all edges in this edge-weighted digraph
+        :rtype: collections.iterable[DirectedEdge]
+
+        """
+        for v in range(self._V):
+            yield from self.adj(v)
+
+    def reverse(self):
+        """Returns the reverse of this edge-weighted digraph, in which every
+        edge v->w of weight x is replaced by the edge w->v of weight x.
+
+        :return: the reverse of this edge-weighted digraph
+        :rtype: CSREdgeWeightedDigraph
+
+        """
+        # same order of insertion as EdgeWeightedDigraph.reverse()
+        heads = array("i")
+        offsets = self._offsets
+        for v in range(self._V):
+            heads.extend([v] * (offsets[v + 1] - offsets[v]))
+        return CSREdgeWeightedDigraph.from_edges(
+            self._V, self._targets, heads, self._weights
+        )
+
+    def __repr__(self):
+        """Returns a string representation of this edge-weighted digraph.
+
+        :return: the number of vertices V, followed by the number of edges E,
+        followed by the V adjacency lists of edges.
+        :rtype: str
+
+        """
+        s = ["{} {} \n".format(self._V, self._E)]
+        for v in range(self._V):
+            s.append("{}: ".format(v))
+            for e in self.adj(v):
+                s.append("{}  ".format(e))
+            s.append("\n")
+        return "".join(s)
+
+
+def main():
+    """Creates a CSR edge-weighted digraph from the given input file and
+    prints it."""
+    if len(sys.argv) > 1:
+        stream = InStream(sys.argv[1])
+        G = CSREdgeWeightedDigraph.from_stream(stream)
+        print(G)
+
+
+if __name__ == "__main__":
+    main()
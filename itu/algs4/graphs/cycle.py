@@ -3,6 +3,7 @@
 # This is python3
 
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.nonrecursive_dfs import NONTREE, walk
 
 
 class Cycle:
@@ -10,11 +11,12 @@ class Cycle:
     undirected graph has a cycle. The hasCycle operation determines whether the
     graph has a cycle and, if so, the cycle operation returns one.
 
-    This implementation uses depth-first search. The constructor takes
-    time proportional to V + E (in the worst case), where V is the
-    number of vertices and E is the number of edges. Afterwards, the
-    hasCycle operation takes constant time the cycle operation takes
-    time proportional to the length of the cycle.
+    This implementation uses depth-first search with an explicit stack
+    (see nonrecursive_dfs.py). The constructor takes time proportional to
+    V + E (in the worst case), where V is the number of vertices and E is
+    the number of edges. Afterwards, the hasCycle operation takes constant
+    time the cycle operation takes time proportional to the length of the
+    cycle.
 
     """
 
@@ -34,7 +36,10 @@ class Cycle:
         self._cycle = None
         for v in range(G.V()):
             if not self._marked[v]:
-                self._dfs(G, -1, v)
+                self._dfs(G, v)
+                # short circuit if cycle already found
+                if self._cycle is not None:
+                    return
 
     def _has_self_loop(self, G):
         # does this graph have a self loop?
@@ -84,16 +89,12 @@ class Cycle:
         """
         return self._cycle
 
-    def _dfs(self, G, u, v):
-        self._marked[v] = True
-        for w in G.adj(v):
-            # short circuit if cycle already found
-            if self._cycle is not None:
-                return
-            if not self._marked[w]:
-                self._edgeTo[w] = v
-                self._dfs(G, v, w)
-            elif w != u:
+    def _dfs(self, G, s):
+        for event, v, w in walk(G, s, self._marked, self._edgeTo):
+            if event != NONTREE:
+                continue
+            u = self._edgeTo[v] if v != s else -1  # the vertex v was reached from
+            if w != u:
                 self._cycle = Stack()
                 x = v
                 while x != w:
@@ -101,6 +102,7 @@ class Cycle:
                     x = self._edgeTo[x]
                 self._cycle.push(w)
                 self._cycle.push(v)
+                return
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 from itu.algs4.fundamentals.queue import Queue
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.csr_graph import CSRDigraph
 from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.nonrecursive_dfs import orders
 
 
 class DepthFirstOrder:
@@ -8,7 +11,8 @@ class DepthFirstOrder:
     first search ordering of the vertices in a digraph or edge-weighted
     digraph, including preorder, postorder, and reverse postorder.
 
-    This implementation uses depth-first search. The constructor takes time proportional
+    This implementation uses depth-first search with an explicit stack (see
+    nonrecursive_dfs.py). The constructor takes time proportional
     to V + E (in the worst case), where V is the number of vertices and E is the number
     of edges. Afterwards, the preorder, postorder, and reverse postorder operation takes
     take time proportional to V.
@@ -32,14 +36,14 @@ class DepthFirstOrder:
         self._pre_counter = 0
         self._post_counter = 0
 
-        if isinstance(digraph, Digraph):
-            dfs = self._dfs
+        if isinstance(digraph, (Digraph, CSRDigraph)):
+            head = None
         else:
-            dfs = self._dfs_edge_weighted
+            head = DirectedEdge.to_vertex
 
         for v in range(digraph.V()):
             if not self._marked[v]:
-                dfs(digraph, v)
+                self._dfs(digraph, v, head)
 
     def post(self, v=None):
         """Either returns the postorder number of vertex v or, if v is None,
@@ -83,31 +87,16 @@ class DepthFirstOrder:
         return reverse
 
     # run DFS in digraph G from vertex v and compute preorder/postorder
-    def _dfs(self, digraph, v):
-        self._marked[v] = True
-        self._pre[v] = self._pre_counter
-        self._pre_counter += 1
-        self._preorder.enqueue(v)
-        for w in digraph.adj(v):
-            if not self._marked[w]:
-                self._dfs(digraph, w)
-        self._postorder.enqueue(v)
-        self._post[v] = self._post_counter
-        self._post_counter += 1
-
-    # run DFS in edge-weighted digraph G from vertex v and compute preorder/postorder
-    def _dfs_edge_weighted(self, graph, v):
-        self._marked[v] = True
-        self._pre[v] = self._pre_counter
-        self._pre_counter += 1
-        self._preorder.enqueue(v)
-        for edge in graph.adj(v):
-            w = edge.to_vertex()
-            if not self._marked[w]:
-                self._dfs_edge_weighted(graph, w)
-        self._postorder.enqueue(v)
-        self._post[v] = self._post_counter
-        self._post_counter += 1
+    def _dfs(self, digraph, v, head):
+        pre, post = orders(digraph, v, self._marked, head)
+        for w in pre:
+            self._pre[w] = self._pre_counter
+            self._pre_counter += 1
+            self._preorder.enqueue(w)
+        for w in post:
+            self._postorder.enqueue(w)
+            self._post[w] = self._post_counter
+            self._post_counter += 1
 
     # throw an IllegalArgumentException unless 0 <= v < V
     def _validate_vertex(self, v):
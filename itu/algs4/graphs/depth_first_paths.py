@@ -3,6 +3,7 @@
 # This is python3
 
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.nonrecursive_dfs import reach
 
 
 class DepthFirstPaths:
@@ -30,15 +31,7 @@ class DepthFirstPaths:
         self._edgeTo = [0] * G.V()  # last vertex on known path to this vertex
         self._s = s  # source
         self._validateVertex(s)
-        self._dfs(G, s)
-
-    def _dfs(self, G, v):
-        # depth first search from v
-        self._marked[v] = True
-        for w in G.adj(v):
-            if not self._marked[w]:
-                self._edgeTo[w] = v
-                self._dfs(G, w)
+        reach(G, s, self._marked, self._edgeTo)
 
     def has_path_to(self, v):
         """Is there a path between the source vertex s and vertex v?
@@ -2,13 +2,17 @@
 # see README.md for details
 # This is python3
 
+from itu.algs4.graphs.nonrecursive_dfs import reach
+
 
 class DepthFirstSearch:
     """The DepthFirstSearch class represents a data type for determining the
     vertices connected to a given source vertex s in an undirected graph. For
     versions that find the paths, see DepthFirstPaths and BreadthFirstPaths.
 
-    This implementation uses depth-first search. The constructor takes
+    This implementation uses depth-first search with an explicit stack
+    (see nonrecursive_dfs.py), so it works on graphs with long paths
+    without running into the recursion limit. The constructor takes
     time proportional to V + E (in the worst case), where V is the
     number of vertices and E is the number of edges. It uses extra space
     (not including the graph) proportional to V.
@@ -27,15 +31,7 @@ class DepthFirstSearch:
         self._marked = [False] * G.V()  # marked[v] = is there an s-v path?
         self._count = 0  # number of vertices connected to s
         self._validateVertex(s)
-        self._dfs(G, s)
-
-    def _dfs(self, G, v):
-        # depth first search from v
-        self._marked[v] = True
-        self._count += 1
-        for w in G.adj(v):
-            if not self._marked[w]:
-                self._dfs(G, w)
+        self._count = len(reach(G, s, self._marked))
 
     def marked(self, v):
         """Is there a path between the source vertex s and vertex v?
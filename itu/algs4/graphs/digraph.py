@@ -13,6 +13,7 @@ import sys
 
 from itu.algs4.fundamentals.bag import Bag
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.edge_list import read_edge_list
 from itu.algs4.graphs.graph import Graph
 from itu.algs4.stdlib.instream import InStream
 
@@ -59,6 +60,7 @@ class Digraph:
         """Initializes a graph from the specified input stream. The format is
         the number of vertices V, followed by the number of edges E, followed
         by E pairs of vertices, with each entry separated by whitespace.
+        The edges are read and validated in bulk.
 
         :param stream: the input stream
         :returns: new graph from stream
@@ -67,20 +69,12 @@ class Digraph:
         :raises ValueError: if the input stream is in the wrong format
 
         """
-        V = stream.readInt()  # read V
-        if V < 0:
-            raise ValueError("Number of vertices must be nonnegative")
+        V, tails, heads, _ = read_edge_list(stream)  # read and validate all edges
         g = Digraph(V)  # construct this graph
-        E = stream.readInt()  # read E
-        if E < 0:
-            raise ValueError("Number of edges in a Graph must be nonnegative")
-        for _ in range(E):
-            # Add an edge
-            v = stream.readInt()  # read a vertex,
-            w = stream.readInt()  # read another vertex,
-            g._validateVertex(v)
-            g._validateVertex(w)
-            g.add_edge(v, w)  # and add edge connecting them.
+        adj = g._adj
+        for v, w in zip(tails, heads):
+            adj[v].add(w)  # add w to v's list
+        g._E = len(tails)
         return g
 
     @staticmethod
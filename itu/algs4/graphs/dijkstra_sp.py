@@ -1,9 +1,11 @@
 import sys
+from heapq import heappop, heappush
 
 from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
-from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.sorting.index_min_pq import DaryIndexMinPQ
+from itu.algs4.sorting.radix_heap import RadixHeap
 from itu.algs4.stdlib.instream import InStream
 
 # Created for BADS 2018
@@ -16,39 +18,116 @@ class DijkstraSP:
     source shortest paths problem in edge-weighted digraphs where the edge
     weights are nonnegative.
 
-    This implementation uses Dijkstra's algorithm with a binary heap.
+    This implementation uses Dijkstra's algorithm with a 4-ary heap
+    (a DaryIndexMinPQ without argument validation).
     The constructor takes time proportional to E log V, where V is the
     number of vertices and E is the number of edges. Each call to
     dist_to() and has_path_to() takes constant time. Each call to
     path_to() takes time proportional to the number of edges in the
     shortest path returned.
 
+    If all edge weights are integers (such as 3 or 3.0) and no target is
+    given, the heap is a RadixHeap instead, where decrease-key takes
+    constant time. The constructor then takes time proportional to
+    E + V log D, where D is the largest distance from s.
+
+    With lazy=True, the heap is Python's heapq binary heap instead of a
+    DaryIndexMinPQ. Rather than decreasing the key of a vertex already on the
+    heap, a new (distance, vertex) entry is pushed, and outdated entries are
+    skipped when they are removed. The heap may then hold up to E entries,
+    but every heap operation runs in C, which makes this mode about twice
+    as fast on large graphs (see benchmarks/dijkstra.py).
+
+    If a target vertex t is given, the search stops as soon as t is removed
+    from the heap, so it only visits the vertices closer to s than t. Then
+    dist_to() and path_to() are exact for t and every vertex closer than t;
+    for other vertices, dist_to() is only an upper bound and has_path_to()
+    may return False even if there is a path. Edge weights are checked as
+    the edges are relaxed, so a query does not need to look at the whole
+    digraph. For many queries between two vertices, see
+    BidirectionalDijkstraSP.
+
     """
 
-    def __init__(self, G, s):
+    def __init__(self, G, s, lazy=False, target=None):
         """Computes a shortest-paths tree from the source vertex s to every
         other vertex in the edge-weighted digraph G.
 
         :param G: The edge-weighted digraph
         :param s: The source vertex
+        :param lazy: if True, use a heapq binary heap with lazy deletion
+        :param target: if given, stop once the shortest path to this vertex
+                       is known
         :raises IllegalArgumentException: if an edge weight is negative
         :raises IllegalArgumentException: unless 0 <= s < V
+        :raises IllegalArgumentException: unless 0 <= target < V
 
         """
-        for e in G.edges():
-            if e.weight() < 0:
-                raise IllegalArgumentException("edge {} has negative weight".format(e))
+        integral = False  # are all edge weights known to be integers?
+        if target is None:
+            # scan the adjacency lists directly, G.edges() would copy every edge
+            integral = True
+            for v in range(G.V()):
+                for e in G.adj(v):
+                    weight = e.weight()
+                    if weight < 0:
+                        raise IllegalArgumentException(
+                            "edge {} has negative weight".format(e)
+                        )
+                    if integral and not float(weight).is_integer():
+                        integral = False
         self._dist_to = [float("inf")] * G.V()
         self._edge_to = [None] * G.V()
         self._validate_vertex(s)
+        if target is not None:
+            self._validate_vertex(target)
         self._dist_to[s] = 0.0
-        self._pq = IndexMinPQ(G.V())
+        if lazy:
+            self._lazy_dijkstra(G, s, target)
+            return
+        if integral:
+            self._pq = RadixHeap(G.V(), validate=False)
+        else:
+            self._pq = DaryIndexMinPQ(G.V(), validate=False)
         self._pq.insert(s, 0.0)
         while not self._pq.is_empty():
             v = self._pq.del_min()
+            if v == target:
+                break
             for e in G.adj(v):
                 self._relax(e)
 
+    def _lazy_dijkstra(self, G, s, target):
+        """Runs Dijkstra's algorithm from s with a heapq binary heap of
+        (distance, vertex) entries, skipping the outdated ones.
+
+        :param G: the edge-weighted digraph
+        :param s: the source vertex
+        :param target: the vertex at which to stop, or None
+
+        """
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        pq = [(0.0, s)]
+        while pq:
+            d, v = heappop(pq)
+            if d > dist_to[v]:
+                continue  # v was already removed with a smaller distance
+            if v == target:
+                break
+            for e in G.adj(v):
+                w = e.to_vertex()
+                weight = e.weight()
+                if weight < 0:
+                    raise IllegalArgumentException(
+                        "edge {} has negative weight".format(e)
+                    )
+                dist = d + weight
+                if dist < dist_to[w]:
+                    dist_to[w] = dist
+                    edge_to[w] = e
+                    heappush(pq, (dist, w))
+
     def dist_to(self, v):
         """Returns the length of a shortest path from the source vertex s to
         vertex v.
@@ -102,6 +181,8 @@ class DijkstraSP:
         """
         v = e.from_vertex()
         w = e.to_vertex()
+        if e.weight() < 0:
+            raise IllegalArgumentException("edge {} has negative weight".format(e))
         if self._dist_to[w] > self._dist_to[v] + e.weight():
             self._dist_to[w] = self._dist_to[v] + e.weight()
             self._edge_to[w] = e
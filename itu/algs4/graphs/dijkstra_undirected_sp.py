@@ -1,9 +1,10 @@
 import sys
+from heapq import heappop, heappush
 
 from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
-from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.sorting.index_min_pq import DaryIndexMinPQ
 from itu.algs4.stdlib.instream import InStream
 
 # Created for BADS 2018
@@ -16,34 +17,46 @@ class DijkstraUndirectedSP:
     source shortest paths problem in edge-weighted diagraphs where the edge
     weights are nonnegative.
 
-    This implementation uses Dijkstra's algorithm with a binary heap.
+    This implementation uses Dijkstra's algorithm with a 4-ary heap
+    (a DaryIndexMinPQ without argument validation).
     The constructor takes time proportional to E log V, where V is the
     number of vertices and E is the number of edges. Each call to
     dist_to() and has_path_to() takes constant time each call to
     path_to() takes time proportional to the number of edges in the
     shortest path returned.
 
+    With lazy=True, the binary heap is Python's heapq module with lazy
+    deletion instead of a DaryIndexMinPQ, as in DijkstraSP.
+
     """
 
-    def __init__(self, G, s):
+    def __init__(self, G, s, lazy=False):
         """Computes a shortest-paths tree from the source vertex s to every
         other vertex in the edge-weighted graph G.
 
         :param G: the edge-weighted graph
         :param s: the source vertex
+        :param lazy: if True, use a heapq binary heap with lazy deletion
         :raises IllegalArgumentException: if an edge weight is negative
         :raises IllegalArgumentException: unless 0 <= s < V
 
         """
-        for e in G.edges():
-            if e.weight() < 0:
-                raise IllegalArgumentException("edge {} has negative weight".format(e))
+        # scan the adjacency lists directly, G.edges() would copy every edge
+        for v in range(G.V()):
+            for e in G.adj(v):
+                if e.weight() < 0:
+                    raise IllegalArgumentException(
+                        "edge {} has negative weight".format(e)
+                    )
 
         self._dist_to = [float("inf")] * G.V()
         self._edge_to = [None] * G.V()
         self._dist_to[s] = 0.0
         self._validate_vertex(s)
-        self._pq = IndexMinPQ(G.V())
+        if lazy:
+            self._lazy_dijkstra(G, s)
+            return
+        self._pq = DaryIndexMinPQ(G.V(), validate=False)
         self._pq.insert(s, 0)
 
         while not self._pq.is_empty():
@@ -51,6 +64,29 @@ class DijkstraUndirectedSP:
             for e in G.adj(v):
                 self._relax(e, v)
 
+    def _lazy_dijkstra(self, G, s):
+        """Runs Dijkstra's algorithm from s with a heapq binary heap of
+        (distance, vertex) entries, skipping the outdated ones.
+
+        :param G: the edge-weighted graph
+        :param s: the source vertex
+
+        """
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        pq = [(0.0, s)]
+        while pq:
+            d, v = heappop(pq)
+            if d > dist_to[v]:
+                continue  # v was already removed with a smaller distance
+            for e in G.adj(v):
+                w = e.other(v)
+                dist = d + e.weight()
+                if dist < dist_to[w]:
+                    dist_to[w] = dist
+                    edge_to[w] = e
+                    heappush(pq, (dist, w))
+
     def dist_to(self, v):
         """Returns the length of a shortest path between the source vertex s
         and vertex v.
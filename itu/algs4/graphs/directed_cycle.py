@@ -14,6 +14,7 @@ import sys
 
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.nonrecursive_dfs import NONTREE, POSTORDER, PREORDER, walk
 from itu.algs4.stdlib.instream import InStream
 
 
@@ -23,7 +24,8 @@ class DirectedCycle:
     digraph has a directed cycle and, and of so, the cycle operation returns
     one.
 
-    This implementation uses depth-first search. The constructor takes time proportional
+    This implementation uses depth-first search with an explicit stack (see
+    nonrecursive_dfs.py). The constructor takes time proportional
     to V + E (in the worst case), where V is the number of vertices and E is the
     number of edges. Afterwards, the hasCycle operation takes constant time; the
     cycle operation takes time proportional to the length of the cycle.
@@ -48,21 +50,19 @@ class DirectedCycle:
         for v in range(digraph.V()):
             if not self._marked[v]:
                 self._dfs(digraph, v)
+                # short circuit if directed cycle found
+                if self.has_cycle():
+                    return
 
     # check that algorithm computes either the topological order or finds a directed cycle
-    def _dfs(self, digraph, v):
-        self._on_stack[v] = True
-        self._marked[v] = True
-        for w in digraph.adj(v):
-            # short circuit if directed cycle found
-            if self.has_cycle():
-                return
-            # found new vertex, so recur
-            elif not self._marked[w]:
-                self._edge_to[w] = v
-                self._dfs(digraph, w)
+    def _dfs(self, digraph, s):
+        for event, v, w in walk(digraph, s, self._marked, self._edge_to):
+            if event == PREORDER:
+                self._on_stack[v] = True
+            elif event == POSTORDER:
+                self._on_stack[v] = False
             # trace back directed cycle
-            elif self._on_stack[w]:
+            elif event == NONTREE and self._on_stack[w]:
                 self._cycle = Stack()
                 x = v
                 while x != w:
@@ -70,8 +70,7 @@ class DirectedCycle:
                     x = self._edge_to[x]
                 self._cycle.push(w)
                 self._cycle.push(v)
-
-        self._on_stack[v] = False
+                return
 
     def has_cycle(self):
         """Does the digraph have a directed cycle?
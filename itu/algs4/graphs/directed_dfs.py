@@ -5,6 +5,7 @@ import sys
 
 from itu.algs4.fundamentals.bag import Bag
 from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.nonrecursive_dfs import reach
 from itu.algs4.stdlib.instream import InStream
 
 
@@ -14,7 +15,8 @@ class DirectedDFS:
     digraph. For versions that find the paths, see DepthFirstDirectedPaths and
     BreadthFirstDirectedPaths.
 
-    This implementation uses depth-first search.
+    This implementation uses depth-first search with an explicit stack
+    (see nonrecursive_dfs.py).
     The constructor takes time proportional to V + E (in the worst case),
     where V is the number of vertices and E is the number of edges.
 
@@ -36,14 +38,8 @@ class DirectedDFS:
         self.reachables = 0
         for s_ in s:
             self._validate_vertex(s_)
-            self._dfs(G, s_)
-
-    def _dfs(self, G, v):
-        self.reachables += 1
-        self.marked[v] = True
-        for w in G.adj(v):
-            if not self.marked[w]:
-                self._dfs(G, w)
+            if not self.marked[s_]:
+                self.reachables += len(reach(G, s_, self.marked))
 
     def is_marked(self, v):
         """Is there a directed path from the source vertex and vertex v?
@@ -0,0 +1,193 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements offline dynamic connectivity: answering
+connectivity queries on an undirected graph while edges are both added and
+removed, when the whole sequence of operations is known in advance."""
+
+import sys
+
+from itu.algs4.fundamentals.uf import RollbackUF
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.stdlib.instream import InStream
+
+
+class OfflineDynamicConnectivity:
+    """The OfflineDynamicConnectivity class represents a data type for
+    answering connected(v, w) queries on an undirected graph that changes
+    over time. It starts from the edges of a Graph, and records a timeline
+    of edge insertions, edge deletions and queries; the queries are answered
+    together by answers(), without rebuilding CC after every change.
+
+    Every edge is present during an interval of the timeline, from its
+    insertion to its deletion (or the end). This implementation builds a
+    segment tree over the queries and stores every edge in the O(log Q)
+    nodes that cover its interval, where Q is the number of queries. A
+    depth-first traversal of the tree merges the edges of each node in a
+    RollbackUF when it enters the node and rolls them back when it leaves,
+    so at every leaf the union-find holds exactly the edges present at that
+    query. Each edge is merged O(log Q) times at a cost of O(log V) each, so
+    answers() takes time proportional to V + (E + Q) log Q log V, where E is
+    the number of edge insertions. Recording an operation takes constant
+    time.
+
+    Parallel edges are allowed: removing v-w removes the most recently added
+    copy of it, and v and w stay joined by the other copies.
+
+    """
+
+    def __init__(self, G):
+        """Starts a timeline from the edges of the undirected graph G. The
+        graph itself is not changed.
+
+        :param G: the undirected graph
+
+        """
+        self._G = G
+        self._queries = []  # the pairs of vertices of every query
+        self._intervals = []  # (v, w, first query, last query + 1) per edge
+        self._open = {}  # the first query of each copy of every present edge
+        for v in range(G.V()):
+            for w in G.adj(v):
+                if v < w:
+                    self._open.setdefault((v, w), []).append(0)
+        # a self-loop is in the adjacency list of its vertex twice
+        for v in range(G.V()):
+            loops = sum(1 for w in G.adj(v) if w == v)
+            if loops:
+                self._open[(v, v)] = [0] * (loops // 2)
+
+    def add_edge(self, v, w):
+        """Adds the undirected edge v-w at this point of the timeline.
+
+        :param v: one vertex in the edge
+        :param w: the other vertex in the edge
+        :raises ValueError: unless both 0 <= v < V and 0 <= w < V
+
+        """
+        self._G._validateVertex(v)
+        self._G._validateVertex(w)
+        key = (v, w) if v <= w else (w, v)
+        self._open.setdefault(key, []).append(len(self._queries))
+
+    def remove_edge(self, v, w):
+        """Removes the undirected edge v-w at this point of the timeline.
+
+        :param v: one vertex in the edge
+        :param w: the other vertex in the edge
+        :raises ValueError: unless both 0 <= v < V and 0 <= w < V
+        :raises ValueError: if the graph has no edge v-w at this point
+
+        """
+        self._G._validateVertex(v)
+        self._G._validateVertex(w)
+        key = (v, w) if v <= w else (w, v)
+        starts = self._open.get(key)
+        if not starts:
+            raise ValueError("edge {}-{} is not in the graph".format(v, w))
+        start = starts.pop()
+        if not starts:
+            del self._open[key]
+        if start < len(self._queries):
+            self._intervals.append((key[0], key[1], start, len(self._queries)))
+
+    def connected(self, v, w):
+        """Asks whether vertices v and w are connected at this point of the
+        timeline. The answer is the element of answers() at the index
+        returned.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: the index of the query
+        :raises ValueError: unless both 0 <= v < V and 0 <= w < V
+
+        """
+        self._G._validateVertex(v)
+        self._G._validateVertex(w)
+        self._queries.append((v, w))
+        return len(self._queries) - 1
+
+    def answers(self):
+        """Answers all queries recorded so far.
+
+        :returns: a list with, for every query in order, True if its vertices
+                  were connected at that point of the timeline, and False
+                  otherwise
+
+        """
+        Q = len(self._queries)
+        if Q == 0:
+            return []
+        intervals = list(self._intervals)
+        for (v, w), starts in self._open.items():
+            for start in starts:
+                if start < Q:
+                    intervals.append((v, w, start, Q))
+
+        # tree[node] holds the edges present during all queries of the node
+        tree = [[] for _ in range(4 * Q)]
+        for v, w, lo, hi in intervals:
+            self._insert(tree, 1, 0, Q, lo, hi, (v, w))
+
+        uf = RollbackUF(self._G.V())
+        result = [False] * Q
+        self._traverse(tree, uf, 1, 0, Q, result)
+        return result
+
+    def _insert(self, tree, node, lo, hi, a, b, edge):
+        """Stores the edge in the nodes that cover the queries a to b - 1
+        within the node for the queries lo to hi - 1."""
+        if a <= lo and hi <= b:
+            tree[node].append(edge)
+            return
+        mid = (lo + hi) // 2
+        if a < mid:
+            self._insert(tree, 2 * node, lo, mid, a, b, edge)
+        if b > mid:
+            self._insert(tree, 2 * node + 1, mid, hi, a, b, edge)
+
+    def _traverse(self, tree, uf, node, lo, hi, result):
+        """Answers the queries lo to hi - 1, given that uf holds the edges
+        of all ancestors of the node."""
+        uf.checkpoint()
+        for v, w in tree[node]:
+            uf.union(v, w)
+        if hi - lo == 1:
+            v, w = self._queries[lo]
+            result[lo] = uf.connected(v, w)
+        else:
+            mid = (lo + hi) // 2
+            self._traverse(tree, uf, 2 * node, lo, mid, result)
+            self._traverse(tree, uf, 2 * node + 1, mid, hi, result)
+        uf.rollback()
+
+
+def main():
+    """Reads a graph from the input file, then reads operations from the
+    second input file, one per line: "+ v w" adds edge v-w, "- v w" removes
+    it and "? v w" asks whether v and w are connected. Prints the answer to
+    every query."""
+    if len(sys.argv) > 2:
+        G = Graph.from_stream(InStream(sys.argv[1]))
+        dc = OfflineDynamicConnectivity(G)
+        queries = []
+        stream = InStream(sys.argv[2])
+        while stream.hasNextLine():
+            line = stream.readLine().split()
+            if len(line) != 3:
+                continue
+            op, v, w = line[0], int(line[1]), int(line[2])
+            if op == "+":
+                dc.add_edge(v, w)
+            elif op == "-":
+                dc.remove_edge(v, w)
+            elif op == "?":
+                dc.connected(v, w)
+                queries.append((v, w))
+        for (v, w), answer in zip(queries, dc.answers()):
+            print("{} {}: {}".format(v, w, "connected" if answer else "not connected"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a bulk reader for the text format used by the
+graph data types in this package: the number of vertices V, followed by the
+number of edges E, followed by E edges, each given as a pair of vertices
+(and, for edge-weighted graphs, a weight), with each entry separated by
+whitespace.
+
+Instead of reading one token at a time, the edge list is read and split a
+block of edges at a time, converted into compact arrays, and all vertices
+are validated in one batch. The from_stream() methods of Graph, Digraph,
+EdgeWeightedGraph, EdgeWeightedDigraph and the CSR graphs use this reader.
+
+"""
+
+from array import array
+
+CHUNK = 1 << 16  # the number of edges read and converted at a time
+
+
+def read_edge_list(stream, weighted=False, error=ValueError):
+    """Reads a graph in the text format from the input stream. The stream is
+    not read past the line of the last edge, so the rest of it can still be
+    read. The vertices are read as decimal integers.
+
+    :param stream: the input stream
+    :param weighted: True if every edge is followed by a weight
+    :param error: the exception class to raise on invalid input
+    :return: V, followed by the tails, heads and weights (None if weighted
+             is False) of the edges as arrays, in the order of the input
+    :raises error: if the number of vertices or edges is negative
+    :raises error: if the endpoints of any edge are not in prescribed range
+    :raises EOFError: if the stream ends before E edges have been read
+    :raises ValueError: if the input stream is in the wrong format
+
+    """
+    V = stream.readInt()
+    if V < 0:
+        raise error("Number of vertices must be nonnegative")
+    E = stream.readInt()
+    if E < 0:
+        raise error("Number of edges must be nonnegative")
+
+    width = 3 if weighted else 2
+    tails = array("i")
+    heads = array("i")
+    weights = array("d") if weighted else None
+    # only one block of edges is held as strings at a time
+    for lo in range(0, E, CHUNK):
+        tokens = stream.readStrings(width * min(CHUNK, E - lo))
+        tails.extend(map(int, tokens[0::width]))
+        heads.extend(map(int, tokens[1::width]))
+        if weighted:
+            weights.extend(map(float, tokens[2::width]))
+
+    if E > 0:
+        lo = min(min(tails), min(heads))
+        hi = max(max(tails), max(heads))
+        if lo < 0 or hi >= V:
+            v = lo if lo < 0 else hi
+            raise error("vertex {} is not between 0 and {}".format(v, V - 1))
+    return V, tails, heads, weights
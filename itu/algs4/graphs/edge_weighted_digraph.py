@@ -4,6 +4,7 @@ from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.bag import Bag
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_list import read_edge_list
 from itu.algs4.stdlib.instream import InStream
 
 # Created for BADS 2018
@@ -72,7 +73,8 @@ class EdgeWeightedDigraph:
         """Initializes an edge-weighted digraph from the specified input
         stream. The format is the number of vertices V, followed by the number
         of edges E, followed by E pairs of vertices and edge weights, with each
-        entry seperated by whitespace.
+        entry seperated by whitespace. The edges are read and validated in
+        bulk.
 
         :param stream: the input stream
 
@@ -82,17 +84,16 @@ class EdgeWeightedDigraph:
         :rtype: EdgeWeightedDigraph
 
         """
-        g = EdgeWeightedDigraph(stream.readInt())
-        E = stream.readInt()
-        if g._E < 0:
-            raise IllegalArgumentException("Number of edges must be nonnegative")
-        for _ in range(E):
-            v = stream.readInt()
-            w = stream.readInt()
-            g._validate_vertex(v)
-            g._validate_vertex(w)
-            weight = stream.readFloat()
-            g.add_edge(DirectedEdge(v, w, weight))
+        V, tails, heads, weights = read_edge_list(
+            stream, weighted=True, error=IllegalArgumentException
+        )
+        g = EdgeWeightedDigraph(V)
+        adj = g._adj
+        indegree = g._indegree
+        for v, w, weight in zip(tails, heads, weights):
+            adj[v].add(DirectedEdge(v, w, weight))
+            indegree[w] += 1
+        g._E = len(tails)
         return g
 
     def V(self):
@@ -190,6 +191,20 @@ class EdgeWeightedDigraph:
                 edges.add(e)
         return edges
 
+    def reverse(self):
+        """Returns the reverse of this edge-weighted digraph, in which every
+        edge v->w of weight x is replaced by the edge w->v of weight x.
+
+        :return: the reverse of this edge-weighted digraph
+        :rtype: EdgeWeightedDigraph
+
+        """
+        rev = EdgeWeightedDigraph(self._V)
+        for v in range(self._V):
+            for e in self._adj[v]:
+                rev.add_edge(DirectedEdge(e.to_vertex(), v, e.weight()))
+        return rev
+
     def __repr__(self):
         """Returns a string representation of this edge-weighted digraph.
 
@@ -6,6 +6,7 @@ import sys
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.directed_edge import DirectedEdge
 from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.nonrecursive_dfs import NONTREE, POSTORDER, PREORDER, walk
 
 # Execution:    python edge_weighted_directed_cycle V E F
 # Finds a directed cycle in an edge-weighted digraph.
@@ -17,7 +18,8 @@ from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
     The hasCycle operation determines whether the edge-weighted
     digraph has a directed cycle and, if so, the cycle operation
     returns one.
-    This implementation uses depth-first search.
+    This implementation uses depth-first search with an explicit stack
+    (see nonrecursive_dfs.py).
     The constructor takes time proportional to V + E
     (in the worst case),
     where V is the number of vertices and E is the number of edges.
@@ -44,28 +46,25 @@ class EdgeWeightedDirectedCycle:
         for v in range(G.V()):
             if not self._marked[v]:
                 self._dfs(G, v)
+                # short circuit if directed cycle found
+                if self._cycle is not None:
+                    break
 
         # check that digraph has a cycle
         assert self._check()
 
     # check that algorithm computes either the topological order or finds a directed cycle
-    def _dfs(self, G, v):
-        self._onStack[v] = True
-        self._marked[v] = True
-        for e in G.adj(v):
-            w = e.to_vertex()
-
-            # short circuit if directed cycle found
-            if self._cycle is not None:
-                return
-
-            # found new vertex, so recur
-            elif not self._marked[w]:
-                self._edgeTo[w] = e
-                self._dfs(G, w)
+    def _dfs(self, G, s):
+        head = DirectedEdge.to_vertex
+        for event, v, e in walk(G, s, self._marked, self._edgeTo, head):
+            if event == PREORDER:
+                self._onStack[v] = True
+            elif event == POSTORDER:
+                self._onStack[v] = False
 
             # trace back directed cycle
-            elif self._onStack[w]:
+            elif event == NONTREE and self._onStack[e.to_vertex()]:
+                w = e.to_vertex()
                 self._cycle = Stack()
                 f = e
                 while f.from_vertex() != w:
@@ -74,7 +73,6 @@ class EdgeWeightedDirectedCycle:
 
                 self._cycle.push(f)
                 return
-        self._onStack[v] = False
 
     # Does the edge-weighted digraph have a directed cycle?
     # @return True if the edge-weighted digraph has a directed cycle,
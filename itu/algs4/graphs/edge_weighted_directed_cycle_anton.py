@@ -14,7 +14,9 @@ For more information, see chapter 4.2 of the book.
 import sys
 
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.directed_edge import DirectedEdge
 from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.nonrecursive_dfs import NONTREE, POSTORDER, PREORDER, walk
 from itu.algs4.stdlib import instream
 
 
@@ -49,31 +51,28 @@ class EdgeWeightedDirectedCycle:
         for v in range(edge_weighted_digraph.V()):
             if not self._marked[v]:
                 self._dfs(edge_weighted_digraph, v)
+                # short circuit if directed cycle found
+                if self.has_cycle():
+                    break
 
     # check that algorithm computes either the topological order or finds a directed cycle
-    def _dfs(self, graph, v):
-        self._on_stack[v] = True
-        self._marked[v] = True
-        for edge in graph.adj(v):
-            w = edge.to_vertex()
-
-            # short circuit if directed cycle found
-            if self.has_cycle():
-                return
-            # found new vertex, so recur
-            elif not self._marked[w]:
-                self._edge_to[w] = edge
-                self._dfs(graph, w)
+    def _dfs(self, graph, s):
+        head = DirectedEdge.to_vertex
+        for event, v, edge in walk(graph, s, self._marked, self._edge_to, head):
+            if event == PREORDER:
+                self._on_stack[v] = True
+            elif event == POSTORDER:
+                self._on_stack[v] = False
             # trace back directed cycle
-            elif self._on_stack[w]:
+            elif event == NONTREE and self._on_stack[edge.to_vertex()]:
+                w = edge.to_vertex()
                 self._cycle = Stack()
                 f = edge
                 while f.from_vertex() != w:
                     self._cycle.push(f)
                     f = self._edge_to[f.from_vertex()]
                 self._cycle.push(f)
-
-        self._on_stack[v] = False
+                return
 
     def has_cycle(self):
         """Does the edge weighted digraph have a directed cycle?
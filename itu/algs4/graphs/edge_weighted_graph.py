@@ -4,6 +4,7 @@ from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.bag import Bag
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_list import read_edge_list
 from itu.algs4.stdlib.instream import InStream
 
 # Created for BADS 2018
@@ -69,7 +70,7 @@ class EdgeWeightedGraph:
         """Initializes an edge-weighted graph from an input stream. The format
         is the number of vertices V, followed by the number of edges E,
         followed by E pairs of vertices and edge weights, with each entry
-        separated by whitespace.
+        separated by whitespace. The edges are read and validated in bulk.
 
         :param stream: the input stream
         :raises IllegalArgumentException: if the endpoints of any edge are not in prescribed range
@@ -78,18 +79,16 @@ class EdgeWeightedGraph:
         :rtype: EdgeWeightedGraph
 
         """
-        g = EdgeWeightedGraph(stream.readInt())
-        E = stream.readInt()
-        if E < 0:
-            raise IllegalArgumentException("Number of edges must be nonnegative")
-        for _ in range(E):
-            v = stream.readInt()
-            w = stream.readInt()
-            g._validate_vertex(v)
-            g._validate_vertex(w)
-            weight = stream.readFloat()
+        V, tails, heads, weights = read_edge_list(
+            stream, weighted=True, error=IllegalArgumentException
+        )
+        g = EdgeWeightedGraph(V)
+        adj = g._adj
+        for v, w, weight in zip(tails, heads, weights):
             e = Edge(v, w, weight)
-            g.add_edge(e)
+            adj[v].add(e)
+            adj[w].add(e)
+        g._E = len(tails)
         return g
 
     def add_edge(self, e):
@@ -4,6 +4,7 @@
 
 from itu.algs4.fundamentals.bag import Bag
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.edge_list import read_edge_list
 
 
 class Graph:
@@ -39,6 +40,7 @@ class Graph:
         self._V = V  # number of vertices
         self._E = 0  # number of edges
         self._adj = []  # adjacency lists
+        self._listeners = []  # functions called after each add_edge(v, w)
 
         for _ in range(V):
             self._adj.append(Bag())  # Initialize all lists to empty bags.
@@ -48,6 +50,7 @@ class Graph:
         """Initializes a graph from the specified input stream. The format is
         the number of vertices V, followed by the number of edges E, followed
         by E pairs of vertices, with each entry separated by whitespace.
+        The edges are read and validated in bulk.
 
         :param stream: the input stream
         :returns: new graph from stream
@@ -56,20 +59,13 @@ class Graph:
         :raises ValueError: if the input stream is in the wrong format
 
         """
-        V = stream.readInt()  # read V
-        if V < 0:
-            raise ValueError("Number of vertices must be nonnegative")
+        V, tails, heads, _ = read_edge_list(stream)  # read and validate all edges
         g = Graph(V)  # construct this graph
-        E = stream.readInt()  # read E
-        if E < 0:
-            raise ValueError("Number of edges in a Graph must be nonnegative")
-        for _ in range(E):
-            # Add an edge
-            v = stream.readInt()  # read a vertex,
-            w = stream.readInt()  # read another vertex,
-            g._validateVertex(v)
-            g._validateVertex(w)
-            g.add_edge(v, w)  # and add edge connecting them.
+        adj = g._adj
+        for v, w in zip(tails, heads):
+            adj[v].add(w)  # add w to v's list
+            adj[w].add(v)  # add v to w's list
+        g._E = len(tails)
         return g
 
     @staticmethod
@@ -122,6 +118,17 @@ class Graph:
         self._adj[v].add(w)  # add w to v's list
         self._adj[w].add(v)  # add v to w's list
         self._E += 1
+        for listener in self._listeners:
+            listener(v, w)
+
+    def add_listener(self, listener):
+        """Registers a function that is called as listener(v, w) after every
+        call to add_edge(v, w), for example by IncrementalCC.
+
+        :param listener: the function to call
+
+        """
+        self._listeners.append(listener)
 
     def adj(self, v):
         """Returns the vertices adjacent to vertex v.
@@ -0,0 +1,158 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+import sys
+
+from itu.algs4.fundamentals.uf import WeightedQuickUnionUF
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.stdlib.instream import InStream
+
+
+class IncrementalCC:
+    """The IncrementalCC class represents a data type for keeping track of
+    the connected components of an undirected graph while edges are added
+    to it. It supports the same id, connected, count and size operations as
+    CC.
+
+    The component identifier of a connected component is one of the
+    vertices in the connected component: two vertices have the same
+    component identifier if and only if they are in the same connected
+    component. Unlike in CC, the identifier of a component may change when
+    an edge joins it with another component.
+
+    This implementation uses a WeightedQuickUnionUF over the vertices,
+    which is kept up to date by a listener on the graph: every call to
+    add_edge() on the graph merges the components of the two endpoints.
+    The constructor takes time proportional to V + E log V, where V is the
+    number of vertices and E is the number of edges. Afterwards, add_edge()
+    and the id, connected and size operations take logarithmic time, and
+    the count operation takes constant time.
+
+    """
+
+    def __init__(self, G):
+        """Computes the connected components of the undirected graph G, and
+        keeps them up to date as edges are added to G.
+
+        :param G: the undirected graph
+
+        """
+        self._G = G
+        self._uf = WeightedQuickUnionUF(G.V())
+        self._union_all((v, w) for v in range(G.V()) for w in G.adj(v) if v < w)
+        self._listener = self._uf.union
+        G.add_listener(self._listener)
+
+    def _union_all(self, edges):
+        """Merges the components of the endpoints of every edge.
+
+        :param edges: the edges, as pairs of vertices
+
+        """
+        union = self._uf.union
+        for v, w in edges:
+            union(v, w)
+
+    def add_edge(self, v, w):
+        """Adds the undirected edge v-w to the graph, and merges the
+        components of v and w.
+
+        :param v: one vertex in the edge
+        :param w: the other vertex in the edge
+        :raises ValueError: unless both 0 <= v < V and 0 <= w < V
+
+        """
+        self._G._validateVertex(v)
+        self._G._validateVertex(w)
+        self._G.add_edge(v, w)
+
+    def add_edges(self, edges):
+        """Adds a batch of undirected edges to the graph, and merges the
+        components of their endpoints. This is faster than calling add_edge()
+        for each edge: all edges are validated first, then added to the
+        adjacency lists and merged in two tight loops. If any edge is
+        invalid, no edge is added. Other listeners of the graph are still
+        called for every edge.
+
+        :param edges: the edges to add, as pairs of vertices
+        :raises ValueError: unless 0 <= v < V for every endpoint v
+
+        """
+        G = self._G
+        edges = list(edges)
+        for v, w in edges:
+            G._validateVertex(v)
+            G._validateVertex(w)
+        adj = G._adj
+        for v, w in edges:
+            adj[v].add(w)
+            adj[w].add(v)
+        G._E += len(edges)
+        self._union_all(edges)
+        for listener in G._listeners:
+            if listener is not self._listener:
+                for v, w in edges:
+                    listener(v, w)
+
+    def id(self, v):
+        """Returns the component id of the connected component containing
+        vertex v.
+
+        :param v: the vertex
+        :returns: the component id of the connected component containing vertex v
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        return self._uf.find(v)
+
+    def size(self, v):
+        """Returns the number of vertices in the connected component containing
+        vertex v.
+
+        :param v: the vertex
+        :returns: the number of vertices in the connected component containing vertex v
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        return self._uf.size(v)
+
+    def count(self):
+        """Returns the number of connected components in the graph.
+
+        :returns: the number of connected components in the graph
+
+        """
+        return self._uf.count()
+
+    def connected(self, v, w):
+        """Returns true if vertices v and w are in the same connected
+        component.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: True if vertices v and w are in the same connected component,
+                  False otherwise
+        :raises ValueError: unless 0 <= v < V
+        :raises ValueError: unless 0 <= w < V
+
+        """
+        return self._uf.connected(v, w)
+
+
+def main():
+    """Reads a graph from the input file, then reads pairs of vertices from
+    the second input file, adds each pair as an edge and prints the number of
+    components after every edge."""
+    if len(sys.argv) > 2:
+        G = Graph.from_stream(InStream(sys.argv[1]))
+        cc = IncrementalCC(G)
+        print("{} components".format(cc.count()))
+        edges = InStream(sys.argv[2]).readAllInts()
+        for v, w in zip(edges[0::2], edges[1::2]):
+            cc.add_edge(v, w)
+            print("{}-{}: {} components".format(v, w, cc.count()))
+
+
+if __name__ == "__main__":
+    main()
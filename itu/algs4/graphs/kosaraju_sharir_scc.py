@@ -4,7 +4,7 @@
 
 """
  *  Execution:    python kosaraju_sharir_scc.py filename.txt
- *  Dependencies: Digraph TransitiveClosure InStream DepthFirstOrder
+ *  Dependencies: Digraph InStream DepthFirstOrder
  *  Data files:   https:#algs4.cs.princeton.edu/42digraph/tinyDG.txt
  *                https:#algs4.cs.princeton.edu/42digraph/mediumDG.txt
  *                https:#algs4.cs.princeton.edu/42digraph/largeDG.txt
@@ -29,7 +29,7 @@ from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.queue import Queue
 from itu.algs4.graphs.depth_first_order import DepthFirstOrder
 from itu.algs4.graphs.digraph import Digraph
-from itu.algs4.graphs.transitive_closure import TransitiveClosure
+from itu.algs4.graphs.nonrecursive_dfs import reach
 from itu.algs4.stdlib.instream import InStream
 
 
@@ -48,23 +48,19 @@ class KosarajuSharirSCC:
         # compute reverse postorder of reverse graph
         dfo = DepthFirstOrder(G.reverse())
 
-        # run DFS on G, using reverse postorder to guide calculation
-        for v in dfo.reverse_post():
+        # run DFS on G, using reverse postorder to guide calculation; the
+        # postorder is reversed in a list, which is faster than reverse_post()
+        order = list(dfo.post())
+        order.reverse()
+        for v in order:
             if not self._marked[v]:
-                self._dfs(G, v)
+                for w in reach(G, v, self._marked):
+                    self._id[w] = self._count
                 self._count += 1
 
         # check that id[] gives strong components
         assert self._check(G)
 
-    # DFS on graph G
-    def _dfs(self, G, v):
-        self._marked[v] = True
-        self._id[v] = self._count
-        for w in G.adj(v):
-            if not self._marked[w]:
-                self._dfs(G, w)
-
     """
      * Returns the number of strong components.
      * @return the number of strong components
@@ -100,14 +96,36 @@ class KosarajuSharirSCC:
         return self._id[v]
 
     # does the id[] array contain the strongly connected components?
+    # (takes time proportional to V + E, so that TransitiveClosure can use
+    # this class on large digraphs)
     def _check(self, G):
-        tc = TransitiveClosure(G)
+        # every edge stays in its component or goes to one with a smaller id,
+        # so no two components can reach each other
         for v in range(G.V()):
-            for w in range(G.V()):
-                if self.strongly_connected(v, w) != (
-                    tc.reachable(v, w) and tc.reachable(w, v)
-                ):
+            for w in G.adj(v):
+                if self._id[v] < self._id[w]:
                     return False
+
+        # every component is strongly connected: a search from its first
+        # vertex that stays inside it reaches all of its vertices, both in G
+        # and in the reverse of G
+        for H in (G, G.reverse()):
+            marked = [False] * G.V()
+            searches = 0
+            for s in range(G.V()):
+                if marked[s]:
+                    continue
+                searches += 1
+                marked[s] = True
+                stack = [s]
+                while stack:
+                    v = stack.pop()
+                    for w in H.adj(v):
+                        if not marked[w] and self._id[w] == self._id[s]:
+                            marked[w] = True
+                            stack.append(w)
+            if searches != self._count:
+                return False
         return True
 
     # throw an IllegalArgumentException unless 0 <= v < V
@@ -1,7 +1,8 @@
+import random
 import sys
 
 from itu.algs4.fundamentals.queue import Queue
-from itu.algs4.fundamentals.uf import WeightedQuickUnionUF
+from itu.algs4.fundamentals.uf import WeightedQuickUnionUF, find_root, link_roots
 from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
 from itu.algs4.sorting.min_pq import MinPQ
 from itu.algs4.stdlib.instream import InStream
@@ -27,17 +28,32 @@ class KruskalMST:
     weight method takes constant time and the edges method takes time
     proportional to V.
 
+    With presort=True, the edges are not inserted one at a time into a
+    MinPQ, but sorted once by weight with the built-in sort, and the
+    union-find of ArrayUF (find_root() and link_roots() of the uf module) is
+    run on plain lists, without validation or method calls. This has the
+    same order of growth, but is several times faster. Both versions stop
+    as soon as V-1 edges have been accepted.
+
     """
 
-    def __init__(self, G):
+    def __init__(self, G, presort=False):
         """Computes a minimum spanning tree (or forest) of an edge-weighted
         graph.
 
         :param G: the edge-weighted graph
+        :param presort: if True, sort the edges by weight once instead of
+                        using a priority queue
 
         """
         self._weight = 0
         self._mst = Queue()
+        if presort:
+            edges = _EdgeArrays(G)
+            order = sorted(range(len(edges.weight)), key=edges.weight.__getitem__)
+            self._add_lightest(edges, order, list(range(G.V())), [0] * G.V(), G.V() - 1)
+            return
+
         pq = MinPQ()
 
         for e in G.edges():
@@ -53,6 +69,34 @@ class KruskalMST:
                 self._mst.enqueue(e)
                 self._weight += e.weight()
 
+    def _add_lightest(self, edges, order, parent, rank, target):
+        """Adds the edges that connect two components, in the given order,
+        until the tree has target edges.
+
+        :param edges: the edge arrays of the graph
+        :param order: the indices of the edges, sorted by weight
+        :param parent: the parent links of the union-find
+        :param rank: the ranks of the union-find
+        :param target: the number of edges in a spanning tree
+        :return: True if the tree has target edges
+
+        """
+        mst = self._mst
+        if mst.size() >= target:
+            return True
+        weights, tail, head, edge = edges.weight, edges.v, edges.w, edges.edge
+        for i in order:
+            v = find_root(parent, tail[i])
+            w = find_root(parent, head[i])
+            if v == w:
+                continue
+            link_roots(parent, rank, v, w)
+            mst.enqueue(edge[i])
+            self._weight += weights[i]
+            if mst.size() >= target:
+                return True
+        return False
+
     def edges(self):
         """Returns the edges in a minimum spanning tree (or forest).
 
@@ -71,6 +115,93 @@ class KruskalMST:
         return self._weight
 
 
+class FilterKruskalMST(KruskalMST):
+    """The FilterKruskalMST class represents a data type for computing a
+    minimum spanning tree in an edge-weighted graph, with the same
+    interface as KruskalMST.
+
+    This implementation uses the filter-Kruskal algorithm. Like quicksort,
+    it partitions the edges around a random pivot weight, and first builds
+    the forest of the lighter edges. Before the heavier edges are
+    processed, the ones whose endpoints are already connected are
+    discarded, so most heavy edges of a dense graph are never sorted.
+    Partitions of at most threshold edges are sorted directly. For random
+    edge weights, the expected running time is proportional to
+    E + V log V log(E/V).
+
+    """
+
+    def __init__(self, G, threshold=1024):
+        """Computes a minimum spanning tree (or forest) of an edge-weighted
+        graph.
+
+        :param G: the edge-weighted graph
+        :param threshold: the largest partition that is sorted directly
+
+        """
+        self._weight = 0
+        self._mst = Queue()
+        parent = list(range(G.V()))
+        rank = [0] * G.V()
+        target = G.V() - 1
+        # the partitions still to be processed, as lists of edge indices,
+        # the lightest on top, with flags that tell whether all their edges
+        # have the same weight and whether they have been filtered since the
+        # last edges were merged
+        edges = _EdgeArrays(G)
+        weights, tail, head = edges.weight, edges.v, edges.w
+        stack = [(list(range(len(weights))), False, True)]
+        while stack:
+            part, same, filtered = stack.pop()
+            if not filtered:
+                part = [
+                    i
+                    for i in part
+                    if find_root(parent, tail[i]) != find_root(parent, head[i])
+                ]
+            if same or len(part) <= threshold:
+                if not same:
+                    part.sort(key=weights.__getitem__)
+                if self._add_lightest(edges, part, parent, rank, target):
+                    return
+                continue
+            pivot = weights[part[random.randrange(len(part))]]
+            light = []
+            equal = []
+            heavy = []
+            for i in part:
+                weight = weights[i]
+                if weight < pivot:
+                    light.append(i)
+                elif weight > pivot:
+                    heavy.append(i)
+                else:
+                    equal.append(i)
+            stack.append((heavy, False, False))
+            stack.append((equal, True, False))
+            stack.append((light, False, True))
+
+
+class _EdgeArrays:
+    # the edges of a graph in parallel lists of weights, endpoints v < w and
+    # Edge objects, indexed by edge number; self-loops are left out, since
+    # they are never in a spanning forest. Sorting the indices by weight
+    # creates no tuple per edge for the garbage collector to track.
+    def __init__(self, G):
+        self.weight = []
+        self.v = []
+        self.w = []
+        self.edge = []
+        for v in range(G.V()):
+            for e in G.adj(v):
+                w = e.other(v)
+                if w > v:
+                    self.weight.append(e.weight())
+                    self.v.append(v)
+                    self.w.append(w)
+                    self.edge.append(e)
+
+
 def main():
     """Creates an edge-weighted graph from an input file, runs Kruskal's
     algorithm on it, and prints the edges of the MST and the sum of the edge
@@ -0,0 +1,166 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements depth-first search with an explicit stack instead of
+recursion. It is shared by the depth-first graph clients in this package,
+such as DepthFirstSearch, CC, DirectedDFS, DepthFirstOrder, DirectedCycle,
+KosarajuSharirSCC and Bipartite.
+
+The stack holds one adjacency iterator per vertex on the current path, so
+the search visits the vertices and edges in exactly the same order as the
+recursive version in the book: a vertex is marked when it is first reached,
+the edges out of it are examined in the order given by adj(), and the
+search returns to it once all of its descendants are finished. Since no
+Python frame is created per vertex, long paths do not run into the
+recursion limit.
+
+The function reach() is the fast path for clients that only need to know
+which vertices are reached, and orders() the one for clients that only need
+the preorder and postorder. Both run the search in a single loop, with no
+function call per edge. The generator walk() reports every step of the
+search to the client as a (event, v, x) tuple:
+
+    (PREORDER, v, x)   vertex v has just been marked; x is the item of
+                       adj() that led to v, or None if v is the source
+    (NONTREE, v, x)    the item x of adj(v) leads to a vertex that was
+                       already marked
+    (POSTORDER, v, None)  all vertices reachable from v have been finished
+
+Clients that are done early, for example after finding a cycle, simply
+stop iterating over the generator.
+
+"""
+
+PREORDER = 0
+NONTREE = 1
+POSTORDER = 2
+
+
+def reach(G, s, marked, edge_to=None):
+    """Marks the vertices reachable from s that are not yet marked, using
+    depth-first search.
+
+    :param G: the graph or digraph
+    :param s: the source vertex, which must not be marked yet
+    :param marked: marked[v] = has vertex v been marked? (updated in place)
+    :param edge_to: if given, edge_to[w] is set to the vertex from which w
+                    was reached, for every newly marked vertex w except s
+    :returns: the newly marked vertices in depth-first preorder, as a list
+
+    """
+    adj = G.adj
+    marked[s] = True
+    order = [s]
+    stack = [iter(adj(s))]
+    # bound methods, looked up once rather than once per vertex
+    visit = order.append
+    push = stack.append
+    pop = stack.pop
+    if edge_to is None:
+        while stack:
+            for w in stack[-1]:
+                if not marked[w]:
+                    marked[w] = True
+                    visit(w)
+                    push(iter(adj(w)))
+                    break
+            else:
+                pop()
+        return order
+    path = [s]  # the vertices whose adjacency iterators are on the stack
+    while stack:
+        for w in stack[-1]:
+            if not marked[w]:
+                marked[w] = True
+                edge_to[w] = path[-1]
+                visit(w)
+                path.append(w)
+                push(iter(adj(w)))
+                break
+        else:
+            pop()
+            path.pop()
+    return order
+
+
+def orders(G, s, marked, head=None):
+    """Marks the vertices reachable from s that are not yet marked, using
+    depth-first search, and returns them in preorder and in postorder.
+
+    :param G: the graph, digraph or edge-weighted digraph
+    :param s: the source vertex, which must not be marked yet
+    :param marked: marked[v] = has vertex v been marked? (updated in place)
+    :param head: if the items of adj() are edges, a function that returns
+                 the vertex an edge points to, e.g. DirectedEdge.to_vertex
+    :returns: the newly marked vertices in preorder and in postorder, as a
+              pair of lists
+
+    """
+    adj = G.adj
+    marked[s] = True
+    pre = [s]
+    post = []
+    path = [s]  # the vertices whose adjacency iterators are on the stack
+    # the stack holds iterators over the heads of the edges out of each vertex
+    stack = [iter(adj(s)) if head is None else map(head, adj(s))]
+    visit = pre.append
+    finish = post.append
+    enter = path.append
+    leave = path.pop
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        for w in stack[-1]:
+            if not marked[w]:
+                marked[w] = True
+                visit(w)
+                enter(w)
+                push(iter(adj(w)) if head is None else map(head, adj(w)))
+                break
+        else:
+            pop()
+            finish(leave())
+    return pre, post
+
+
+def walk(G, s, marked, edge_to=None, head=None):
+    """Runs a depth-first search from s over the vertices that are not yet
+    marked, and yields its events in the order in which the recursive search
+    would see them.
+
+    :param G: the graph, digraph or edge-weighted digraph
+    :param s: the source vertex, which must not be marked yet
+    :param marked: marked[v] = has vertex v been marked? (updated in place)
+    :param edge_to: if given, edge_to[w] is set to the item of adj() that led
+                    to w (for unweighted graphs, the vertex it was reached
+                    from), for every newly marked vertex w except s
+    :param head: if the items of adj() are edges, a function that returns
+                 the vertex an edge points to, e.g. DirectedEdge.to_vertex
+    :returns: a generator of (event, v, x) tuples, see the module documentation
+
+    """
+    adj = G.adj
+    marked[s] = True
+    yield PREORDER, s, None
+    path = [s]  # the vertices whose adjacency iterators are on the stack
+    stack = [iter(adj(s))]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        v = path[-1]
+        for x in stack[-1]:
+            w = x if head is None else head(x)
+            if not marked[w]:
+                marked[w] = True
+                if edge_to is not None:
+                    edge_to[w] = v if head is None else x
+                path.append(w)
+                push(iter(adj(w)))
+                yield PREORDER, w, x
+                break
+            yield NONTREE, v, x
+        else:
+            pop()
+            path.pop()
+            yield POSTORDER, v, None
@@ -0,0 +1,226 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a data type for solving the all-pairs shortest
+paths problem in edge-weighted digraphs where the edge weights are
+nonnegative, by running Dijkstra's algorithm from every vertex in a pool of
+worker processes."""
+
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from heapq import heappop, heappush
+from multiprocessing import Pool
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs import binary_graph
+from itu.algs4.graphs.csr_graph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.stdlib import instream
+
+_graph = None  # the graph of a worker process, set by _load()
+
+
+def _load(filename):
+    # runs once in each worker: maps the shared graph file into memory
+    global _graph
+    _graph = binary_graph.load(filename)
+
+
+def _distances(s, G=None):
+    """Runs Dijkstra's algorithm from s directly on the arrays of a CSR
+    edge-weighted digraph.
+
+    :param s: the source vertex
+    :param G: the CSR edge-weighted digraph; the graph of the worker process
+              if None
+    :return: the distances from s to every vertex, as bytes of doubles
+
+    """
+    if G is None:
+        G = _graph
+    offsets, targets, weights = G._offsets, G._targets, G._weights
+    dist_to = [float("inf")] * G.V()
+    dist_to[s] = 0.0
+    pq = [(0.0, s)]
+    while pq:
+        d, v = heappop(pq)
+        if d > dist_to[v]:
+            continue  # v was already removed with a smaller distance
+        lo = offsets[v]
+        hi = offsets[v + 1]
+        for w, weight in zip(targets[lo:hi], weights[lo:hi]):
+            dist = d + weight
+            if dist < dist_to[w]:
+                dist_to[w] = dist
+                heappush(pq, (dist, w))
+    return array("d", dist_to).tobytes()
+
+
+class ParallelAllPairsSP:
+    """The ParallelAllPairsSP class represents a data type for solving the
+    all-pairs shortest paths problem in edge-weighted digraphs where the edge
+    weights are nonnegative.
+
+    Unlike DijkstraAllPairsSP, which keeps a DijkstraSP object with its
+    arrays of DirectedEdge references for every vertex, this implementation
+    only stores the V-by-V matrix of distances, as a flat array of doubles.
+    The digraph is written once to a temporary file in the binary graph
+    format (see binary_graph.py), which every worker process maps into
+    memory, so the processes share one read-only copy of it. The workers run
+    Dijkstra's algorithm from the vertices in parallel, directly on the
+    compressed sparse row arrays, and send back one row of distances per
+    vertex.
+
+    If a filename is given, the rows are written to that file as they
+    arrive, and the matrix is afterwards read through a memory map instead
+    of being held in memory.
+
+    The constructor takes time proportional to V (E log V) divided by the
+    number of processes, and uses space proportional to V^2 (or V + E, if
+    the rows go to a file). Afterwards, dist() and has_path() take constant
+    time. The path() method runs a single-pair search with DijkstraSP.
+
+    """
+
+    def __init__(self, G, processes=None, filename=None):
+        """Computes the lengths of the shortest paths between all pairs of
+        vertices in the edge-weighted digraph G.
+
+        :param G: the edge-weighted digraph (or CSR edge-weighted digraph)
+        :param processes: the number of worker processes; os.cpu_count() if
+                          None, and no pool at all if 1
+        :param filename: if given, the file to which the rows of the
+                         distance matrix are written
+        :raises IllegalArgumentException: if an edge weight is negative
+
+        """
+        if not isinstance(G, CSREdgeWeightedDigraph):
+            G = CSREdgeWeightedDigraph.from_graph(G)
+        if G.E() > 0 and min(G._weights) < 0:
+            raise IllegalArgumentException("digraph has an edge of negative weight")
+        self._G = G
+        self._V = G.V()
+        if filename is None:
+            self._dist = array("d")
+            self._solve(processes, self._dist.frombytes)
+        else:
+            with open(filename, "wb") as f:
+                self._solve(processes, f.write)
+            with open(filename, "rb") as f:
+                if self._V > 0:
+                    m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._dist = memoryview(m).cast("d")
+                else:
+                    self._dist = array("d")
+
+    def _solve(self, processes, write):
+        """Computes the rows of the distance matrix in order of their source
+        vertex, and passes each one to write().
+
+        :param processes: the number of worker processes, or None
+        :param write: the function that stores a row
+
+        """
+        if processes == 1 or self._V <= 1:
+            for s in range(self._V):
+                write(_distances(s, self._G))
+            return
+        fd, path = tempfile.mkstemp(suffix=".graph")
+        os.close(fd)
+        try:
+            binary_graph.save(self._G, path)
+            with Pool(processes, initializer=_load, initargs=(path,)) as pool:
+                chunksize = max(1, self._V // (4 * (processes or os.cpu_count() or 1)))
+                for row in pool.imap(_distances, range(self._V), chunksize):
+                    write(row)
+        finally:
+            os.remove(path)
+
+    def dist(self, source, target):
+        """Returns the length of a shortest path from the source vertex to the
+        target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: the length of a shortest path from the source vertex to the
+                  target vertex; float('inf') if no such path
+
+        """
+        self._validateVertex(source)
+        self._validateVertex(target)
+        return self._dist[source * self._V + target]
+
+    def has_path(self, source, target):
+        """Is there a path from the source vertex to the target vertex?
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: True if there is a path from the source to the target, and
+                  False otherwise
+
+        """
+        return self.dist(source, target) < float("inf")
+
+    def path(self, source, target):
+        """Returns a shortest path from the source vertex to the target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: a shortest path from the source vertex to the target vertex
+                  as an iterable of edges, and None if no such path
+
+        """
+        self._validateVertex(source)
+        self._validateVertex(target)
+        return DijkstraSP(self._G, source, lazy=True, target=target).path_to(target)
+
+    def row(self, source):
+        """Returns the lengths of the shortest paths from the source vertex to
+        every vertex.
+
+        :param source: the source vertex
+        :returns: the row of the distance matrix for the source vertex
+        :rtype: memoryview
+
+        """
+        self._validateVertex(source)
+        return memoryview(self._dist)[source * self._V : (source + 1) * self._V]
+
+    def to_numpy(self):
+        """Returns the distance matrix as a V-by-V NumPy array that shares
+        memory with this object. Requires NumPy.
+
+        :returns: the distance matrix
+        :rtype: numpy.ndarray
+
+        """
+        import numpy
+
+        return numpy.frombuffer(self._dist, dtype=numpy.float64).reshape(
+            self._V, self._V
+        )
+
+    # throw a ValueError unless 0 <= v < V
+    def _validateVertex(self, v):
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, (V - 1)))
+
+
+if __name__ == "__main__":
+    # Create stream from file or the standard input,
+    # depending on whether a file name was passed.
+    stream = sys.argv[1] if len(sys.argv) > 1 else None
+
+    g = EdgeWeightedDigraph.from_stream(instream.InStream(stream))
+    all_pairs = ParallelAllPairsSP(g)
+
+    # Print the shortest path distances between all possible pairs of vertices.
+    for source in range(g.V()):
+        for target in range(g.V()):
+            print(all_pairs.dist(source, target))
@@ -6,7 +6,8 @@ import sys
 
 from itu.algs4.fundamentals.queue import Queue
 from itu.algs4.fundamentals.uf import UF
-from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.sorting.bucket_queue import BucketQueue
+from itu.algs4.sorting.index_min_pq import DaryIndexMinPQ
 
 
 class PrimMST:
@@ -17,16 +18,21 @@ class PrimMST:
     spanning trees in each connected component. The weight() method returns the
     weight of a minimum spanning tree and the edges() method returns its edges.
 
-    This implementation uses Prim's algorithm with an indexed binary
-    heap. The constructor takes time proportional to E log V and extra
-    space not including the graph) proportional to V, where V is the
-    number of vertices and E is the number of edges. Afterwards, the
-    weight() method takes constant time and the edges() method takes
-    time proportional to V.
+    This implementation uses Prim's algorithm with an indexed 4-ary
+    heap (a DaryIndexMinPQ without argument validation). The constructor
+    takes time proportional to E log V and extra space (not including the
+    graph) proportional to V, where V is the number of vertices and E is
+    the number of edges. Afterwards, the weight() method takes constant
+    time and the edges() method takes time proportional to V.
+
+    If all edge weights are integers (such as 3 or 3.0) between 0 and
+    BUCKET_QUEUE_MAX_WEIGHT, it uses a BucketQueue instead, where every
+    operation except delete-the-minimum takes constant time.
 
     """
 
     FLOATING_POINT_EPSILON = 1e-12
+    BUCKET_QUEUE_MAX_WEIGHT = 1024
 
     def __init__(self, G):
         """Compute a minimum spanning tree (or forest) of an edge-weighted
@@ -42,7 +48,7 @@ class PrimMST:
         self._marked = [
             False
         ] * G.V()  # self._marked[v] = True if v on tree, False otherwise
-        self._pq = IndexMinPQ(G.V())
+        self._pq = self._priority_queue(G)
 
         for v in range(G.V()):
             self._dist_to[v] = math.inf
@@ -54,6 +60,22 @@ class PrimMST:
         # check optimality conditions
         assert self._check(G)
 
+    def _priority_queue(self, G):
+        # a bucket queue if all edge weights are small nonnegative integers,
+        # and a 4-ary heap otherwise
+        max_weight = 0
+        for v in range(G.V()):
+            for e in G.adj(v):
+                weight = e.weight()
+                if not (
+                    0 <= weight <= PrimMST.BUCKET_QUEUE_MAX_WEIGHT
+                    and float(weight).is_integer()
+                ):
+                    return DaryIndexMinPQ(G.V(), validate=False)
+                if weight > max_weight:
+                    max_weight = weight
+        return BucketQueue(G.V(), int(max_weight), validate=False)
+
     # run Prim's algorithm in graph G, starting from vertex s
     def _prim(self, G, s):
         self._dist_to[s] = 0.0
@@ -8,6 +8,7 @@ For more information, see chapter 4.2 of the book.
 
 """
 
+from itu.algs4.graphs.csr_graph import CSRDigraph
 from itu.algs4.graphs.depth_first_order import DepthFirstOrder
 from itu.algs4.graphs.digraph import Digraph
 from itu.algs4.graphs.directed_cycle import DirectedCycle
@@ -43,7 +44,7 @@ class Topological:
         """
         self._order = None
 
-        if isinstance(digraph, Digraph):
+        if isinstance(digraph, (Digraph, CSRDigraph)):
             finder = DirectedCycle(digraph)
         else:
             finder = EdgeWeightedDirectedCycle(digraph)
@@ -4,15 +4,16 @@
 
 """
  *  Execution:    python transitive_closure.py filename.txt
- *  Dependencies: Digraph DirectedDFS
+ *  Dependencies: Digraph KosarajuSharirSCC
  *  Data files:   https:#algs4.cs.princeton.edu/42digraph/tinyDG.txt
  *
  *  Compute transitive closure of a digraph and support
  *  reachability queries.
  *
- *  Preprocessing time: O(V(E + V)) time.
+ *  Preprocessing time: O(V + E + FV/w) time, where F is the number of
+ *  edges between strong components and w is the word size.
  *  Query time: O(1).
- *  Space: O(V^2).
+ *  Space: O(V^2) bits.
  *
  *  % python transitive_closure.py tinyDG.txt
  *         0  1  2  3  4  5  6  7  8  9 10 11 12
@@ -36,20 +37,61 @@ import sys
 
 from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.graphs.digraph import Digraph
-from itu.algs4.graphs.directed_dfs import DirectedDFS
+from itu.algs4.graphs.kosaraju_sharir_scc import KosarajuSharirSCC
 from itu.algs4.stdlib.instream import InStream
 
 
 class TransitiveClosure:
     """
     * Computes the transitive closure of the digraph G.
+    *
+    * All vertices of a strong component reach the same vertices, so the
+    * closure is computed on the condensation of G: the DAG with one vertex
+    * per strong component. The set of vertices reachable from a component
+    * is a bitset (bit w is set if w is reachable), computed as a Python int
+    * from the union of its own vertices and the bitsets of the components
+    * its edges lead to, and then stored as bytes. KosarajuSharirSCC
+    * numbers the components so that every edge between two components goes
+    * to the smaller id, so the bitsets are computed in increasing order of
+    * id.
+    *
+    * This takes one bitwise or of V bits per edge between components, and
+    * the closure takes at most V^2 / 8 bytes. Apart from the closure, only
+    * a list of vertices per component and the bitset of one component are
+    * held while it is computed.
+    *
     * @param G the digraph
     """
 
     def __init__(self, G):
-        self._tc = [None] * G.V()  # tc[v] = reachable from v
+        scc = KosarajuSharirSCC(G)
+        self._V = G.V()
+        self._id = [scc.id(v) for v in range(G.V())]  # id[v] = component of v
+        size = (G.V() + 7) // 8
+        members = [[] for _ in range(scc.count())]
+        successors = [set() for _ in range(scc.count())]
         for v in range(G.V()):
-            self._tc[v] = DirectedDFS(G, v)
+            c = self._id[v]
+            members[c].append(v)
+            for w in G.adj(v):
+                if self._id[w] != c:
+                    successors[c].add(self._id[w])
+
+        rows = []  # rows[c] = vertices reachable from component c
+        for c in range(scc.count()):
+            # only the bitset of the component being computed is held as bytes
+            bits = bytearray(size)
+            for v in members[c]:
+                bits[v >> 3] |= 1 << (v & 7)
+            members[c] = None
+            row = int.from_bytes(bits, "little")
+            for d in successors[c]:
+                row |= rows[d]
+            rows.append(row)
+        # replace the ints one at a time, so they are freed as we go
+        for c in range(len(rows)):
+            rows[c] = rows[c].to_bytes(size, "little")
+        self._rows = rows
 
     """
      * Is there a directed path from vertex v to vertex w in the digraph?
@@ -64,11 +106,11 @@ class TransitiveClosure:
     def reachable(self, v, w):
         self._validate_vertex(v)
         self._validate_vertex(w)
-        return self._tc[v].is_marked(w)
+        return self._rows[self._id[v]][w >> 3] >> (w & 7) & 1 == 1
 
     # throw an IllegalArgumentException unless 0 <= v < V
     def _validate_vertex(self, v):
-        V = len(self._tc)
+        V = self._V
         if v < 0 or v >= V:
             raise IllegalArgumentException(
                 "vertex {} is not between 0 and {}".format(v, V - 1)
@@ -0,0 +1,239 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+from itu.algs4.errors.errors import IllegalArgumentException, NoSuchElementException
+
+
+class BucketQueue:
+    """The BucketQueue class represents an indexed priority queue of small
+    nonnegative integer keys, with the same operations as IndexMinPQ.
+
+    This implementation uses a bucket queue: an array with one set of
+    indices for every key from 0 to max_key, and a cursor below which all
+    buckets are empty. Unlike RadixHeap, it does not require the keys to be
+    removed in increasing order, so it can be used for Prim's algorithm,
+    where the keys are edge weights (see also RadixHeap). The insert, change-key, decrease-key,
+    increase-key and delete operations take constant time, and
+    delete-the-minimum takes time proportional to the distance the cursor
+    moves up, which is at most max_key. Construction takes time
+    proportional to max_n + max_key.
+
+    With validate=False, the arguments are not checked, as in
+    DaryIndexMinPQ.
+
+    """
+
+    def __init__(self, max_n, max_key, validate=True):
+        """Initializes an empty bucket queue with indices between 0 and
+        max_n - 1 and keys between 0 and max_key.
+
+        :param max_n: the keys on this priority queue are indices from 0 to max_n - 1
+        :param max_key: the largest key
+        :param validate: if False, do not check the arguments of any operation
+        :raises IllegalArgumentException: if max_n < 0 or max_key < 0
+
+        """
+        if max_n < 0 or max_key < 0:
+            raise IllegalArgumentException("max_n and max_key must be nonnegative")
+        self.max_n = max_n
+        self.max_key = max_key
+        self.n = 0
+        self._validate = validate
+        self._cursor = 0  # every bucket below the cursor is empty
+        self._buckets = [set() for _ in range(max_key + 1)]
+        self.keys = [-1] * max_n  # the key of every index, -1 if none
+
+    def _check(self, i, key, present):
+        # raise an exception unless i is a valid index that is (not) on the
+        # priority queue, and key is a valid key
+        if i < 0 or i >= self.max_n:
+            raise IllegalArgumentException("index is not within range")
+        if present and self.keys[i] == -1:
+            raise NoSuchElementException("index is not in the priority queue")
+        if not present and self.keys[i] != -1:
+            raise IllegalArgumentException("index is already in the priority queue")
+        if key is not None and (key != int(key) or key < 0 or key > self.max_key):
+            raise IllegalArgumentException(
+                "key {} is not an integer between 0 and {}".format(key, self.max_key)
+            )
+
+    def insert(self, i, key):
+        """Associates key with index i.
+
+        :param i: an index
+        :param key: the key to associate with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if there already is an item associated with index i
+        :raises IllegalArgumentException: unless key is an integer between 0 and max_key
+
+        """
+        if self._validate:
+            self._check(i, key, False)
+        key = int(key)
+        self._buckets[key].add(i)
+        self.keys[i] = key
+        self.n += 1
+        if key < self._cursor:
+            self._cursor = key
+
+    def contains(self, i):
+        """Is i an index on this priority queue?
+
+        :param i: an index
+        :return: True if i is an index on this priority queue False otherwise
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+
+        """
+        if self._validate and (i < 0 or i >= self.max_n):
+            raise IllegalArgumentException("index is not within range")
+        return self.keys[i] != -1
+
+    def change_key(self, i, key):
+        """Change the key associated with index i to the specified value.
+
+        :param i: the index of the key to change
+        :param key: change the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: unless key is an integer between 0 and max_key
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, key, True)
+        self._move(i, int(key))
+
+    def _move(self, i, key):
+        # move index i from its bucket to the bucket of the given key
+        self._buckets[self.keys[i]].discard(i)
+        self._buckets[key].add(i)
+        self.keys[i] = key
+        if key < self._cursor:
+            self._cursor = key
+
+    def decrease_key(self, i, key):
+        """Decrease the key associated with index i to the specified value.
+
+        :param i: the index of the key to decrease
+        :param key: decrease the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key >= key_of(i)
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, key, True)
+            if self.keys[i] <= key:
+                raise IllegalArgumentException(
+                    "calling decrease_key() with given argument would not strictly decrease the key"
+                )
+        self._move(i, int(key))
+
+    def increase_key(self, i, key):
+        """Increase the key associated with index i to the specified value.
+
+        :param i: the index of the key to increase
+        :param key: increase the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key <= key_of(i)
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, key, True)
+            if self.keys[i] >= key:
+                raise IllegalArgumentException(
+                    "calling increase_key() with given argument would not strictly increase the key"
+                )
+        self._move(i, int(key))
+
+    def delete(self, i):
+        """Remove the key associated with index i.
+
+        :param i: the index of the key to remove
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, None, True)
+        self._buckets[self.keys[i]].discard(i)
+        self.keys[i] = -1
+        self.n -= 1
+
+    def _advance(self):
+        # move the cursor to the first nonempty bucket
+        if self.n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        buckets = self._buckets
+        cursor = self._cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self._cursor = cursor
+
+    def min_index(self):
+        """
+        Returns an index associated with a minimum key.
+        :return: an index associated with a minimum key
+        :rtype: int
+        :raises NoSuchElementException: if this priority queue is empty
+        """
+        self._advance()
+        return next(iter(self._buckets[self._cursor]))
+
+    def min_key(self):
+        """
+        Returns a minimum key.
+        :return: a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        """
+        self._advance()
+        return self._cursor
+
+    def del_min(self):
+        """
+        Removes a minimum key and returns its associated index.
+        :return: an index associated with a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+        """
+        self._advance()
+        i = self._buckets[self._cursor].pop()
+        self.keys[i] = -1
+        self.n -= 1
+        return i
+
+    def is_empty(self):
+        """Returns True if this priority queue is empty.
+
+        :return: True if this priority queue is empty False otherwise
+        :rtype: bool
+
+        """
+        return self.n == 0
+
+    def size(self):
+        """Returns the number of keys on this priority queue.
+
+        :return: the number of keys on this priority queue
+        :rtype: int
+
+        """
+        return self.n
+
+    def __len__(self):
+        return self.n
+
+    def key_of(self, i):
+        """Returns the key associated with index i.
+
+        :param i: the index of the key to return
+        :return: the key associated with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, None, True)
+        return self.keys[i]
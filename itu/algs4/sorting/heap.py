@@ -2,68 +2,77 @@
 # See README.md for details
 # Python 3
 
-from itu.algs4.stdlib import stdio
-
 """
 The heap module provides a function for heapsorting an array.
 """
 
 
-def sort(pq):
+def sort(pq, lo=0, hi=None):
     """Rearranges the array in ascending order, using the natural order.
+    If lo and hi are given, only the subarray pq[lo..hi-1] is sorted, which
+    is how quicksort falls back to heapsort in introsort mode.
 
     :param pq: the array to be sorted
+    :param lo: the index of the first item to sort
+    :param hi: the index after the last item to sort; len(pq) if None
 
     """
-    n = len(pq)
+    if hi is None:
+        hi = len(pq)
+    n = hi - lo
+    off = lo - 1  # heap index k is at pq[off + k]
     for k in range(n // 2, 0, -1):
-        _sink(pq, k, n)
+        _sink(pq, k, n, off)
     while n > 1:
-        _exch(pq, 1, n)
+        _exch(pq, 1, n, off)
         n -= 1
-        _sink(pq, 1, n)
+        _sink(pq, 1, n, off)
 
 
-def _sink(pq, k, n):
+def _sink(pq, k, n, off=-1):
     """Moves item at index k down to a legal position on the heap.
 
     :param k: Index of the item to be moved
     :param n: Amount of items left on the heap
+    :param off: the offset of the heap in the array
 
     """
     while 2 * k <= n:
         j = 2 * k
-        if j < n and _less(pq, j, j + 1):
+        if j < n and _less(pq, j, j + 1, off):
             j += 1
-        if not _less(pq, k, j):
+        if not _less(pq, k, j, off):
             break
-        _exch(pq, k, j)
+        _exch(pq, k, j, off)
         k = j
 
 
-def _less(pq, i, j):
+def _less(pq, i, j, off=-1):
     """Check if item at index i is greater than item at index j on the heap.
-    Indices are "off-by-one" to support 1-based indexing.
+    Indices are "off-by-one" to support 1-based indexing: heap index i is at
+    pq[off + i], which is pq[i - 1] for a heap that starts at pq[0].
 
     :param pq: the heap
     :param i: index of the first item
     :param j: index of the second item
+    :param off: the offset of the heap in the array
     :return: True if item at index i is smaller than item at index j otherwise False
 
     """
-    return pq[i - 1] < pq[j - 1]
+    return pq[off + i] < pq[off + j]
 
 
-def _exch(pq, i, j):
+def _exch(pq, i, j, off=-1):
     """Exchanges the positions of items at index i and j on the heap. Indices
     are "off-by-one" to support 1-based indexing.
 
     :param pq: the heap
     :param i: index of the first item
     :param j: index of the second item
+    :param off: the offset of the heap in the array
 
     """
-    pq[i - 1], pq[j - 1] = pq[j - 1], pq[i - 1]
+    pq[off + i], pq[off + j] = pq[off + j], pq[off + i]
 
 
 def _show(pq):
@@ -79,6 +88,8 @@ def _show(pq):
 def main():
     """Reads in a sequence of strings from stdin heapsorts them, and prints the
     result in ascending order."""
+    from itu.algs4.stdlib import stdio
+
     a = stdio.readAllStrings()
     sort(a)
     _show(a)
@@ -2,6 +2,8 @@
 # See README.md for details
 # Python 3
 
+from array import array
+
 from itu.algs4.errors.errors import IllegalArgumentException, NoSuchElementException
 
 
@@ -146,7 +148,11 @@ class IndexMinPQ:
         index = self.qp[i]
         self._exch(index, self.n)
         self.n -= 1
-        self._sink(index)
+        if index <= self.n:
+            # the item moved into the hole may also be smaller than its parent
+            moved = self.pq[index]
+            self._swim(index)
+            self._sink(self.qp[moved])
         self.keys[i] = None
         self.qp[i] = -1
 
@@ -189,6 +195,26 @@ class IndexMinPQ:
         self.pq[self.n + 1] = -1
         return _min
 
+    def replace_min_key(self, key):
+        """Replaces a minimum key with the specified key, and returns its
+        associated index. The replaced key is at the root of the heap, so
+        sinking the new key restores the heap order whether it is larger or
+        smaller; this is faster than change_key(min_index(), key), for
+        instance in a multiway merge.
+
+        :param key: the new key of the index associated with a minimum key
+        :return: the index whose key was replaced
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+
+        """
+        if self.n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        i = self.pq[1]
+        self.keys[i] = key
+        self._sink(1)
+        return i
+
     def is_empty(self):
         """Returns True if this priority queue is empty.
 
@@ -254,9 +280,20 @@ class IndexMinPQ:
         :param k: Index of the item on the heap to be moved
 
         """
-        while k > 1 and self._greater(k // 2, k):
-            self._exch(k, k // 2)
+        # move a hole up instead of exchanging items, with the comparisons
+        # inlined
+        pq, qp, keys = self.pq, self.qp, self.keys
+        i = pq[k]
+        key = keys[i]
+        while k > 1:
+            j = pq[k // 2]
+            if not keys[j] > key:
+                break
+            pq[k] = j
+            qp[j] = k
             k = k // 2
+        pq[k] = i
+        qp[i] = k
 
     def _sink(self, k):
         """Moves item at index k down to a legal position on the heap.
@@ -264,14 +301,21 @@ class IndexMinPQ:
         :param k: Index of the item on the heap to be moved
 
         """
-        while 2 * k <= self.n:
-            j = 2 * k
-            if j < self.n and self._greater(j, j + 1):
+        pq, qp, keys, n = self.pq, self.qp, self.keys, self.n
+        i = pq[k]
+        key = keys[i]
+        j = 2 * k
+        while j <= n:
+            if j < n and keys[pq[j]] > keys[pq[j + 1]]:
                 j += 1
-            if not self._greater(k, j):
+            if not key > keys[pq[j]]:
                 break
-            self._exch(k, j)
+            pq[k] = pq[j]
+            qp[pq[k]] = k
             k = j
+            j = 2 * k
+        pq[k] = i
+        qp[i] = k
 
     def __iter__(self):
         """Iterates over all the items in this priority queue in ascending
@@ -283,6 +327,331 @@ class IndexMinPQ:
             yield copy.del_min()
 
 
+class DaryIndexMinPQ:
+    """The DaryIndexMinPQ class represents an indexed priority queue of
+    numeric keys, with the same operations as IndexMinPQ.
+
+    This implementation uses a d-ary heap: every node has up to d children,
+    so the heap has depth log_d n instead of log_2 n. Swimming up after an
+    insert or decrease-key is then cheaper, while sinking after a
+    delete-the-minimum compares up to d children per level. With d = 4 this
+    is faster for workloads with many decrease-key operations, such as
+    Dijkstra's and Prim's algorithms. The keys are stored as floats in an
+    array('d'), and the swim and sink operations move a hole instead of
+    exchanging entries.
+
+    With validate=False, the arguments are not checked at all: indices out
+    of range, inserting an index twice, or changing an index that is not on
+    the priority queue silently corrupt it. This mode is meant for trusted
+    callers, such as DijkstraSP and PrimMST, that maintain these invariants
+    themselves.
+
+    The insert, delete-the-minimum, delete, change-key, decrease-key, and
+    increase-key operations take time proportional to log n (with a factor
+    d for the operations that sink). The is-empty, size, min-index,
+    min-key, and key-of operations take constant time. Construction takes
+    time proportional to the specified capacity.
+
+    """
+
+    def __init__(self, max_n, d=4, validate=True):
+        """Initializes an empty indexed priority queue with indices between
+        0 and max_n - 1.
+
+        :param max_n: the keys on this priority queue are indices from 0 to max_n - 1
+        :param d: the number of children of every node of the heap
+        :param validate: if False, do not check the arguments of any operation
+        :raises IllegalArgumentException: if max_n < 0
+        :raises IllegalArgumentException: if d < 2
+
+        """
+        if max_n < 0:
+            raise IllegalArgumentException("max_n must be nonnegative")
+        if d < 2:
+            raise IllegalArgumentException("d must be at least 2")
+        self.max_n = max_n
+        self.n = 0
+        self._d = d
+        self._validate = validate
+        self.keys = array("d", bytes(8 * max_n))
+        self.pq = [0] * max_n  # the heap of indices, with the root at 0
+        self.qp = [-1] * max_n  # the position of every index on the heap
+
+    def _check(self, i, present):
+        # raise an exception unless 0 <= i < max_n and i is (not) on the heap
+        if i < 0 or i >= self.max_n:
+            raise IllegalArgumentException("index is not within range")
+        if present and self.qp[i] == -1:
+            raise NoSuchElementException("index is not in the priority queue")
+        if not present and self.qp[i] != -1:
+            raise IllegalArgumentException("index is already in the priority queue")
+
+    def insert(self, i, key):
+        """Associates key with index i.
+
+        :param i: an index
+        :param key: the key to associate with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if there already is an item associated with index i
+
+        """
+        if self._validate:
+            self._check(i, False)
+        k = self.n
+        self.n = k + 1
+        self.pq[k] = i
+        self.keys[i] = key
+        self._swim(k)
+
+    def contains(self, i):
+        """Is i an index on this priority queue?
+
+        :param i: an index
+        :return: True if i is an index on this priority queue False otherwise
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+
+        """
+        if self._validate and (i < 0 or i >= self.max_n):
+            raise IllegalArgumentException("index is not within range")
+        return self.qp[i] != -1
+
+    def change_key(self, i, key):
+        """Change the key associated with index i to the specified value.
+
+        :param i: the index of the key to change
+        :param key: change the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, True)
+        old = self.keys[i]
+        self.keys[i] = key
+        if key < old:
+            self._swim(self.qp[i])
+        else:
+            self._sink(self.qp[i])
+
+    def decrease_key(self, i, key):
+        """Decrease the key associated with index i to the specified value.
+
+        :param i: the index of the key to decrease
+        :param key: decrease the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key >= key_of(i)
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, True)
+            if self.keys[i] <= key:
+                raise IllegalArgumentException(
+                    "calling decrease_key() with given argument would not strictly decrease the key"
+                )
+        self.keys[i] = key
+        self._swim(self.qp[i])
+
+    def increase_key(self, i, key):
+        """Increase the key associated with index i to the specified value.
+
+        :param i: the index of the key to increase
+        :param key: increase the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key <= key_of(i)
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, True)
+            if self.keys[i] >= key:
+                raise IllegalArgumentException(
+                    "calling increase_key() with given argument would not strictly increase the key"
+                )
+        self.keys[i] = key
+        self._sink(self.qp[i])
+
+    def delete(self, i):
+        """Remove the key associated with index i.
+
+        :param i: the index of the key to remove
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, True)
+        k = self.qp[i]
+        self.qp[i] = -1
+        self.n -= 1
+        if k == self.n:
+            return
+        # move the last entry into the hole, then restore the heap order
+        last = self.pq[self.n]
+        self.pq[k] = last
+        if self.keys[last] < self.keys[i]:
+            self._swim(k)
+        else:
+            self._sink(k)
+
+    def min_index(self):
+        """
+        Returns an index associated with a minimum key.
+        :return: an index associated with a minimum key
+        :rtype: int
+        :raises NoSuchElementException: if this priority queue is empty
+        """
+        if self.n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        return self.pq[0]
+
+    def min_key(self):
+        """
+        Returns a minimum key.
+        :return: a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        """
+        if self.n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        return self.keys[self.pq[0]]
+
+    def del_min(self):
+        """
+        Removes a minimum key and returns its associated index.
+        :return: an index associated with a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+        """
+        if self.n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        pq = self.pq
+        _min = pq[0]
+        self.qp[_min] = -1
+        self.n -= 1
+        if self.n > 0:
+            pq[0] = pq[self.n]
+            self._sink(0)
+        return _min
+
+    def replace_min_key(self, key):
+        """Replaces a minimum key with the specified key, and returns its
+        associated index. The replaced key is at the root of the heap, so
+        sinking the new key restores the heap order whether it is larger or
+        smaller.
+
+        :param key: the new key of the index associated with a minimum key
+        :return: the index whose key was replaced
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+
+        """
+        if self.n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        i = self.pq[0]
+        self.keys[i] = key
+        self._sink(0)
+        return i
+
+    def is_empty(self):
+        """Returns True if this priority queue is empty.
+
+        :return: True if this priority queue is empty False otherwise
+        :rtype: bool
+
+        """
+        return self.n == 0
+
+    def size(self):
+        """Returns the number of keys on this priority queue.
+
+        :return: the number of keys on this priority queue
+        :rtype: int
+
+        """
+        return self.n
+
+    def __len__(self):
+        return self.n
+
+    def key_of(self, i):
+        """Returns the key associated with index i.
+
+        :param i: the index of the key to return
+        :return: the key associated with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, True)
+        return self.keys[i]
+
+    def _swim(self, k):
+        """Moves the index at position k of the heap up to a legal position.
+
+        :param k: the position of the index on the heap
+
+        """
+        pq, qp, keys, d = self.pq, self.qp, self.keys, self._d
+        i = pq[k]
+        key = keys[i]
+        while k > 0:
+            parent = (k - 1) // d
+            j = pq[parent]
+            if keys[j] <= key:
+                break
+            pq[k] = j
+            qp[j] = k
+            k = parent
+        pq[k] = i
+        qp[i] = k
+
+    def _sink(self, k):
+        """Moves the index at position k of the heap down to a legal
+        position.
+
+        :param k: the position of the index on the heap
+
+        """
+        pq, qp, keys, d, n = self.pq, self.qp, self.keys, self._d, self.n
+        i = pq[k]
+        key = keys[i]
+        while True:
+            first = d * k + 1
+            if first >= n:
+                break
+            last = first + d
+            if last > n:
+                last = n
+            # the child with the smallest key; its position is still in qp
+            j = pq[first]
+            child_key = keys[j]
+            for c in pq[first + 1 : last]:
+                c_key = keys[c]
+                if c_key < child_key:
+                    j = c
+                    child_key = c_key
+            if key <= child_key:
+                break
+            child = qp[j]
+            pq[k] = j
+            qp[j] = k
+            k = child
+        pq[k] = i
+        qp[i] = k
+
+    def __iter__(self):
+        """Iterates over all the items in this priority queue in ascending
+        order."""
+        copy = DaryIndexMinPQ(self.max_n, self._d, validate=False)
+        for k in range(self.n):
+            i = self.pq[k]
+            copy.insert(i, self.keys[i])
+        while not copy.is_empty():
+            yield copy.del_min()
+
+
 def main():
     """Inserts a bunch of strings to an indexed priority queue, deletes and
     prints them, inserts them again, and prints them using an iterator."""
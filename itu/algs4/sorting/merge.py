@@ -2,14 +2,20 @@
 # See README.md for details
 # Python 3
 
-from typing import List, Optional
-
 """
 This module provides functions for sorting an array using mergesort.
 
+In checked mode (see the validation module), every merge asserts that its
+input halves and its result are sorted.
+
 For additional documentation, see Section 2.2 of Algorithms, 4th Edition
 by Robert Sedgewick and Kevin Wayne.
 """
+
+from typing import List, Optional
+
+from itu.algs4.sorting import validation
+
 #  Sorts a sequence of strings from standard input using mergesort
 
 
@@ -28,8 +34,9 @@ def _is_sorted(a: List, lo: int = 0, hi: Optional[int] = None):
 # stably merge a[lo .. mid] with a[mid+1 ..hi] using aux[lo .. hi]
 def _merge(a: List, aux: List, lo: int, mid: int, hi: int):
     # precondition: a[lo .. mid] and a[mid+1 .. hi] are sorted subarrays
-    assert _is_sorted(a, lo, mid)
-    assert _is_sorted(a, mid + 1, hi)
+    if validation.checked:
+        assert _is_sorted(a, lo, mid + 1)
+        assert _is_sorted(a, mid + 1, hi + 1)
 
     # copy to aux[]
     for k in range(lo, hi + 1):
@@ -52,7 +59,8 @@ def _merge(a: List, aux: List, lo: int, mid: int, hi: int):
             i += 1
 
     # postcondition: a[lo .. hi] is sorted
-    assert _is_sorted(a, lo, hi)
+    if validation.checked:
+        assert _is_sorted(a, lo, hi + 1)
 
     # mergesort a[lo..hi] using auxiliary array aux[lo..hi]
 
@@ -74,7 +82,8 @@ def sort(a: List):
     """
     aux = [None] * len(a)
     _sort(a, aux, 0, len(a) - 1)
-    assert _is_sorted(a)
+    if validation.checked:
+        assert _is_sorted(a)
 
 
 # Reads in a sequence of strings from standard input or a file
@@ -9,6 +9,9 @@ For additional documentation, see Section 2.1 of Algorithms, 4th Edition
 by Robert Sedgewick and Kevin Wayne.
 
 """
+
+from itu.algs4.sorting import validation
+
 #  Sorts a sequence of strings from standard input using mergesort
 
 
@@ -66,7 +69,8 @@ def sort(a):
             lo += 2 * length
         length *= 2
 
-    assert _is_sorted(a)
+    if validation.checked:
+        assert _is_sorted(a)
 
 
 # Reads in a sequence of strings from standard input or a file
@@ -1,10 +1,9 @@
 # Created for BADS 2018
 # See README.md for details
 # This is python3
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, Iterable, List, Optional, TypeVar
 
 from itu.algs4.errors.errors import NoSuchElementException
-from itu.algs4.stdlib import stdio
 
 Key = TypeVar("Key")
 
@@ -18,18 +17,27 @@ class MinPQ(Generic[Key]):
     implementation uses a binary heap. The insert and delete-the-minimum
     operations take logarithmic amortized time. The min, size and is-
     empty operations take constant time. Construction takes time
-    proportional to the specified capacity.
+    proportional to the specified capacity, or to the number of keys if
+    they are given: the heap is then built bottom-up.
+
+    To avoid the overhead of one call per key, keys can be added with
+    insert_many() and removed with pop_many(), and pushpop() and replace()
+    combine an insertion and a removal into a single sink.
 
     """
 
-    def __init__(self, _max: int = 1) -> None:
-        """Initializes an empty priority queue with the given initial capacity.
+    def __init__(self, _max: int = 1, keys: Optional[Iterable[Key]] = None) -> None:
+        """Initializes a priority queue with the given initial capacity.
 
         :param _max: the initial capacity, default value is 1
+        :param keys: if given, the keys of the priority queue, which is then
+                     built in linear time
 
         """
         self._pq: List[Optional[Key]] = [None] * (_max + 1)
         self._n = 0
+        if keys is not None:
+            self._heapify(keys)
 
     def insert(self, x: Key) -> None:
         """Adds a new key to this priority queue.
@@ -74,6 +82,73 @@ class MinPQ(Generic[Key]):
             self._resize(len(self._pq) // 2)
         return _min
 
+    def insert_many(self, keys: Iterable[Key]) -> None:
+        """Adds new keys to this priority queue. If there are at least as
+        many new keys as keys on the priority queue, the heap is rebuilt
+        bottom-up in linear time instead.
+
+        :param keys: the new keys to add to this priority queue
+
+        """
+        new = list(keys)
+        if len(new) >= self._n:
+            self._heapify(new)
+            return
+        for x in new:
+            self.insert(x)
+
+    def pop_many(self, k: int) -> List[Key]:
+        """Removes and returns the k smallest keys on this priority queue, or all
+        keys if there are fewer than k.
+
+        :param k: the number of keys to remove
+        :return: the removed keys in ascending order
+        :rtype: list
+
+        """
+        pq = self._pq
+        result = []
+        for _ in range(min(k, self._n)):
+            result.append(pq[1])
+            pq[1] = pq[self._n]
+            pq[self._n] = None
+            self._n -= 1
+            self._sink(1)
+        if self._n < (len(pq) - 1) // 4:
+            self._resize(max(2 * self._n, 1) + 1)
+        return result
+
+    def pushpop(self, x: Key) -> Key:
+        """Adds a new key to this priority queue, then removes and returns a
+        smallest key. This is faster than insert() followed by del_min().
+
+        :param x: the new key to add to this priority queue
+        :return: a smallest key of the keys on this priority queue and x
+
+        """
+        pq = self._pq
+        if self._n > 0 and pq[1] < x:
+            pq[1], x = x, pq[1]
+            self._sink(1)
+        return x
+
+    def replace(self, x: Key) -> Key:
+        """Removes and returns a smallest key on this priority queue, then adds a
+        new key. This is faster than del_min() followed by insert(), and the
+        returned key may be smaller than x.
+
+        :param x: the new key to add to this priority queue
+        :return: a smallest key on this priority queue before x was added
+        :raises NoSuchElementException: if this priority queue is empty
+
+        """
+        if self.is_empty():
+            raise NoSuchElementException("Priority queue underflow")
+        pq = self._pq
+        pq[1], x = x, pq[1]
+        self._sink(1)
+        return x
+
     def is_empty(self) -> bool:
         """Returns True if this priority queue is empty.
 
@@ -101,14 +176,33 @@ class MinPQ(Generic[Key]):
         :param k: Index of the item to be moved
 
         """
-        while 2 * k <= self._n:
-            j = 2 * k
-            if j < self._n and self._greater(j, j + 1):
+        # move a hole down instead of exchanging items, with the comparisons
+        # inlined, since this is the inner loop of all bulk operations
+        pq = self._pq
+        n = self._n
+        x = pq[k]
+        j = 2 * k
+        while j <= n:
+            if j < n and pq[j] > pq[j + 1]:
                 j += 1
-            if not self._greater(k, j):
+            if not x > pq[j]:
                 break
-            self._exch(k, j)
+            pq[k] = pq[j]
             k = j
+            j = 2 * k
+        pq[k] = x
+
+    def _heapify(self, keys: Iterable[Key]) -> None:
+        """Adds the keys to the heap and restores the heap order bottom-up,
+        which takes time linear in the size of the heap.
+
+        :param keys: the keys to add
+
+        """
+        self._pq[self._n + 1 :] = keys
+        self._n = len(self._pq) - 1
+        for k in range(self._n // 2, 0, -1):
+            self._sink(k)
 
     def _swim(self, k) -> None:
         """Moves item at index k up to a legal position on the heap.
@@ -168,6 +262,8 @@ def main():
     stdout.
 
     """
+    from itu.algs4.stdlib import stdio
+
     pq = MinPQ()
     while not stdio.isEmpty():
         item = stdio.readString()
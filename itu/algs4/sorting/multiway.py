@@ -0,0 +1,126 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements streaming utilities built on an indexed priority
+queue: a multiway merge of sorted iterables, and the k largest items of a
+stream. Both consume their input lazily and keep only one item per input
+(or k items) in memory."""
+
+import sys
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.stdlib.instream import InStream
+
+
+def merge_sorted(*iterables, key=None):
+    """Merges sorted iterables into a single sorted stream. Every iterable
+    must be sorted in ascending order (by key, if given); the items are
+    read one at a time, only when the merged stream reaches them.
+
+    This implementation uses an IndexMinPQ with one entry per input: the
+    index of the input, with its next item as the key. After yielding the
+    smallest item, it replaces the key of that input with the input's next
+    item with replace_min_key(), or removes the input when it is exhausted.
+    Ties are broken by the position of the input, so the merge is stable.
+    With n inputs, each item takes time proportional to log n, and the
+    memory used is proportional to n.
+
+    :param iterables: the sorted iterables
+    :param key: the function that extracts the comparison key from an item;
+                the items themselves are compared if None
+    :return: a generator of all items in ascending order
+
+    """
+    iterators = [iter(it) for it in iterables]
+    pq = IndexMinPQ(len(iterators))
+    items = [None] * len(iterators)  # the next item of every input
+    for i, it in enumerate(iterators):
+        for item in it:
+            items[i] = item
+            pq.insert(i, (item if key is None else key(item), i))
+            break
+    while not pq.is_empty():
+        i = pq.min_index()
+        yield items[i]
+        for item in iterators[i]:
+            items[i] = item
+            pq.replace_min_key((item if key is None else key(item), i))
+            break
+        else:
+            pq.del_min()
+            items[i] = None
+
+
+def top_k(stream, k, key=None):
+    """Returns the k largest items of a stream (by key, if given), in
+    descending order. The stream may be an iterator of unknown length; it
+    is consumed lazily, and only k items are kept in memory. Of items with
+    equal keys, the ones that come first in the stream are preferred, as in
+    heapq.nlargest().
+
+    This implementation uses an IndexMinPQ with k slots, whose minimum is
+    the smallest of the k largest items seen so far. An item that is
+    larger than that minimum replaces it in its slot. With N items in the
+    stream, it takes time proportional to N log k in the worst case, and
+    memory proportional to k.
+
+    :param stream: the iterable of items
+    :param k: the number of items to return
+    :param key: the function that extracts the comparison key from an item;
+                the items themselves are compared if None
+    :return: a generator of the k largest items, in descending order, that
+             starts yielding once the stream is exhausted
+    :raises IllegalArgumentException: if k < 0
+
+    """
+    if k < 0:
+        raise IllegalArgumentException("k must be nonnegative")
+    return _top_k(stream, k, key)
+
+
+def _top_k(stream, k, key):
+    # the generator of top_k(), so that k is checked when top_k() is called
+    pq = IndexMinPQ(k)
+    # the key of an item is (key, -position): of equal keys, a later item
+    # is smaller, so it is evicted first
+    items = [None] * k  # the item in every slot
+    it = enumerate(stream)
+    for i in range(k):
+        for position, item in it:
+            items[i] = item
+            pq.insert(i, (item if key is None else key(item), -position))
+            break
+        else:
+            break
+    if pq.size() == k > 0:
+        # an item whose key equals the smallest key comes later, so it is
+        # smaller, and only the keys need to be compared
+        smallest = pq.min_key()[0]
+        for position, item in it:
+            x = item if key is None else key(item)
+            if x > smallest:
+                i = pq.min_index()
+                items[i] = item
+                pq.change_key(i, (x, -position))
+                smallest = pq.min_key()[0]
+    result = []
+    while not pq.is_empty():
+        i = pq.del_min()
+        result.append(items[i])
+        items[i] = None
+    result.reverse()
+    yield from result
+
+
+def main():
+    """Reads sorted files of strings given as command-line arguments, and
+    prints their merge to stdout."""
+    streams = [InStream(name).readAllStrings() for name in sys.argv[1:]]
+    for s in merge_sorted(*streams):
+        print(s)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""The parallel_sort module provides a sort that splits its work across a
+pool of worker processes.
+
+Lists of ints (that fit in 64 bits) or floats, and arrays of the array
+module, are sorted with parallel sample sort. The items are copied once into
+a shared array, which every worker can read and write without copying. Each
+worker sorts a contiguous chunk and finds where the splitters, sampled at
+random from the input, fall in it; then each worker gathers the pieces of
+all chunks between two consecutive splitters, sorts them, and writes them to
+their final place in a second shared array. With n items and p processes,
+it takes time proportional to (n log n) / p, plus n for the copies.
+
+Other items, which can only be compared, are sorted with a parallel
+bottom-up mergesort: the workers sort chunks of the list with merge_bu, and
+merge pairs of sorted runs with its merge pass until one run is left. The
+items are pickled to and from the workers, and the last merge runs in a
+single process, so this pays off only when comparisons are expensive. The
+mergesort is stable.
+
+"""
+
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import RawArray
+
+from itu.algs4.sorting import merge_bu
+from itu.algs4.stdlib.instream import InStream
+
+PARALLEL_CUTOFF = 1 << 15  # smaller inputs are sorted in this process
+OVERSAMPLING = 32  # the number of samples per splitter
+
+_arrays = None  # the shared arrays of a worker process, set by _share()
+
+
+def _view(shared, typecode):
+    # a memoryview of a shared ctypes array with the given native item type
+    return memoryview(shared).cast("B").cast(typecode)
+
+
+def _share(typecode, source, target):
+    # runs once in each worker: keeps views of the shared arrays
+    global _arrays
+    _arrays = (typecode, _view(source, typecode), _view(target, typecode))
+
+
+def sort(a, processes=None):
+    """Rearranges the list (or array) in ascending order, using the natural
+    order, with several processes.
+
+    :param a: the list or array.array to be sorted, in place
+    :param processes: the number of worker processes; os.cpu_count() if None
+
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1 or len(a) < PARALLEL_CUTOFF:
+        a[:] = array(a.typecode, sorted(a)) if isinstance(a, array) else sorted(a)
+        return
+    typecode = _typecode(a)
+    if typecode is None:
+        _merge_sort(a, processes)
+    else:
+        _sample_sort(a, typecode, processes)
+
+
+def _typecode(a):
+    # the typecode of an array that can hold the items of a exactly, or None
+    if isinstance(a, array):
+        return a.typecode
+    if all(type(x) is float for x in a):
+        return "d"
+    if all(type(x) is int and -(1 << 63) <= x < 1 << 63 for x in a):
+        return "q"
+    return None
+
+
+def _sample_sort(a, typecode, processes):
+    n = len(a)
+    source = RawArray(typecode, n)
+    _view(source, typecode)[:] = a if isinstance(a, array) else array(typecode, a)
+    target = RawArray(typecode, n)
+
+    # the splitters between the buckets, from a random sample of the items
+    samples = min(n, OVERSAMPLING * processes)
+    sample = sorted(a[i] for i in random.sample(range(n), samples))
+    splitters = sample[OVERSAMPLING::OVERSAMPLING]
+    chunk = -(-n // processes)
+    chunks = [(lo, min(lo + chunk, n)) for lo in range(0, n, chunk)]
+
+    with ProcessPoolExecutor(
+        processes, initializer=_share, initargs=(typecode, source, target)
+    ) as executor:
+        # cuts[i][j] is where bucket j starts in the sorted chunk i
+        cuts = list(executor.map(_sort_chunk, chunks, [splitters] * len(chunks)))
+        tasks = []
+        offset = 0
+        for j in range(len(splitters) + 1):
+            pieces = [(cut[j], cut[j + 1]) for cut in cuts if cut[j] < cut[j + 1]]
+            tasks.append((pieces, offset))
+            offset += sum(hi - lo for lo, hi in pieces)
+        for _ in executor.map(_sort_bucket, tasks):
+            pass
+
+    result = _view(target, typecode)
+    if isinstance(a, array):
+        a[:] = array(typecode, result.tobytes())
+    else:
+        a[:] = result.tolist()
+
+
+def _sort_chunk(bounds, splitters):
+    """Sorts the items lo to hi - 1 of the shared source array in place.
+
+    :param bounds: the pair (lo, hi)
+    :param splitters: the sorted splitters between the buckets
+    :return: the index in the source array where each bucket starts in the
+             chunk, followed by hi
+
+    """
+    typecode, source, _ = _arrays
+    lo, hi = bounds
+    items = sorted(source[lo:hi])
+    source[lo:hi] = array(typecode, items)
+    return [lo] + [lo + bisect_right(items, s) for s in splitters] + [hi]
+
+
+def _sort_bucket(task):
+    """Sorts the items of one bucket into their place in the shared target
+    array.
+
+    :param task: the pair (pieces, offset) of the (lo, hi) bounds of the
+                 sorted pieces of the bucket in the source array, and the
+                 index in the target array of the first item of the bucket
+
+    """
+    typecode, source, target = _arrays
+    pieces, offset = task
+    items = array(typecode)
+    for lo, hi in pieces:
+        items.extend(source[lo:hi])
+    # the pieces are sorted runs, which sorted() merges in linear time each
+    target[offset : offset + len(items)] = array(typecode, sorted(items))
+
+
+def _merge_sort(a, processes):
+    n = len(a)
+    chunk = -(-n // processes)
+    with ProcessPoolExecutor(processes) as executor:
+        runs = list(
+            executor.map(_sort_run, (a[lo : lo + chunk] for lo in range(0, n, chunk)))
+        )
+        while len(runs) > 1:
+            merged = list(executor.map(_merge_runs, runs[0::2], runs[1::2]))
+            if len(runs) % 2 == 1:
+                merged.append(runs[-1])
+            runs = merged
+    a[:] = runs[0]
+
+
+def _sort_run(run):
+    # sorts a chunk of the list with bottom-up mergesort
+    merge_bu.sort(run)
+    return run
+
+
+def _merge_runs(left, right):
+    # merges two sorted runs with the merge pass of bottom-up mergesort
+    a = left + right
+    merge_bu._merge(a, [None] * len(a), 0, len(left) - 1, len(a) - 1)
+    return a
+
+
+def main():
+    """Reads integers from the file given as the first command-line
+    argument, sorts them in parallel, and prints them to stdout."""
+    if len(sys.argv) > 1:
+        a = InStream(sys.argv[1]).readAllInts()
+        sort(a)
+        for x in a:
+            print(x)
+
+
+if __name__ == "__main__":
+    main()
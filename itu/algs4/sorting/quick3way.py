@@ -3,9 +3,12 @@
 # This is python3
 """The Quick3Way module provides static methods for sorting an array using
 quicksort with 3-way partitioning."""
+
 import sys
 from random import shuffle
 
+from itu.algs4.sorting import validation
+
 
 def sort(a):
     """Rearranges the array in ascending order using the natural order.
@@ -37,7 +40,8 @@ def _sort(a, lo, hi):
             i += 1
     _sort(a, lo, lt - 1)
     _sort(a, gt + 1, hi)
-    assert is_sorted(a)
+    if validation.checked:
+        assert _is_sorted(a, lo, hi)
 
 
 def _compare(a, b):
@@ -68,7 +72,12 @@ def is_sorted(a):
     :returns: True if a is sorted.
 
     """
-    for i in range(1, len(a)):
+    return _is_sorted(a, 0, len(a) - 1)
+
+
+# is a[lo..hi] sorted?
+def _is_sorted(a, lo, hi):
+    for i in range(lo + 1, hi + 1):
         if _less(a[i], a[i - 1]):
             return False
     return True
@@ -5,6 +5,14 @@
 """The quicksort module provides methods for sorting an array and selecting the
 ith smallest element in an array using quicksort.
 
+The sort function also has an introsort mode, which does not shuffle:
+it takes the median of three items (or Tukey's ninther) as the pivot,
+sorts small subarrays with insertion sort, recurses only into the smaller
+side of each partition, and falls back to heapsort when the recursion gets
+deeper than twice the logarithm of the length of the array. It takes time
+proportional to n log n in the worst case, and its recursion depth is
+logarithmic.
+
 For additional documentation, see Section 2.3 of Algorithms, 4th Edition
 by Robert Sedgewick and Kevin Wayne.
 
@@ -13,11 +21,24 @@ by Robert Sedgewick and Kevin Wayne.
 
 """
 
-from itu.algs4.stdlib import stdio, stdrandom
+from itu.algs4.sorting import heap
+from itu.algs4.stdlib import stdrandom
+
+INSERTION_SORT_CUTOFF = 16  # introsort sorts smaller subarrays by insertion
+NINTHER_CUTOFF = 40  # introsort takes the ninther of larger subarrays
+
+
+def sort(array, introsort=False):
+    """Rearranges the array in ascending order, using the natural order.
 
+    :param array: the array to be sorted
+    :param introsort: if True, sort in introsort mode instead of shuffling
+                      the array first
 
-def sort(array):
-    """Rearranges the array in ascending order, using the natural order."""
+    """
+    if introsort:
+        _introsort(array, 0, len(array) - 1, 2 * len(array).bit_length())
+        return
     stdrandom.shuffle(array)
     _sort(array, 0, len(array) - 1)
 
@@ -31,6 +52,66 @@ def _sort(array, lo, hi):
     _sort(array, j + 1, hi)
 
 
+# introsort the subarray from array[lo] to array[hi], falling back to
+# heapsort after depth more partitions
+def _introsort(array, lo, hi, depth):
+    while hi - lo >= INSERTION_SORT_CUTOFF:
+        if depth == 0:
+            heap.sort(array, lo, hi + 1)
+            return
+        depth -= 1
+        m = _pivot(array, lo, hi)
+        _exch(array, lo, m)
+        j = _partition(array, lo, hi)
+        # recurse into the smaller side, and loop on the larger one
+        if j - lo < hi - j:
+            _introsort(array, lo, j - 1, depth)
+            lo = j + 1
+        else:
+            _introsort(array, j + 1, hi, depth)
+            hi = j - 1
+    _insertion_sort(array, lo, hi)
+
+
+# return the index of the median of three items of array[lo..hi], or of
+# the median of the medians of three groups of three for large subarrays
+def _pivot(array, lo, hi):
+    n = hi - lo + 1
+    mid = lo + n // 2
+    if n <= NINTHER_CUTOFF:
+        return _median3(array, lo, mid, hi)
+    eps = n // 8
+    return _median3(
+        array,
+        _median3(array, lo, lo + eps, lo + 2 * eps),
+        _median3(array, mid - eps, mid, mid + eps),
+        _median3(array, hi - 2 * eps, hi - eps, hi),
+    )
+
+
+# return the index of the median of array[i], array[j] and array[k]
+def _median3(array, i, j, k):
+    a, b, c = array[i], array[j], array[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+# sort the subarray from array[lo] to array[hi] by insertion
+def _insertion_sort(array, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        v = array[i]
+        j = i
+        while j > lo and v < array[j - 1]:
+            array[j] = array[j - 1]
+            j -= 1
+        array[j] = v
+
+
 # partition the subarray array[lo..hi] so that
 # array[lo..j-1] <= array[j] <= array[j+1..hi]
 # and return the index j
@@ -115,10 +196,14 @@ def _is_sorted(array, lo, hi):
 
 # print array to standard output
 def show(array):
+    from itu.algs4.stdlib import stdio
+
     stdio.write(" ".join(array))
 
 
 if __name__ == "__main__":
+    from itu.algs4.stdlib import stdio
+
     array = stdio.readAllStrings()
     sort(array)
     assert is_sorted(array)
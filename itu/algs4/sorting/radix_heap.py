@@ -0,0 +1,227 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+from itu.algs4.errors.errors import IllegalArgumentException, NoSuchElementException
+
+
+class RadixHeap:
+    """The RadixHeap class represents a monotone indexed priority queue of
+    nonnegative integer keys. It supports the insert, decrease-key, delete
+    and delete-the-minimum operations of IndexMinPQ, with the restriction
+    that a key can never be smaller than the last key removed by
+    del_min(). This holds for the distances in Dijkstra's algorithm, which
+    are removed in increasing order.
+
+    This implementation keeps the indices in buckets by the position of the
+    highest bit in which their key differs from the last minimum: bucket 0
+    holds the keys equal to it, and bucket b the keys that first differ from
+    it in bit b - 1. When bucket 0 is empty, del_min() finds the first
+    nonempty bucket, makes its smallest key the new last minimum, and
+    redistributes its indices into lower buckets. Each index can only move
+    to lower buckets, so with keys below C, the insert, decrease-key and
+    delete operations take constant time, and delete-the-minimum takes
+    amortized time proportional to log C. Integral float keys, such as
+    2.0, are converted to integers.
+
+    With validate=False, the arguments are not checked, as in
+    DaryIndexMinPQ.
+
+    """
+
+    def __init__(self, max_n, validate=True):
+        """Initializes an empty radix heap with indices between 0 and
+        max_n - 1.
+
+        :param max_n: the keys on this priority queue are indices from 0 to max_n - 1
+        :param validate: if False, do not check the arguments of any operation
+        :raises IllegalArgumentException: if max_n < 0
+
+        """
+        if max_n < 0:
+            raise IllegalArgumentException("max_n must be nonnegative")
+        self.max_n = max_n
+        self.n = 0
+        self._validate = validate
+        self._last = 0  # the last key removed by del_min()
+        self._buckets = [set()]
+        self.keys = [0] * max_n
+        self._bucket = [-1] * max_n  # the bucket of every index, -1 if none
+
+    def _check(self, i, key, present):
+        # raise an exception unless i is a valid index that is (not) on the
+        # priority queue, and key is a valid key
+        if i < 0 or i >= self.max_n:
+            raise IllegalArgumentException("index is not within range")
+        if present and self._bucket[i] == -1:
+            raise NoSuchElementException("index is not in the priority queue")
+        if not present and self._bucket[i] != -1:
+            raise IllegalArgumentException("index is already in the priority queue")
+        if key is not None:
+            if key != int(key):
+                raise IllegalArgumentException("key {} is not an integer".format(key))
+            if key < self._last:
+                raise IllegalArgumentException(
+                    "key {} is smaller than the last minimum {}".format(key, self._last)
+                )
+
+    def _place(self, i, key):
+        # put index i with the given key into its bucket
+        b = (key ^ self._last).bit_length()
+        buckets = self._buckets
+        if b >= len(buckets):
+            buckets.extend(set() for _ in range(b + 1 - len(buckets)))
+        buckets[b].add(i)
+        self._bucket[i] = b
+        self.keys[i] = key
+
+    def insert(self, i, key):
+        """Associates key with index i.
+
+        :param i: an index
+        :param key: the key to associate with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if there already is an item associated with index i
+        :raises IllegalArgumentException: unless key is an integer that is at
+                                          least the last minimum removed
+
+        """
+        if self._validate:
+            self._check(i, key, False)
+        self._place(i, int(key))
+        self.n += 1
+
+    def contains(self, i):
+        """Is i an index on this priority queue?
+
+        :param i: an index
+        :return: True if i is an index on this priority queue False otherwise
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+
+        """
+        if self._validate and (i < 0 or i >= self.max_n):
+            raise IllegalArgumentException("index is not within range")
+        return self._bucket[i] != -1
+
+    def decrease_key(self, i, key):
+        """Decrease the key associated with index i to the specified value.
+
+        :param i: the index of the key to decrease
+        :param key: decrease the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key >= key_of(i)
+        :raises IllegalArgumentException: unless key is an integer that is at
+                                          least the last minimum removed
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, key, True)
+            if self.keys[i] <= key:
+                raise IllegalArgumentException(
+                    "calling decrease_key() with given argument would not strictly decrease the key"
+                )
+        self._buckets[self._bucket[i]].discard(i)
+        self._place(i, int(key))
+
+    def delete(self, i):
+        """Remove the key associated with index i.
+
+        :param i: the index of the key to remove
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, None, True)
+        self._buckets[self._bucket[i]].discard(i)
+        self._bucket[i] = -1
+        self.n -= 1
+
+    def _refill(self):
+        # make sure bucket 0 holds the indices with the minimum key
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        if self.n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        b = 1
+        while not buckets[b]:
+            b += 1
+        items = buckets[b]
+        buckets[b] = set()
+        keys = self.keys
+        bucket = self._bucket
+        last = self._last = min([keys[i] for i in items])
+        # every index moves to a bucket below b
+        for i in items:
+            c = (keys[i] ^ last).bit_length()
+            buckets[c].add(i)
+            bucket[i] = c
+
+    def min_index(self):
+        """
+        Returns an index associated with a minimum key.
+        :return: an index associated with a minimum key
+        :rtype: int
+        :raises NoSuchElementException: if this priority queue is empty
+        """
+        self._refill()
+        return next(iter(self._buckets[0]))
+
+    def min_key(self):
+        """
+        Returns a minimum key.
+        :return: a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        """
+        self._refill()
+        return self._last
+
+    def del_min(self):
+        """
+        Removes a minimum key and returns its associated index.
+        :return: an index associated with a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+        """
+        self._refill()
+        i = self._buckets[0].pop()
+        self._bucket[i] = -1
+        self.n -= 1
+        return i
+
+    def is_empty(self):
+        """Returns True if this priority queue is empty.
+
+        :return: True if this priority queue is empty False otherwise
+        :rtype: bool
+
+        """
+        return self.n == 0
+
+    def size(self):
+        """Returns the number of keys on this priority queue.
+
+        :return: the number of keys on this priority queue
+        :rtype: int
+
+        """
+        return self.n
+
+    def __len__(self):
+        return self.n
+
+    def key_of(self, i):
+        """Returns the key associated with index i.
+
+        :param i: the index of the key to return
+        :return: the key associated with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if self._validate:
+            self._check(i, None, True)
+        return self.keys[i]
@@ -0,0 +1,339 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""The timsort module provides an adaptive, stable sort in the style of
+TimSort: it finds the runs that are already sorted in the array, extends
+short runs with binary insertion sort, and merges the runs with galloping.
+On an array that is already sorted, or consists of a few sorted or reversed
+runs, it takes linear time; in the worst case it takes time proportional to
+n log n.
+
+Only the < operator is used to compare keys, as in sorted(). In checked
+mode (see the validation module), the result is asserted to be sorted.
+
+"""
+
+import sys
+from bisect import bisect_left, bisect_right
+
+from itu.algs4.sorting import validation
+
+MIN_MERGE = 64  # runs are extended to at least 32 to 64 items
+MIN_GALLOP = 7  # the initial number of wins that switches to galloping
+
+
+def sort(a, key=None, reverse=False):
+    """Rearranges the list in ascending order. The sort is stable: items
+    with equal keys stay in their original order.
+
+    :param a: the list to sort, in place
+    :param key: the function that extracts the comparison key from an item;
+                it is called exactly once per item. The items themselves are
+                compared if None
+    :param reverse: if True, sort in descending order, still keeping items
+                    with equal keys in their original order
+
+    """
+    n = len(a)
+    if n < 2:
+        return
+    if key is None:
+        keys, values = a, None
+    else:
+        # the keys are sorted, and every move of a key is repeated on the items
+        keys, values = [key(x) for x in a], a
+    if reverse:
+        # reversing before and after keeps equal keys in order
+        keys.reverse()
+        if values is not None:
+            values.reverse()
+    _TimSort(keys, values).sort()
+    if validation.checked:
+        assert is_sorted(keys)
+    if reverse:
+        keys.reverse()
+        if values is not None:
+            values.reverse()
+
+
+def min_run_length(n):
+    """Returns the minimum length of a run for an array of length n: a
+    number between MIN_MERGE / 2 and MIN_MERGE, such that n divided by it is
+    a power of two or slightly less than one, which keeps the merges
+    balanced.
+
+    :param n: the length of the array
+    :return: the minimum length of a run
+
+    """
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+class _TimSort:
+    # the state of one sort: the keys, the items moved along with them (or
+    # None), the stack of pending runs and the galloping threshold
+
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+        self.runs = []  # the pending runs, as pairs (start, length)
+        self.min_gallop = MIN_GALLOP
+
+    def sort(self):
+        n = len(self.keys)
+        min_run = min_run_length(n)
+        lo = 0
+        while lo < n:
+            length = self._count_run(lo, n)
+            if length < min_run:
+                forced = min(min_run, n - lo)
+                self._binary_insertion_sort(lo, lo + forced, lo + length)
+                length = forced
+            self.runs.append((lo, length))
+            self._merge_collapse()
+            lo += length
+        self._merge_force_collapse()
+
+    def _count_run(self, lo, hi):
+        # returns the length of the run that starts at lo, reversing it if it
+        # is strictly descending, which cannot reorder equal keys
+        keys = self.keys
+        r = lo + 1
+        if r == hi:
+            return 1
+        if keys[r] < keys[lo]:
+            r += 1
+            while r < hi and keys[r] < keys[r - 1]:
+                r += 1
+            keys[lo:r] = keys[lo:r][::-1]
+            if self.values is not None:
+                self.values[lo:r] = self.values[lo:r][::-1]
+        else:
+            r += 1
+            while r < hi and not keys[r] < keys[r - 1]:
+                r += 1
+        return r - lo
+
+    def _binary_insertion_sort(self, lo, hi, start):
+        # sorts keys[lo..hi-1], given that keys[lo..start-1] is sorted; an item
+        # is inserted after the equal keys before it, so the sort is stable
+        keys = self.keys
+        values = self.values
+        for i in range(start, hi):
+            x = keys[i]
+            pos = bisect_right(keys, x, lo, i)
+            if pos < i:
+                keys[pos + 1 : i + 1] = keys[pos:i]
+                keys[pos] = x
+                if values is not None:
+                    v = values[i]
+                    values[pos + 1 : i + 1] = values[pos:i]
+                    values[pos] = v
+
+    def _merge_collapse(self):
+        # merges runs until the lengths of the top runs on the stack satisfy
+        # runs[i-2] > runs[i-1] + runs[i] and runs[i-1] > runs[i], so that
+        # the lengths grow at least as fast as the Fibonacci numbers
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or (
+                n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]
+            ):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self._merge_at(n)
+
+    def _merge_force_collapse(self):
+        # merges all runs on the stack into one
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self._merge_at(n)
+
+    def _merge_at(self, i):
+        # merges the runs i and i + 1 on the stack
+        runs = self.runs
+        keys = self.keys
+        lo, na = runs[i]
+        b_lo, nb = runs[i + 1]
+        runs[i] = (lo, na + nb)
+        del runs[i + 1]
+        # the keys of run a that are <= the first key of run b, and the keys of
+        # run b that are >= the last key of run a, are already in place
+        start = bisect_right(keys, keys[b_lo], lo, b_lo)
+        na = b_lo - start
+        if na == 0:
+            return
+        nb = bisect_left(keys, keys[b_lo - 1], b_lo, b_lo + nb) - b_lo
+        if nb == 0:
+            return
+        if na <= nb:
+            self._merge_lo(start, na, b_lo, nb)
+        else:
+            self._merge_hi(start, na, b_lo, nb)
+
+    def _merge_lo(self, a_lo, na, b_lo, nb):
+        # merges from the left, with run a copied to a temporary list
+        keys = self.keys
+        values = self.values
+        tmp_keys = keys[a_lo:b_lo]
+        tmp_values = values[a_lo:b_lo] if values is not None else None
+        i = 0  # the next item of run a, in tmp
+        j = b_lo  # the next item of run b
+        b_hi = b_lo + nb
+        dest = a_lo
+        min_gallop = self.min_gallop
+        while i < na and j < b_hi:
+            # one item at a time, until one run wins min_gallop times in a row
+            count_a = count_b = 0
+            while count_a < min_gallop and count_b < min_gallop:
+                if keys[j] < tmp_keys[i]:
+                    keys[dest] = keys[j]
+                    if values is not None:
+                        values[dest] = values[j]
+                    j += 1
+                    count_b += 1
+                    count_a = 0
+                    dest += 1
+                    if j == b_hi:
+                        break
+                else:
+                    keys[dest] = tmp_keys[i]
+                    if values is not None:
+                        values[dest] = tmp_values[i]
+                    i += 1
+                    count_a += 1
+                    count_b = 0
+                    dest += 1
+                    if i == na:
+                        break
+            # galloping: search for how many items of each run go next, and
+            # move them as blocks, for as long as the blocks are long
+            while i < na and j < b_hi:
+                k = bisect_right(tmp_keys, keys[j], i, na) - i
+                if k:
+                    keys[dest : dest + k] = tmp_keys[i : i + k]
+                    if values is not None:
+                        values[dest : dest + k] = tmp_values[i : i + k]
+                    dest += k
+                    i += k
+                    if i == na:
+                        break
+                m = bisect_left(keys, tmp_keys[i], j, b_hi) - j
+                if m:
+                    keys[dest : dest + m] = keys[j : j + m]
+                    if values is not None:
+                        values[dest : dest + m] = values[j : j + m]
+                    dest += m
+                    j += m
+                if k < MIN_GALLOP and m < MIN_GALLOP:
+                    min_gallop += 1  # galloping does not pay off, yet
+                    break
+                if min_gallop > 1:
+                    min_gallop -= 1
+        # the rest of run b is already in place
+        keys[dest : dest + na - i] = tmp_keys[i:na]
+        if values is not None:
+            values[dest : dest + na - i] = tmp_values[i:na]
+        self.min_gallop = min_gallop
+
+    def _merge_hi(self, a_lo, na, b_lo, nb):
+        # merges from the right, with run b copied to a temporary list; of
+        # equal keys, the ones of run b go last
+        keys = self.keys
+        values = self.values
+        b_hi = b_lo + nb
+        tmp_keys = keys[b_lo:b_hi]
+        tmp_values = values[b_lo:b_hi] if values is not None else None
+        i = b_lo - 1  # the last remaining item of run a
+        j = nb - 1  # the last remaining item of run b, in tmp
+        dest = b_hi - 1
+        min_gallop = self.min_gallop
+        while i >= a_lo and j >= 0:
+            count_a = count_b = 0
+            while count_a < min_gallop and count_b < min_gallop:
+                if tmp_keys[j] < keys[i]:
+                    keys[dest] = keys[i]
+                    if values is not None:
+                        values[dest] = values[i]
+                    i -= 1
+                    count_a += 1
+                    count_b = 0
+                    dest -= 1
+                    if i < a_lo:
+                        break
+                else:
+                    keys[dest] = tmp_keys[j]
+                    if values is not None:
+                        values[dest] = tmp_values[j]
+                    j -= 1
+                    count_b += 1
+                    count_a = 0
+                    dest -= 1
+                    if j < 0:
+                        break
+            while i >= a_lo and j >= 0:
+                # the items of run a that are > the last remaining key of b
+                k = i + 1 - bisect_right(keys, tmp_keys[j], a_lo, i + 1)
+                if k:
+                    keys[dest - k + 1 : dest + 1] = keys[i - k + 1 : i + 1]
+                    if values is not None:
+                        values[dest - k + 1 : dest + 1] = values[i - k + 1 : i + 1]
+                    dest -= k
+                    i -= k
+                    if i < a_lo:
+                        break
+                # the items of run b that are >= the last remaining key of a
+                m = j + 1 - bisect_left(tmp_keys, keys[i], 0, j + 1)
+                if m:
+                    keys[dest - m + 1 : dest + 1] = tmp_keys[j - m + 1 : j + 1]
+                    if values is not None:
+                        values[dest - m + 1 : dest + 1] = tmp_values[j - m + 1 : j + 1]
+                    dest -= m
+                    j -= m
+                if k < MIN_GALLOP and m < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                if min_gallop > 1:
+                    min_gallop -= 1
+        # the rest of run a is already in place
+        keys[a_lo : a_lo + j + 1] = tmp_keys[: j + 1]
+        if values is not None:
+            values[a_lo : a_lo + j + 1] = tmp_values[: j + 1]
+        self.min_gallop = min_gallop
+
+
+def is_sorted(a, key=None):
+    """Returns True if the list is sorted in ascending order (by key, if
+    given).
+
+    :param a: the list
+    :param key: the function that extracts the comparison key from an item
+    :return: True if a is sorted, False otherwise
+
+    """
+    keys = a if key is None else [key(x) for x in a]
+    return all(not keys[i] < keys[i - 1] for i in range(1, len(keys)))
+
+
+def main():
+    """Reads strings from stdin, sorts them, and prints the result to
+    stdout."""
+    a = sys.stdin.read().split()
+    sort(a)
+    for s in a:
+        print(s)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module holds the validation mode of the sorting package. In checked
+mode, the sorts assert their invariants while they run, for instance that
+both halves are sorted before every merge in mergesort. These checks take
+linear time each, so they are off by default; turn them on when testing:
+
+    from itu.algs4.sorting import validation
+
+    validation.set_checked(True)
+
+or only for a block of code:
+
+    with validation.checked_mode():
+        merge.sort(a)
+
+The checks use assert, so they are skipped anyway when Python runs with -O.
+
+"""
+
+from contextlib import contextmanager
+
+checked = False  # whether the sorts check their invariants; see set_checked()
+
+
+def set_checked(enabled):
+    """Turns checked mode on or off for all sorts of the package.
+
+    :param enabled: True to check invariants, False to skip the checks
+
+    """
+    global checked
+    checked = bool(enabled)
+
+
+def is_checked():
+    """Returns True if the sorts of the package check their invariants.
+
+    :return: True in checked mode, False otherwise
+    :rtype: bool
+
+    """
+    return checked
+
+
+@contextmanager
+def checked_mode(enabled=True):
+    """Returns a context manager that turns checked mode on (or off) within
+    a with block, and restores the previous mode when the block exits.
+
+    :param enabled: True to check invariants within the block, False to
+                    skip the checks
+
+    """
+    previous = checked
+    set_checked(enabled)
+    try:
+        yield
+    finally:
+        set_checked(previous)
@@ -148,12 +148,7 @@ class InStream:
         an int.
 
         """
-        strings = self.readAllStrings()
-        ints = []
-        for s in strings:
-            i = int(s)
-            ints.append(i)
-        return ints
+        return list(map(int, self.readAllStrings()))
 
     # -------------------------------------------------------------------
 
@@ -181,12 +176,7 @@ class InStream:
         a float.
 
         """
-        strings = self.readAllStrings()
-        floats = []
-        for s in strings:
-            f = float(s)
-            floats.append(f)
-        return floats
+        return list(map(float, self.readAllStrings()))
 
     # -------------------------------------------------------------------
 
@@ -241,12 +231,51 @@ class InStream:
 
     def readAllStrings(self):
         """Read all remaining strings from the stream wrapped by self, and
-        return them in an array."""
+        return them in an array.
+
+        The rest of the stream is read and split on white space in one
+        pass, rather than matching one string at a time.
+
+        """
+        return self.readAll().split()
+
+    # -------------------------------------------------------------------
+
+    def readStrings(self, n):
+        """Read the next n strings from the stream wrapped by self, and return
+        them in an array. Raise an EOFError if fewer than n strings remain in
+        the stream.
+
+        The stream is read a block of lines at a time, but never past the
+        line that holds the nth string, so the rest of the stream can still
+        be read by the other methods, and reading from sys.stdin does not
+        wait for more input than is needed.
+
+        """
         strings = []
-        while not self.isEmpty():
-            s = self.readString()
-            strings.append(s)
-        return strings
+        buffer = self._buffer
+        while True:
+            need = n - len(strings)
+            tokens = buffer.split(None, need)
+            if len(tokens) > need:
+                # the last item is the rest of the buffer, after the nth string
+                self._buffer = tokens.pop()
+                strings += tokens
+                return strings
+            strings += tokens
+            if len(tokens) == need:
+                self._buffer = ""
+                return strings
+            # every remaining string takes at least two characters with the
+            # white space after it, so lines of fewer than 2 * need characters
+            # cannot hold the nth string
+            lines = self._stream.readlines(min(2 * (n - len(strings)) - 1, 1 << 16))
+            if not lines:
+                self._buffer = ""
+                raise EOFError()
+            if sys.hexversion < 0x03000000 or self._readingWebPage:
+                lines = [line.decode("utf-8") for line in lines]
+            buffer = "".join(lines)
 
     # -------------------------------------------------------------------
 
@@ -4,11 +4,29 @@
 
 """This module provides functions for sorting arrays of strings using lsd sort.
 
+Besides fixed-length strings, it sorts arrays of integers (array.array or
+NumPy arrays) and lists of fixed-length bytes, by their bytes: every pass is
+a stable counting sort on one digit, from the least significant to the most
+significant. A pass is skipped when all keys have the same digit in that
+position. Without NumPy, the digits are bytes, and the counts and moves of a
+pass are a loop. With NumPy, the digits are pairs of bytes, which halves the
+number of passes, and every pass is one stable argsort of a 16-bit column,
+which NumPy does by counting in C: a histogram, its cumulated counts as the
+offsets of the digits, and a scatter of the keys to those offsets. Both can
+return the sorting permutation instead of sorting (argsort).
+
 For additional documentation, see Section 5.1 of Algorithms, 4th Edition
 by Robert Sedgewick and Kevin Wayne.
 
 """
 
+import sys
+from array import array
+from collections import Counter
+
+_SIGNED_TYPECODES = "bhilq"
+_FLIP_SIGN = bytes(b ^ 0x80 for b in range(256))  # a table for bytes.translate()
+
 
 def sort(a, w, radix=256):
     """Rearranges the array of w-character strings in ascending order.
@@ -24,31 +42,192 @@ def sort(a, w, radix=256):
 
     for d in range(w - 1, -1, -1):  # from w-i to 0
         # sort by key-indexed counting on dth character
+        chars = [ord(s[d]) for s in a]  # get number representation of characters
 
         # compute frequency counts
         count = [0] * (radix + 1)
-        for i in range(n):
-            ch = ord(a[i][d])  # get number representation of character
+        for ch in chars:
             count[ch + 1] += 1
+        if n in count:
+            continue  # all strings have the same dth character
 
         # compute cumulates
         for r in range(radix):
             count[r + 1] += count[r]
 
         # move data
-        for i in range(n):
-            ch = ord(a[i][d])
+        for i, ch in enumerate(chars):
             aux[count[ch]] = a[i]
             count[ch] += 1
 
         # copy back
-        for i in range(n):
-            a[i] = aux[i]
+        a[:] = aux
+
+
+def sort_ints(a, argsort=False, vectorized=None):
+    """Rearranges the array of integers in ascending order, sorting by the
+    bytes of the integers in the native byte order, least significant first.
+    Negative integers are sorted by flipping the sign bit.
+
+    :param a: the array.array of an integer typecode, or the NumPy array of
+              integers, to be sorted in place
+    :param argsort: if True, do not change a, and return the permutation that
+                    sorts it: the index in a of the smallest item, then of
+                    the second smallest, and so on; of equal items, the
+                    first one comes first
+    :param vectorized: if True, use NumPy; if None, use NumPy if it is
+                       installed
+    :return: the permutation if argsort is True (a NumPy array if
+             vectorized, a list otherwise), None otherwise
+    :raises ValueError: if a is not an array of integers
 
+    """
+    np = _numpy(vectorized)
+    if isinstance(a, array):
+        if a.typecode not in "bBhHiIlLqQ":
+            raise ValueError("typecode {} is not an integer type".format(a.typecode))
+        w = a.itemsize
+        signed = a.typecode in _SIGNED_TYPECODES
+        raw = a.tobytes()
+    else:
+        if np is None or not isinstance(a, np.ndarray) or a.dtype.kind not in "iu":
+            raise ValueError("the array is not an array of integers")
+        w = a.itemsize
+        signed = a.dtype.kind == "i"
+        raw = np.ascontiguousarray(a, dtype=a.dtype.newbyteorder("=")).view(np.uint8)
+    # the positions of the bytes of a key, from the least significant one
+    columns = (
+        list(range(w)) if sys.byteorder == "little" else list(range(w - 1, -1, -1))
+    )
+    if np is not None:
+        digits = np.frombuffer(raw, dtype=np.uint8).reshape(len(a), w)
+        perm = _lsd_numpy(np, digits, columns, signed)
+        if argsort:
+            return perm
+        target = np.frombuffer(a, dtype="u{}".format(w)) if isinstance(a, array) else a
+        target[:] = target[perm]
+    else:
+        perm = _lsd(raw, len(a), w, columns, signed)
+        if argsort:
+            return perm
+        a[:] = array(a.typecode, [a[i] for i in perm])
+
+
+def sort_bytes(a, argsort=False, vectorized=None):
+    """Rearranges the list of bytes objects of the same length in ascending
+    order, sorting by their bytes from the last to the first.
+
+    :param a: the list of bytes objects to be sorted in place
+    :param argsort: if True, do not change a, and return the permutation that
+                    sorts it, as in sort_ints()
+    :param vectorized: if True, use NumPy; if None, use NumPy if it is
+                       installed
+    :return: the permutation if argsort is True (a NumPy array if
+             vectorized, a list otherwise), None otherwise
+    :raises ValueError: if the bytes objects do not all have the same length
 
-if __name__ == "__main__":
-    import sys
+    """
+    np = _numpy(vectorized)
+    n = len(a)
+    w = len(a[0]) if n > 0 else 0
+    if any(len(key) != w for key in a):
+        raise ValueError("the keys do not all have the same length")
+    raw = b"".join(a)
+    columns = list(range(w - 1, -1, -1))
+    if np is not None:
+        digits = np.frombuffer(raw, dtype=np.uint8).reshape(n, w)
+        perm = _lsd_numpy(np, digits, columns, False)
+        if argsort:
+            return perm
+        perm = perm.tolist()
+    else:
+        perm = _lsd(raw, n, w, columns, False)
+        if argsort:
+            return perm
+    a[:] = [a[i] for i in perm]
+
+
+def _numpy(vectorized):
+    # the numpy module, if it should be used
+    if vectorized is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if vectorized:
+            raise
+        return None
+    return numpy
+
+
+def _lsd(raw, n, w, columns, signed):
+    """Returns the permutation that sorts n keys of w bytes each.
+
+    :param raw: the bytes of all keys, one key after the other
+    :param n: the number of keys
+    :param w: the number of bytes per key
+    :param columns: the positions of the bytes in a key, from the least
+                    significant one
+    :param signed: if True, the most significant byte is signed
+    :return: the permutation, as a list
 
+    """
+    perm = list(range(n))
+    for c in columns:
+        column = raw[c::w]  # the byte at position c of every key
+        if signed and c == columns[-1]:
+            column = column.translate(_FLIP_SIGN)
+        if n == 0 or column.count(column[0]) == n:
+            continue  # all keys have the same byte
+        count = Counter(column)
+        offset = [0] * 256  # the position of the next key with every byte
+        total = 0
+        for b in range(256):
+            offset[b] = total
+            total += count[b]
+        aux = [0] * n
+        for i in perm:
+            b = column[i]
+            aux[offset[b]] = i
+            offset[b] += 1
+        perm = aux
+    return perm
+
+
+def _lsd_numpy(np, digits, columns, signed):
+    """Returns the permutation that sorts the rows of a matrix of bytes.
+
+    :param np: the numpy module
+    :param digits: the n x w matrix of the bytes of the keys
+    :param columns: the columns of the matrix, from the least significant one
+    :param signed: if True, the most significant byte is signed
+    :return: the permutation, as a NumPy array
+
+    """
+    n = len(digits)
+    perm = None
+    for k in range(0, len(columns), 2):
+        # the 16-bit digit of the columns k and k + 1, or the last byte
+        if k + 1 < len(columns):
+            digit = digits[:, columns[k + 1]].astype(np.uint16) << 8
+            digit |= digits[:, columns[k]]
+            top = 0x8000
+        else:
+            digit = digits[:, columns[k]]
+            top = 0x80
+        if signed and k + 2 >= len(columns):
+            digit = digit ^ top
+        if n == 0 or (digit == digit[0]).all():
+            continue  # all keys have the same digit
+        # a stable argsort of at most 16-bit keys is a counting sort in NumPy
+        if perm is None:
+            perm = np.argsort(digit, kind="stable")
+        else:
+            perm = perm[np.argsort(digit[perm], kind="stable")]
+    return np.arange(n) if perm is None else perm
+
+
+if __name__ == "__main__":
     from itu.algs4.stdlib import stdio
 
     if len(sys.argv) > 1:
@@ -9,64 +9,172 @@ by Robert Sedgewick and Kevin Wayne.
 
 """
 
+from itertools import accumulate
+
 cutoff = 15
+PREFIX_WIDTH = 16  # the number of characters in a cached prefix
+
+
+def prefix(key, d):
+    """Returns an integer that encodes the characters d to d + PREFIX_WIDTH - 1
+    of key, such that comparing the integers of two keys compares those
+    characters, and a key that ends is smaller than any character.
+
+    The characters are padded with zeros to PREFIX_WIDTH characters of 8
+    bits (bytes) or 32 bits (str), followed by 8 bits with the number of
+    characters before the padding, which only breaks ties between keys
+    whose padded characters are equal.
+
+    :param key: the str or bytes-like key
+    :param d: the index of the first character
+    :return: the prefix of key at d
+
+    """
+    chunk = key[d : d + PREFIX_WIDTH]
+    n = len(chunk)
+    if isinstance(chunk, str):
+        value = int.from_bytes(chunk.encode("utf-32-be", "surrogatepass"), "big")
+        return value << (32 * (PREFIX_WIDTH - n) + 8) | n
+    return int.from_bytes(chunk, "big") << (8 * (PREFIX_WIDTH - n) + 8) | n
+
 
+def tail(key, d):
+    """Returns the characters of key from d on, as an object that compares
+    like the characters: a str or bytes.
 
-# compare characters at position d
-def _less(a, b, d):
-    return a[d] < b[d]
+    :param key: the str or bytes-like key
+    :param d: the index of the first character
+    :return: the tail of key at d
 
+    """
+    chars = key[d:]
+    return chars.tobytes() if isinstance(chars, memoryview) else chars
+
+
+def insertion_sort(a, p, lo, hi, base):
+    """Sorts a[lo..hi] by insertion, comparing the prefixes p[lo..hi] of the
+    keys first, and their tails only when the prefixes are equal and full.
+
+    :param a: the array of keys
+    :param p: the array of the prefixes of the keys, at base
+    :param lo: the index of the first key
+    :param hi: the index of the last key
+    :param base: the index of the first character of the prefixes; all keys
+                 share the characters before it
 
-# insertion sort a[lo..hi], starting at dth character
-def _insertion(a, lo, hi, d):
-    for i in range(lo, hi + 1):
+    """
+    for i in range(lo + 1, hi + 1):
+        key = a[i]
+        v = p[i]
         j = i
-        while j > lo and _less(a[j], a[j - 1], d):
-            a[j], a[j - 1] = a[j - 1], a[j]
+        while j > lo:
+            t = p[j - 1]
+            if v > t:
+                break
+            if v == t:
+                # the keys are equal, or must be compared after the prefix
+                if v & 255 < PREFIX_WIDTH:
+                    break
+                e = base + PREFIX_WIDTH
+                if not tail(key, e) < tail(a[j - 1], e):
+                    break
+            a[j] = a[j - 1]
+            p[j] = t
             j -= 1
+        a[j] = key
+        p[j] = v
 
 
-# sort from a[lo] to a[hi], starting at the dth character
-def _sort(a, lo, hi, d, aux, radix):
+# sort from a[lo] to a[hi], starting at the dth character, given that their
+# prefixes start at base
+def _sort(a, p, lo, hi, d, base, aux, aux_p, radix):
     if hi <= lo + cutoff:
-        _insertion(a, lo, hi, d)
+        insertion_sort(a, p, lo, hi, base)
         return
 
+    # skip the characters that all keys share, at once if they share their
+    # whole prefix
+    while True:
+        if d == base:
+            prefixes = p[lo : hi + 1]
+            if min(prefixes) == max(prefixes):
+                if prefixes[0] & 255 < PREFIX_WIDTH:
+                    return  # all keys are equal
+                d = base = base + PREFIX_WIDTH
+                for i in range(lo, hi + 1):
+                    p[i] = prefix(a[i], d)
+                continue
+
+        # the dth character of every key, from its prefix, or -1 if it has ended
+        j = d - base
+        bits = 32 if isinstance(a[lo], str) else 8
+        shift = bits * (PREFIX_WIDTH - 1 - j) + 8
+        mask = (1 << bits) - 1
+        chars = [(v >> shift) & mask if j < v & 255 else -1 for v in p[lo : hi + 1]]
+        if chars.count(chars[0]) < len(chars):
+            break
+        if chars[0] < 0:
+            return  # all keys are equal
+        d += 1
+        if d == base + PREFIX_WIDTH:
+            base = d
+            for i in range(lo, hi + 1):
+                p[i] = prefix(a[i], d)
+
     # compute frequency counts
     count = [0] * (radix + 2)
-    for i in range(hi + 1):
-        ch = ord(a[i][d])  # get number representation of character
+    for ch in chars:
         count[ch + 2] += 1
 
     # compute cumulates
-    for r in range(radix + 1):
-        count[r + 1] += count[r]
+    count = list(accumulate(count))
 
     # move data
-    for i in range(hi + 1):
-        ch = ord(a[i][d])
-        aux[count[ch + 1]] = a[i]
-        count[ch + 1] += 1
+    for i, ch in enumerate(chars, lo):
+        k = count[ch + 1]
+        aux[k] = a[i]
+        aux_p[k] = p[i]
+        count[ch + 1] = k + 1
 
     # copy back
-    for i in range(hi + 1):
-        a[i] = aux[i - lo]
-
-    # recursively sort for each character (excludes sentinel -1)
-    for r in range(radix):
-        _sort(a, lo + count[r], lo + count[r + 1] - 1, d + 1, aux, radix)
+    n = hi - lo + 1
+    a[lo : hi + 1] = aux[:n]
+    p[lo : hi + 1] = aux_p[:n]
+
+    # recursively sort for each character that occurs (excludes sentinel -1)
+    for r in sorted(set(chars)):
+        r_lo = lo + count[r]
+        r_hi = lo + count[r + 1] - 1
+        if r < 0 or r_hi <= r_lo:
+            continue
+        if d + 1 == base + PREFIX_WIDTH:
+            # the keys share their whole prefix: cache the next one
+            for i in range(r_lo, r_hi + 1):
+                p[i] = prefix(a[i], d + 1)
+            _sort(a, p, r_lo, r_hi, d + 1, d + 1, aux, aux_p, radix)
+        else:
+            _sort(a, p, r_lo, r_hi, d + 1, base, aux, aux_p, radix)
 
 
 def sort(a, radix=256):
-    """Rearranges the array of 32-bit integers in ascending order. Currently
-    assumes that the integers are nonnegative.
+    """Rearranges the array of strings in ascending order. The strings can
+    be str, or bytes-like objects (bytes, bytearray or memoryview).
+
+    This implementation caches an integer prefix of PREFIX_WIDTH characters
+    of every key. The character of a key at each depth is taken from its
+    prefix, without indexing the key, and the subarrays of at most cutoff
+    keys are sorted by insertion, comparing the prefixes first. Only when
+    the keys of a subarray share their whole prefix does it cache their next
+    prefix.
 
     :param a: the array to be sorted
+    :param radix: the size of the alphabet: every character must be less
+                  than radix
 
     """
     n = len(a)
-    aux = [None] * n
-    _sort(a, 0, n - 1, 0, aux, radix)
+    prefixes = [prefix(key, 0) for key in a]
+    _sort(a, prefixes, 0, n - 1, 0, 0, [None] * n, [0] * n, radix)
 
 
 if __name__ == "__main__":
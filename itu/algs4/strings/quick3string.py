@@ -2,9 +2,22 @@
 # See README.md for details
 # This is python3
 """The Quick3String module provides functions for sorting an array of strings
-using 3-way radix quicksort."""
+using 3-way radix quicksort.
+
+The keys can be str, or bytes-like objects (bytes, bytearray or memoryview).
+Instead of one character at a time, the sort partitions on a cached integer
+prefix of PREFIX_WIDTH characters of every key: comparing two prefixes
+compares that many characters at once, without indexing the keys. Only the
+keys that share a whole prefix get a new prefix, of the next PREFIX_WIDTH
+characters. Subarrays of at most CUTOFF keys are sorted by insertion, also
+comparing the prefixes first."""
+
 import sys
 
+from itu.algs4.strings.msd import PREFIX_WIDTH, insertion_sort, prefix, tail
+
+CUTOFF = 15  # the size of the largest subarray sorted by insertion
+
 
 def sort(a):
     """Rearranges the array of strings in ascending order.
@@ -12,38 +25,63 @@ def sort(a):
     :param a: the array to be sorted.
 
     """
-    _sort(a, 0, len(a) - 1, 0)
-
-
-def _sort(a, lo, hi, d):
-    if hi <= lo:
-        return
-    lt = lo
-    gt = hi
-    v = _char_at(a[lo], d)
-    i = lo + 1
-    while i <= gt:
-        t = _char_at(a[i], d)
-        if t < v:
-            _exch(a, lt, i)
-            lt += 1
-            i += 1
-        elif t > v:
-            _exch(a, i, gt)
-            gt -= 1
-        else:
-            i += 1
-    _sort(a, lo, lt - 1, d)
-    if v >= 0:
-        _sort(a, lt, gt, d + 1)
-    _sort(a, gt + 1, hi, d)
-
-
-def _char_at(s, d):
-    if d < len(s):
-        return ord(s[d])
+    prefixes = [prefix(key, 0) for key in a]
+    _sort(a, prefixes, 0, len(a) - 1, 0)
+
+
+# 3-way radix quicksort a[lo..hi], whose keys share their first d characters
+# and whose prefixes start at d
+def _sort(a, p, lo, hi, d):
+    while hi - lo >= CUTOFF:
+        prefixes = p[lo : hi + 1]
+        if min(prefixes) == max(prefixes):
+            # all keys share their whole prefix: skip the partitioning
+            if prefixes[0] & 255 < PREFIX_WIDTH:
+                return  # all keys are equal
+            d += PREFIX_WIDTH
+            for k in range(lo, hi + 1):
+                p[k] = prefix(a[k], d)
+            continue
+        _median_to_lo(a, p, lo, hi)
+        lt = lo
+        gt = hi
+        v = p[lo]
+        i = lo + 1
+        while i <= gt:
+            t = p[i]
+            if t < v:
+                a[lt], a[i] = a[i], a[lt]
+                p[lt], p[i] = t, p[lt]
+                lt += 1
+                i += 1
+            elif t > v:
+                a[gt], a[i] = a[i], a[gt]
+                p[gt], p[i] = t, p[gt]
+                gt -= 1
+            else:
+                i += 1
+        _sort(a, p, lo, lt - 1, d)
+        # the keys in a[lt..gt] are equal, unless they are longer than the
+        # prefix, in which case they are sorted by their next prefix
+        if v & 255 == PREFIX_WIDTH and lt < gt:
+            e = d + PREFIX_WIDTH
+            for k in range(lt, gt + 1):
+                p[k] = prefix(a[k], e)
+            _sort(a, p, lt, gt, e)
+        lo = gt + 1
+    insertion_sort(a, p, lo, hi, d)
+
+
+# move the key with the median of three prefixes of a[lo..hi] to a[lo]
+def _median_to_lo(a, p, lo, hi):
+    mid = lo + (hi - lo) // 2
+    x, y, z = p[lo], p[mid], p[hi]
+    if x < y:
+        m = mid if y < z else (hi if x < z else lo)
     else:
-        return -1
+        m = lo if x < z else (hi if y < z else mid)
+    a[lo], a[m] = a[m], a[lo]
+    p[lo], p[m] = p[m], p[lo]
 
 
 def _show(a):
@@ -59,7 +97,7 @@ def is_sorted(a):
 
     """
     for i in range(1, len(a)):
-        if _less(a[i], a[i - 1]):
+        if _less(tail(a[i], 0), tail(a[i - 1], 0)):
             return False
     return True
 
@@ -68,12 +106,6 @@ def _less(v, w):
     return v < w
 
 
-def _exch(a, i, j):
-    t = a[i]
-    a[i] = a[j]
-    a[j] = t
-
-
 def main():
     """Reads in a sequence of fixed-length strings from standard input; 3-way
     radix quicksorts them; and prints them to standard output in ascending
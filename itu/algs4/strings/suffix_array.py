@@ -0,0 +1,309 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module provides a suffix array of a text, with its LCP array, for
+substring search without rescanning the text.
+
+For additional documentation, see Section 6.3 of Algorithms, 4th Edition
+by Robert Sedgewick and Kevin Wayne.
+
+"""
+
+import sys
+from array import array
+
+from itu.algs4.strings import lsd
+
+# the number of suffixes ranked at a time after each sort
+BLOCK = 1 << 16
+
+
+class SuffixArray:
+    """The SuffixArray class represents a suffix array of a str or bytes
+    text: the starting indices of all suffixes of the text, in sorted order.
+    It supports the length, index, lcp, select and rank operations of the
+    suffix array of the book, counting and locating the occurrences of a
+    pattern, and finding the longest repeated substring.
+
+    This implementation builds the suffix array by prefix doubling: after
+    round k, the suffixes are sorted by their first 2^k characters, and
+    round k + 1 sorts them by the pairs of ranks of their first 2^k
+    characters and of the 2^k characters after those. With NumPy, the pairs
+    of ranks are combined into integer keys and every round sorts them with
+    the LSD radix sort of lsd.sort_ints(), whose passes over bytes that all
+    keys share are skipped; without NumPy, every round uses the built-in
+    sort. The number of rounds is the logarithm of the length of the longest
+    repeated substring. The LCP array is computed by Kasai's algorithm, in
+    linear time, the first time it is needed.
+
+    The suffix and LCP arrays are stored as arrays of 4-byte integers (8
+    bytes for texts of 2^31 characters or more). With NumPy, the build
+    holds the keys and ranks of all suffixes and, during each sort, the
+    permutations of the radix sort; its measured peak is about 38 bytes per
+    character of the text, on top of the text. Counting the occurrences
+    of a pattern of length m takes time proportional to m log n, where n is
+    the length of the text; locating them takes additional time proportional
+    to their number.
+
+    """
+
+    def __init__(self, text, vectorized=None):
+        """Initializes a suffix array for the given text.
+
+        :param text: the str or bytes text
+        :param vectorized: if True, use NumPy; if None, use NumPy if it is
+                           installed
+
+        """
+        self._text = text
+        n = len(text)
+        self._typecode = "i" if n < 2**31 else "q"
+        numpy = None
+        if vectorized is not False:
+            try:
+                import numpy
+            except ImportError:
+                if vectorized:
+                    raise
+        if numpy is not None:
+            self._index = self._build_numpy(numpy, text)
+        else:
+            self._index = self._build(text)
+        self._lcp = None
+
+    def _build(self, text):
+        # prefix doubling with the built-in sort
+        n = len(text)
+        # the ranks of the characters, between 0 and n - 1
+        ranks = {c: r for r, c in enumerate(sorted(set(text)))}
+        rank = [ranks[c] for c in text]
+        sa = sorted(range(n), key=rank.__getitem__)
+        k = 1
+        while n > 1:
+            # the rank of the suffix at i + k is 0 past the end, below all ranks
+            key = [rank[i] * (n + 1) + rank[i + k] + 1 for i in range(n - k)]
+            key.extend(rank[i] * (n + 1) for i in range(n - k, n))
+            sa.sort(key=key.__getitem__)
+            r = 0
+            prev = key[sa[0]]
+            for i in sa:
+                if key[i] != prev:
+                    r += 1
+                    prev = key[i]
+                rank[i] = r
+            if r == n - 1:
+                break  # all suffixes have distinct ranks
+            k *= 2
+        return array(self._typecode, sa)
+
+    def _build_numpy(self, np, text):
+        # prefix doubling with LSD radix sorts on NumPy arrays
+        n = len(text)
+        if isinstance(text, str):
+            codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), "<u4")
+        else:
+            codes = np.frombuffer(text, np.uint8)
+        # the ranks fit in the typecode of the suffix array, and only the keys
+        # need 64 bits
+        dtype = np.int32 if self._typecode == "i" else np.int64
+        _, inverse = np.unique(codes, return_inverse=True)
+        rank = inverse.astype(dtype).ravel()
+        del inverse
+        key = np.empty(n, np.int64)
+        # the suffixes are ranked a block at a time, so that only one block
+        # of the keys is held in sorted order
+        sorted_key = np.empty(BLOCK + 1, np.int64)
+        changed = np.empty(BLOCK, np.bool_)
+        block_rank = np.empty(BLOCK, dtype)
+        sa = np.arange(n)
+        k = 1
+        while n > 1:
+            key[:] = rank
+            key *= n + 1
+            key[: n - k] += rank[k:]
+            key[: n - k] += 1
+            sa = None  # the sort needs the memory of the previous order
+            sa = lsd.sort_ints(key, argsort=True, vectorized=True)
+            # the ranks are only read to build the keys, so they are replaced
+            # by the new ones block by block
+            r = 0
+            rank[sa[0]] = 0
+            for lo in range(1, n, BLOCK):
+                m = min(BLOCK, n - lo)
+                np.take(key, sa[lo - 1 : lo + m], out=sorted_key[: m + 1])
+                np.not_equal(sorted_key[1 : m + 1], sorted_key[:m], out=changed[:m])
+                np.cumsum(changed[:m], out=block_rank[:m])
+                block_rank[:m] += r
+                rank[sa[lo : lo + m]] = block_rank[:m]
+                r = int(block_rank[m - 1])
+            if r == n - 1:
+                break  # all suffixes have distinct ranks
+            k *= 2
+        del rank, key
+        index = array(self._typecode, bytes(n * np.dtype(dtype).itemsize))
+        np.frombuffer(index, dtype)[:] = sa
+        return index
+
+    def _lcp_array(self):
+        # Kasai's algorithm: the LCP of the suffix at i with the suffix before
+        # it in sorted order is at least one less than that of i - 1
+        if self._lcp is None:
+            text = self._text
+            sa = self._index
+            n = len(sa)
+            rank = array(self._typecode, bytes(n * sa.itemsize))
+            for r, i in enumerate(sa):
+                rank[i] = r
+            lcp = array(self._typecode, bytes(n * sa.itemsize))
+            h = 0
+            for i in range(n):
+                r = rank[i]
+                if r == 0:
+                    h = 0
+                    continue
+                j = sa[r - 1]
+                while i + h < n and j + h < n and text[i + h] == text[j + h]:
+                    h += 1
+                lcp[r] = h
+                if h > 0:
+                    h -= 1
+            self._lcp = lcp
+        return self._lcp
+
+    def _check(self, i, lo=0):
+        # raise an exception unless lo <= i < n
+        if i < lo or i >= len(self._index):
+            raise ValueError(
+                "index {} is not between {} and {}".format(i, lo, len(self._index) - 1)
+            )
+
+    def length(self):
+        """Returns the length of the text.
+
+        :return: the length of the text
+
+        """
+        return len(self._index)
+
+    def index(self, i):
+        """Returns the index into the text of the ith smallest suffix.
+
+        :param i: an integer between 0 and n - 1
+        :return: the index into the text of the ith smallest suffix
+        :raises ValueError: unless 0 <= i < n
+
+        """
+        self._check(i)
+        return self._index[i]
+
+    def lcp(self, i):
+        """Returns the length of the longest common prefix of the ith smallest
+        suffix and the (i - 1)st smallest suffix.
+
+        :param i: an integer between 1 and n - 1
+        :return: the length of the longest common prefix of the ith smallest
+                 suffix and the (i - 1)st smallest suffix
+        :raises ValueError: unless 1 <= i < n
+
+        """
+        self._check(i, 1)
+        return self._lcp_array()[i]
+
+    def select(self, i):
+        """Returns the ith smallest suffix.
+
+        :param i: an integer between 0 and n - 1
+        :return: the ith smallest suffix
+        :raises ValueError: unless 0 <= i < n
+
+        """
+        self._check(i)
+        return self._text[self._index[i] :]
+
+    def rank(self, query):
+        """Returns the number of suffixes strictly less than the query.
+
+        :param query: the query string (or bytes)
+        :return: the number of suffixes strictly less than query
+
+        """
+        return self._bound(query, False)
+
+    def _bound(self, query, past):
+        # the number of suffixes whose first len(query) characters are less
+        # than the query, or less than or equal to it if past is True; a
+        # suffix is less than the query if and only if its first len(query)
+        # characters are
+        text = self._text
+        sa = self._index
+        m = len(query)
+        lo = 0
+        hi = len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = sa[mid]
+            prefix = text[start : start + m]
+            if prefix < query or (past and prefix == query):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def count(self, pattern):
+        """Returns the number of occurrences of the pattern in the text,
+        including overlapping ones.
+
+        :param pattern: the pattern string (or bytes)
+        :return: the number of occurrences of the pattern
+
+        """
+        return self._bound(pattern, True) - self._bound(pattern, False)
+
+    def locate(self, pattern):
+        """Returns the indices of all occurrences of the pattern in the text,
+        including overlapping ones.
+
+        :param pattern: the pattern string (or bytes)
+        :return: the sorted list of the indices in the text where the pattern
+                 occurs
+
+        """
+        lo = self._bound(pattern, False)
+        hi = self._bound(pattern, True)
+        return sorted(self._index[lo:hi])
+
+    def longest_repeated_substring(self):
+        """Returns the longest substring that occurs at least twice in the
+        text (the occurrences may overlap). Of several such substrings, the
+        smallest one is returned.
+
+        :return: the longest repeated substring, empty if there is none
+
+        """
+        lcp = self._lcp_array()
+        if len(lcp) < 2:
+            return self._text[:0]
+        best = max(range(1, len(lcp)), key=lcp.__getitem__)
+        start = self._index[best]
+        return self._text[start : start + lcp[best]]
+
+
+def main():
+    """Reads a text from the file given as the first command-line argument,
+    and prints its longest repeated substring, and the number and positions
+    of the occurrences of the pattern given as the second argument, if any."""
+    if len(sys.argv) > 1:
+        with open(sys.argv[1]) as f:
+            text = f.read()
+        sa = SuffixArray(text)
+        print(
+            "longest repeated substring: {!r}".format(sa.longest_repeated_substring())
+        )
+        if len(sys.argv) > 2:
+            pattern = sys.argv[2]
+            print("{} occurrences at {}".format(sa.count(pattern), sa.locate(pattern)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from itu.algs4.graphs import boruvka_mst
+from itu.algs4.graphs.boruvka_mst import BoruvkaMST
+from itu.algs4.graphs.csr_graph import CSREdgeWeightedGraph
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.kruskal_mst import KruskalMST
+
+
+def random_graph(V, E, seed, weights=None):
+    random.seed(seed)
+    G = EdgeWeightedGraph(V)
+    for _ in range(E):
+        weight = random.choice(weights) if weights else random.random()
+        G.add_edge(Edge(random.randrange(V), random.randrange(V), weight))
+    return G
+
+
+def assert_minimum_spanning_forest(G, mst):
+    expected = KruskalMST(G)
+    edges = list(mst.edges())
+    assert mst.weight() == pytest.approx(expected.weight())
+    assert len(edges) == len(list(expected.edges()))
+    parent = list(range(G.V()))
+
+    def find(p):
+        while p != parent[p]:
+            p = parent[p]
+        return p
+
+    for e in edges:
+        v = e.either()
+        v, w = find(v), find(e.other(v))
+        assert v != w
+        parent[v] = w
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("weights", [None, [1.0, 2.0], [0.5]])
+def test_same_weight_as_kruskal(seed, weights):
+    G = random_graph(50, 120, seed, weights)
+    assert_minimum_spanning_forest(G, BoruvkaMST(G, processes=1))
+
+
+def test_process_pool(monkeypatch):
+    monkeypatch.setattr(boruvka_mst, "PARALLEL_CUTOFF", 100)
+    G = random_graph(200, 600, 4, [1.0, 2.0, 3.0])
+    mst = BoruvkaMST(G, processes=2)
+    assert_minimum_spanning_forest(G, mst)
+    assert mst.weight() == BoruvkaMST(CSREdgeWeightedGraph.from_graph(G), 1).weight()
+
+
+def test_small_graphs(monkeypatch):
+    monkeypatch.setattr(boruvka_mst, "PARALLEL_CUTOFF", 0)
+    for V in (0, 1, 2):
+        mst = BoruvkaMST(EdgeWeightedGraph(V), processes=2)
+        assert list(mst.edges()) == []
+        assert mst.weight() == 0
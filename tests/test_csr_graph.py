@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs import binary_graph
+from itu.algs4.graphs.breadth_first_paths import BreadthFirstPaths
+from itu.algs4.graphs.csr_graph import (
+    CSRDigraph,
+    CSREdgeWeightedDigraph,
+    CSREdgeWeightedGraph,
+    CSRGraph,
+)
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.graph import Graph
+
+
+def random_edges(V, E, seed):
+    random.seed(seed)
+    return [
+        (random.randrange(V), random.randrange(V), random.random()) for _ in range(E)
+    ]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_graph_same_adjacency(seed):
+    edges = random_edges(30, 80, seed)
+    G = Graph(30)
+    for v, w, _ in edges:
+        G.add_edge(v, w)
+    from_edges = CSRGraph.from_edges(30, [e[0] for e in edges], [e[1] for e in edges])
+    for csr in [CSRGraph.from_graph(G), from_edges]:
+        assert csr.V() == G.V()
+        assert csr.E() == G.E()
+        for v in range(G.V()):
+            assert list(csr.adj(v)) == list(G.adj(v))
+            assert csr.degree(v) == G.degree(v)
+        bfs, csr_bfs = BreadthFirstPaths(G, 0), BreadthFirstPaths(csr, 0)
+        for v in range(G.V()):
+            assert bfs.dist_to(v) == csr_bfs.dist_to(v)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_digraph_same_adjacency(seed):
+    edges = random_edges(30, 80, seed)
+    G = Digraph(30)
+    for v, w, _ in edges:
+        G.add_edge(v, w)
+    csr = CSRDigraph.from_graph(G)
+    assert csr.E() == G.E()
+    assert repr(csr) == repr(G)
+    assert repr(csr.reverse()) == repr(G.reverse())
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_edge_weighted_digraph_shortest_paths(seed):
+    edges = random_edges(30, 80, seed)
+    G = EdgeWeightedDigraph(30)
+    for v, w, weight in edges:
+        G.add_edge(DirectedEdge(v, w, weight))
+    csr = CSREdgeWeightedDigraph.from_graph(G)
+    assert repr(csr) == repr(G)
+    sp, csr_sp = DijkstraSP(G, 0), DijkstraSP(csr, 0)
+    for v in range(G.V()):
+        assert sp.dist_to(v) == csr_sp.dist_to(v)
+        assert csr.indegree(v) == G.indegree(v)
+
+
+def test_invalid_vertex():
+    csr = CSRGraph.from_edges(3, [0, 1], [1, 2])
+    with pytest.raises(ValueError):
+        csr.adj(3)
+
+
+@pytest.mark.parametrize("tails, heads", [([0, -1], [1, 2]), ([0], [7]), ([3], [0])])
+def test_from_edges_invalid_vertex(tails, heads):
+    with pytest.raises(ValueError):
+        CSRGraph.from_edges(3, tails, heads)
+    with pytest.raises(ValueError):
+        CSRDigraph.from_edges(3, tails, heads)
+    with pytest.raises(IllegalArgumentException):
+        CSREdgeWeightedGraph.from_edges(3, tails, heads, [0.5] * len(tails))
+    with pytest.raises(IllegalArgumentException):
+        CSREdgeWeightedDigraph.from_edges(3, tails, heads, [0.5] * len(tails))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_edge_weighted_graph_edges(seed):
+    edges = random_edges(30, 80, seed)
+    G = EdgeWeightedGraph(30)
+    for v, w, weight in edges:
+        G.add_edge(Edge(v, w, weight))
+    csr = CSREdgeWeightedGraph.from_graph(G)
+    assert csr.E() == G.E()
+    assert len(list(csr.edges())) == len(list(G.edges()))
+    for v in range(G.V()):
+        assert csr.degree(v) == G.degree(v)
+        assert [e.other(v) for e in csr.adj(v)] == [e.other(v) for e in G.adj(v)]
+
+
+@pytest.mark.parametrize(
+    "make_graph, make_edge",
+    [
+        (Graph, None),
+        (Digraph, None),
+        (EdgeWeightedGraph, Edge),
+        (EdgeWeightedDigraph, DirectedEdge),
+    ],
+)
+def test_binary_round_trip(tmp_path, make_graph, make_edge):
+    G = make_graph(30)
+    for v, w, weight in random_edges(30, 80, 4):
+        if make_edge is None:
+            G.add_edge(v, w)
+        else:
+            G.add_edge(make_edge(v, w, weight))
+    filename = str(tmp_path / "graph.bin")
+    binary_graph.save(G, filename)
+    loaded = binary_graph.load(filename)
+    assert loaded.V() == G.V()
+    assert loaded.E() == G.E()
+    for v in range(G.V()):
+        if make_edge is None:
+            assert list(loaded.adj(v)) == list(G.adj(v))
+        else:
+            assert [e.weight() for e in loaded.adj(v)] == [e.weight() for e in G.adj(v)]
+
+
+def test_binary_rejects_other_files(tmp_path):
+    filename = tmp_path / "graph.txt"
+    filename.write_text("3\n1\n0 1\n" * 10)
+    with pytest.raises(ValueError):
+        binary_graph.load(str(filename))
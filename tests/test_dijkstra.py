@@ -0,0 +1,208 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs.astar_sp import AStarSP, LandmarkHeuristic, euclidean_heuristic
+from itu.algs4.graphs.bidirectional_dijkstra_sp import BidirectionalDijkstraSP
+from itu.algs4.graphs.csr_graph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.dijkstra_all_pairs_sp import DijkstraAllPairsSP
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.dijkstra_undirected_sp import DijkstraUndirectedSP
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.parallel_all_pairs_sp import ParallelAllPairsSP
+
+
+def random_digraph(V, E, seed):
+    random.seed(seed)
+    G = EdgeWeightedDigraph(V)
+    for _ in range(E):
+        G.add_edge(
+            DirectedEdge(random.randrange(V), random.randrange(V), random.random())
+        )
+    return G
+
+
+def random_graph(V, E, seed):
+    random.seed(seed)
+    G = EdgeWeightedGraph(V)
+    for _ in range(E):
+        G.add_edge(Edge(random.randrange(V), random.randrange(V), random.random()))
+    return G
+
+
+def path_length(path):
+    return sum(e.weight() for e in path)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4])
+def test_lazy_dijkstra_sp(seed):
+    G = random_digraph(200, 600, seed)
+    eager = DijkstraSP(G, 0)
+    lazy = DijkstraSP(G, 0, lazy=True)
+    for v in range(G.V()):
+        assert lazy.has_path_to(v) == eager.has_path_to(v)
+        assert lazy.dist_to(v) == pytest.approx(eager.dist_to(v))
+        if lazy.has_path_to(v):
+            assert path_length(lazy.path_to(v)) == pytest.approx(lazy.dist_to(v))
+        else:
+            assert lazy.path_to(v) is None
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3, 4])
+def test_lazy_dijkstra_undirected_sp(seed):
+    G = random_graph(200, 400, seed)
+    eager = DijkstraUndirectedSP(G, 0)
+    lazy = DijkstraUndirectedSP(G, 0, lazy=True)
+    for v in range(G.V()):
+        assert lazy.has_path_to(v) == eager.has_path_to(v)
+        assert lazy.dist_to(v) == pytest.approx(eager.dist_to(v))
+        if lazy.has_path_to(v):
+            assert path_length(lazy.path_to(v)) == pytest.approx(lazy.dist_to(v))
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_negative_weight(lazy):
+    G = EdgeWeightedDigraph(3)
+    G.add_edge(DirectedEdge(1, 2, -1.0))
+    with pytest.raises(IllegalArgumentException):
+        DijkstraSP(G, 0, lazy=lazy)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_dijkstra_sp_target(lazy):
+    G = random_digraph(200, 600, 5)
+    full = DijkstraSP(G, 0)
+    for t in range(0, G.V(), 7):
+        sp = DijkstraSP(G, 0, lazy=lazy, target=t)
+        assert sp.dist_to(t) == pytest.approx(full.dist_to(t))
+        if sp.has_path_to(t):
+            assert path_length(sp.path_to(t)) == pytest.approx(full.dist_to(t))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_bidirectional_dijkstra_sp(seed):
+    G = random_digraph(150, 400, seed)
+    sp = BidirectionalDijkstraSP(G)
+    for s in range(0, G.V(), 10):
+        full = DijkstraSP(G, s)
+        for t in range(G.V()):
+            assert sp.has_path(s, t) == full.has_path_to(t)
+            assert sp.dist(s, t) == pytest.approx(full.dist_to(t))
+            if sp.has_path(s, t):
+                x = s
+                for e in sp.path(s, t):
+                    assert e.from_vertex() == x
+                    x = e.to_vertex()
+                assert x == t
+                assert path_length(sp.path(s, t)) == pytest.approx(full.dist_to(t))
+            else:
+                assert sp.path(s, t) is None
+
+
+def test_bidirectional_dijkstra_sp_csr():
+    G = random_digraph(150, 400, 4)
+    sp = BidirectionalDijkstraSP(G)
+    csr_sp = BidirectionalDijkstraSP(CSREdgeWeightedDigraph.from_graph(G))
+    for s, t in [(0, 1), (5, 100), (149, 3), (7, 7)]:
+        assert csr_sp.dist(s, t) == pytest.approx(sp.dist(s, t))
+
+
+def test_bidirectional_dijkstra_sp_negative_weight():
+    G = EdgeWeightedDigraph(3)
+    G.add_edge(DirectedEdge(1, 2, -1.0))
+    with pytest.raises(IllegalArgumentException):
+        BidirectionalDijkstraSP(G)
+
+
+def grid(n, seed):
+    # an n-by-n grid with roads at least as long as the straight line
+    random.seed(seed)
+    G = EdgeWeightedDigraph(n * n)
+    coordinates = [(v % n, v // n) for v in range(n * n)]
+    for v in range(n * n):
+        for w in (v + 1, v + n):
+            if w < n * n and (w != v + 1 or w % n != 0):
+                weight = random.uniform(1.0, 2.0)
+                G.add_edge(DirectedEdge(v, w, weight))
+                G.add_edge(DirectedEdge(w, v, weight))
+    return G, coordinates
+
+
+def zero_heuristic(v, t):
+    return 0.0
+
+
+def test_astar_sp():
+    G, coordinates = grid(20, 1)
+    landmarks = LandmarkHeuristic(G, LandmarkHeuristic.choose_landmarks(G, 4))
+    assert len(set(landmarks.landmarks())) == 4
+    random.seed(2)
+    for _ in range(20):
+        s, t = random.randrange(G.V()), random.randrange(G.V())
+        expected = DijkstraSP(G, s).dist_to(t)
+        dijkstra = AStarSP(G, s, t, zero_heuristic)
+        assert dijkstra.dist_to(t) == pytest.approx(expected)
+        for heuristic in [euclidean_heuristic(coordinates), landmarks]:
+            sp = AStarSP(G, s, t, heuristic)
+            assert sp.dist_to(t) == pytest.approx(expected)
+            assert path_length(sp.path_to(t)) == pytest.approx(expected)
+            assert sp.settled() <= dijkstra.settled()
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_landmark_heuristic_random_digraph(seed):
+    G = random_digraph(100, 250, seed)
+    heuristic = LandmarkHeuristic(G, [0, 1, 2])
+    for s in range(0, G.V(), 9):
+        full = DijkstraSP(G, s)
+        for t in range(G.V()):
+            assert heuristic(s, t) <= full.dist_to(t) + 1e-9
+            sp = AStarSP(G, s, t, heuristic)
+            assert sp.has_path_to(t) == full.has_path_to(t)
+            assert sp.dist_to(t) == pytest.approx(full.dist_to(t))
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_parallel_all_pairs_sp(processes, tmp_path):
+    G = random_digraph(60, 200, processes)
+    expected = DijkstraAllPairsSP(G)
+    in_memory = ParallelAllPairsSP(G, processes=processes)
+    on_disk = ParallelAllPairsSP(
+        G, processes=processes, filename=str(tmp_path / "dist")
+    )
+    for s in range(G.V()):
+        for t in range(G.V()):
+            assert in_memory.dist(s, t) == pytest.approx(expected.dist(s, t))
+            assert on_disk.dist(s, t) == in_memory.dist(s, t)
+            assert in_memory.has_path(s, t) == expected.has_path(s, t)
+            if in_memory.has_path(s, t):
+                length = path_length(in_memory.path(s, t))
+                assert length == pytest.approx(expected.dist(s, t))
+        assert list(in_memory.row(s)) == [in_memory.dist(s, t) for t in range(G.V())]
+    assert (tmp_path / "dist").stat().st_size == 8 * G.V() * G.V()
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("weight", [int, float])
+def test_integer_weights_use_radix_heap(seed, weight):
+    random.seed(seed)
+    G = EdgeWeightedDigraph(200)
+    for _ in range(800):
+        G.add_edge(
+            DirectedEdge(
+                random.randrange(200),
+                random.randrange(200),
+                weight(random.randrange(10)),
+            )
+        )
+    sp = DijkstraSP(G, 0)
+    assert type(sp._pq).__name__ == "RadixHeap"
+    lazy = DijkstraSP(G, 0, lazy=True)
+    for v in range(G.V()):
+        assert sp.dist_to(v) == lazy.dist_to(v)
+        if sp.has_path_to(v):
+            assert path_length(sp.path_to(v)) == sp.dist_to(v)
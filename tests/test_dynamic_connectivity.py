@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from itu.algs4.fundamentals.uf import UF
+from itu.algs4.graphs.dynamic_connectivity import OfflineDynamicConnectivity
+from itu.algs4.graphs.graph import Graph
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_rebuilding(seed):
+    random.seed(seed)
+    V = 20
+    G = Graph(V)
+    present = []
+    for _ in range(10):
+        v, w = random.randrange(V), random.randrange(V)
+        G.add_edge(v, w)
+        present.append((v, w))
+    dc = OfflineDynamicConnectivity(G)
+    expected = []
+    for _ in range(300):
+        op = random.random()
+        if op < 0.35:
+            v, w = random.randrange(V), random.randrange(V)
+            dc.add_edge(v, w)
+            present.append((v, w))
+        elif op < 0.6 and present:
+            v, w = present.pop(random.randrange(len(present)))
+            dc.remove_edge(w, v)
+        else:
+            v, w = random.randrange(V), random.randrange(V)
+            uf = UF(V)
+            for p, q in present:
+                uf.union(p, q)
+            assert dc.connected(v, w) == len(expected)
+            expected.append(uf.connected(v, w))
+    assert dc.answers() == expected
+
+
+def test_parallel_edges_and_errors():
+    G = Graph(3)
+    G.add_edge(0, 1)
+    G.add_edge(2, 2)
+    dc = OfflineDynamicConnectivity(G)
+    dc.add_edge(1, 0)
+    dc.remove_edge(0, 1)
+    dc.connected(0, 1)
+    dc.remove_edge(1, 0)
+    dc.remove_edge(2, 2)
+    dc.connected(0, 1)
+    assert dc.answers() == [True, False]
+    with pytest.raises(ValueError):
+        dc.remove_edge(0, 1)
+    with pytest.raises(ValueError):
+        dc.connected(0, 3)
+    assert OfflineDynamicConnectivity(Graph(0)).answers() == []
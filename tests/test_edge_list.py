@@ -0,0 +1,51 @@
+import pytest
+
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.edge_list import read_edge_list
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.stdlib.instream import InStream
+
+
+def stream(tmp_path, text):
+    filename = tmp_path / "input.txt"
+    filename.write_text(text)
+    return InStream(str(filename))
+
+
+def test_stops_after_last_edge(tmp_path):
+    s = stream(tmp_path, "4\n3\n0 1\n1 2\n2 3 extra\n7\nnext line\n")
+    V, tails, heads, weights = read_edge_list(s)
+    assert V == 4
+    assert list(tails) == [0, 1, 2]
+    assert list(heads) == [1, 2, 3]
+    assert weights is None
+    assert s.readString() == "extra"
+    assert s.readInt() == 7
+    assert s.readAllStrings() == ["next", "line"]
+
+
+def test_two_graphs_in_one_stream(tmp_path):
+    s = stream(tmp_path, "3 2 0 1 1 2\n2\n1\n0 1 0.5\n")
+    G = Digraph.from_stream(s)
+    H = EdgeWeightedGraph.from_stream(s)
+    assert G.E() == 2
+    assert H.E() == 1
+    assert s.isEmpty()
+
+
+def test_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr("itu.algs4.graphs.edge_list.CHUNK", 3)
+    edges = [(v, (3 * v + 1) % 10, v / 10) for v in range(10)]
+    text = "10\n10\n" + "".join("{} {} {}\n".format(*e) for e in edges)
+    V, tails, heads, weights = read_edge_list(stream(tmp_path, text), weighted=True)
+    assert list(zip(tails, heads, weights)) == edges
+
+
+def test_too_few_edges(tmp_path):
+    with pytest.raises(EOFError):
+        read_edge_list(stream(tmp_path, "3\n2\n0 1\n1\n"))
+
+
+def test_invalid_vertex(tmp_path):
+    with pytest.raises(ValueError):
+        read_edge_list(stream(tmp_path, "3\n1\n0 3\n"))
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.incremental_cc import IncrementalCC
+
+
+def random_edges(V, E, seed):
+    random.seed(seed)
+    return [(random.randrange(V), random.randrange(V)) for _ in range(E)]
+
+
+def assert_same_components(G, cc):
+    expected = CC(G)
+    assert cc.count() == expected.count()
+    for v in range(G.V()):
+        assert cc.size(v) == expected.size(v)
+        for w in range(G.V()):
+            assert cc.connected(v, w) == (expected.id(v) == expected.id(w))
+            assert (cc.id(v) == cc.id(w)) == cc.connected(v, w)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_incremental_cc(seed):
+    G = Graph(40)
+    edges = random_edges(40, 40, seed)
+    for v, w in edges[:10]:
+        G.add_edge(v, w)
+    cc = IncrementalCC(G)
+    assert_same_components(G, cc)
+    for v, w in edges[10:25]:
+        cc.add_edge(v, w)
+        assert_same_components(G, cc)
+    # edges added to the graph directly are tracked too
+    for v, w in edges[25:]:
+        G.add_edge(v, w)
+    assert_same_components(G, cc)
+
+
+def test_add_edges():
+    G = Graph(100)
+    cc = IncrementalCC(G)
+    calls = []
+    G.add_listener(lambda v, w: calls.append((v, w)))
+    edges = random_edges(100, 80, 4)
+    cc.add_edges(edges)
+    assert G.E() == 80
+    assert calls == edges
+    assert_same_components(G, cc)
+
+
+def test_add_edges_validates():
+    G = Graph(3)
+    cc = IncrementalCC(G)
+    with pytest.raises(ValueError):
+        cc.add_edges([(0, 1), (1, 3)])
+    assert G.E() == 0
+    assert cc.count() == 3
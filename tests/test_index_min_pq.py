@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException, NoSuchElementException
+from itu.algs4.sorting.index_min_pq import DaryIndexMinPQ, IndexMinPQ
+
+
+@pytest.mark.parametrize("d", [2, 3, 4, 8])
+@pytest.mark.parametrize("validate", [True, False])
+def test_random_operations(d, validate):
+    random.seed(d)
+    n = 200
+    expected = {}  # index -> key
+    pq = DaryIndexMinPQ(n, d, validate)
+    for _ in range(3000):
+        i = random.randrange(n)
+        key = float(random.randrange(1000))
+        op = random.random()
+        if i not in expected:
+            pq.insert(i, key)
+        elif op < 0.25:
+            pq.change_key(i, key)
+        elif op < 0.4 and key < expected[i]:
+            pq.decrease_key(i, key)
+        elif op < 0.5 and key > expected[i]:
+            pq.increase_key(i, key)
+        elif op < 0.6:
+            pq.delete(i)
+            del expected[i]
+            key = None
+        elif op < 0.8:
+            # ties may be broken in any way, but the key must be the minimum
+            smallest = min(expected.values())
+            assert pq.min_key() == smallest
+            assert expected.pop(pq.del_min()) == smallest
+            key = None
+        else:
+            key = expected[i]
+        if key is not None:
+            expected[i] = key
+        assert pq.size() == len(expected) == len(pq)
+        assert pq.contains(i) == (i in expected)
+        if i in expected:
+            assert pq.key_of(i) == expected[i]
+    keys = [pq.key_of(i) for i in pq]
+    assert keys == sorted(expected.values())
+
+
+def test_same_order_as_index_min_pq():
+    random.seed(5)
+    keys = [random.random() for _ in range(500)]
+    expected = IndexMinPQ(500)
+    pq = DaryIndexMinPQ(500)
+    for i, key in enumerate(keys):
+        expected.insert(i, key)
+        pq.insert(i, key)
+    assert list(pq) == list(expected)
+
+
+def test_validation():
+    pq = DaryIndexMinPQ(3)
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(3, 1.0)
+    pq.insert(0, 1.0)
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(0, 2.0)
+    with pytest.raises(NoSuchElementException):
+        pq.change_key(1, 2.0)
+    with pytest.raises(IllegalArgumentException):
+        pq.decrease_key(0, 2.0)
+    with pytest.raises(IllegalArgumentException):
+        pq.increase_key(0, 0.5)
+    assert pq.del_min() == 0
+    with pytest.raises(NoSuchElementException):
+        pq.del_min()
+    with pytest.raises(NoSuchElementException):
+        pq.min_key()
+    with pytest.raises(IllegalArgumentException):
+        DaryIndexMinPQ(3, d=1)
+
+
+def test_index_min_pq_delete_keeps_heap_order():
+    random.seed(6)
+    n = 300
+    pq = IndexMinPQ(n)
+    expected = {}
+    for _ in range(3000):
+        i = random.randrange(n)
+        if i not in expected:
+            expected[i] = random.random()
+            pq.insert(i, expected[i])
+        elif random.random() < 0.5:
+            pq.delete(i)
+            del expected[i]
+        else:
+            smallest = min(expected.values())
+            assert pq.min_key() == smallest
+            assert expected.pop(pq.del_min()) == smallest
+
+
+@pytest.mark.parametrize("make", [IndexMinPQ, DaryIndexMinPQ])
+def test_replace_min_key(make):
+    random.seed(11)
+    pq = make(50)
+    expected = {}
+    for i in range(50):
+        expected[i] = float(random.randrange(100))
+        pq.insert(i, expected[i])
+    for _ in range(500):
+        key = float(random.randrange(100))
+        i = pq.replace_min_key(key)
+        assert expected[i] == min(expected.values())
+        expected[i] = key
+        assert pq.min_key() == min(expected.values())
+    order = []
+    while not pq.is_empty():
+        order.append(expected[pq.del_min()])
+    assert order == sorted(expected.values())
+    with pytest.raises(NoSuchElementException):
+        pq.replace_min_key(1.0)
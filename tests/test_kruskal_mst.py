@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.kruskal_mst import FilterKruskalMST, KruskalMST
+
+
+def random_graph(V, E, seed, weights=None):
+    random.seed(seed)
+    G = EdgeWeightedGraph(V)
+    for _ in range(E):
+        weight = random.choice(weights) if weights else random.random()
+        G.add_edge(Edge(random.randrange(V), random.randrange(V), weight))
+    return G
+
+
+def assert_spanning_forest(G, mst, expected):
+    assert mst.weight() == pytest.approx(expected.weight())
+    edges = list(mst.edges())
+    assert len(edges) == len(list(expected.edges()))
+    # the edges form a forest: no edge closes a cycle
+    parent = list(range(G.V()))
+
+    def find(p):
+        while p != parent[p]:
+            p = parent[p]
+        return p
+
+    for e in edges:
+        v = e.either()
+        v, w = find(v), find(e.other(v))
+        assert v != w
+        parent[v] = w
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("weights", [None, [1.0, 2.0, 3.0], [-1.0]])
+def test_same_weight_as_minpq_kruskal(seed, weights):
+    G = random_graph(60, 400, seed, weights)
+    expected = KruskalMST(G)
+    assert_spanning_forest(G, KruskalMST(G, presort=True), expected)
+    assert_spanning_forest(G, FilterKruskalMST(G), expected)
+    assert_spanning_forest(G, FilterKruskalMST(G, threshold=4), expected)
+
+
+def test_forest_and_small_graphs():
+    # two components with self-loops and parallel edges
+    G = random_graph(30, 100, 4)
+    H = EdgeWeightedGraph(60)
+    for e in G.edges():
+        v = e.either()
+        w = e.other(v)
+        H.add_edge(Edge(v, w, e.weight()))
+        H.add_edge(Edge(v + 30, w + 30, e.weight()))
+    expected = KruskalMST(H)
+    assert_spanning_forest(H, KruskalMST(H, presort=True), expected)
+    assert_spanning_forest(H, FilterKruskalMST(H, threshold=8), expected)
+    for V in (0, 1):
+        assert list(FilterKruskalMST(EdgeWeightedGraph(V)).edges()) == []
+        assert KruskalMST(EdgeWeightedGraph(V), presort=True).weight() == 0
@@ -0,0 +1,67 @@
+import random
+from array import array
+
+import pytest
+
+from itu.algs4.strings import lsd
+
+
+def test_sort_strings():
+    a = ["bed", "bug", "dad", "yes", "zoo", "all", "bad", "yet", "aaa", "aab"]
+    expected = sorted(a)
+    lsd.sort(a, 3)
+    assert a == expected
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_sort_ints(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    rng = random.Random(11)
+    for typecode, lo, hi in [
+        ("b", -128, 128),
+        ("B", 0, 256),
+        ("h", -(2**15), 2**15),
+        ("i", -(2**31), 2**31),
+        ("q", -(2**63), 2**63),
+        ("Q", 0, 2**64),
+        ("q", 1000, 1010),  # only the lowest byte differs
+    ]:
+        values = [rng.randrange(lo, hi) for _ in range(1000)]
+        a = array(typecode, values)
+        perm = lsd.sort_ints(a, argsort=True, vectorized=vectorized)
+        assert list(a) == values
+        assert list(perm) == sorted(range(len(values)), key=values.__getitem__)
+        lsd.sort_ints(a, vectorized=vectorized)
+        assert a == array(typecode, sorted(values))
+    lsd.sort_ints(array("q"), vectorized=vectorized)
+    with pytest.raises(ValueError):
+        lsd.sort_ints(array("d", [1.0]), vectorized=vectorized)
+
+
+def test_sort_numpy_ints():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(12)
+    for dtype in ("i8", ">i4", "u2"):
+        a = rng.integers(-1000 if dtype != "u2" else 0, 1000, 5000).astype(dtype)
+        perm = lsd.sort_ints(a, argsort=True)
+        assert (perm == np.argsort(a, kind="stable")).all()
+        lsd.sort_ints(a)
+        assert (np.diff(a.astype("i8")) >= 0).all()
+    with pytest.raises(ValueError):
+        lsd.sort_ints(np.zeros(3))
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_sort_bytes(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    rng = random.Random(13)
+    keys = [bytes(rng.randrange(4) for _ in range(5)) for _ in range(1000)]
+    perm = lsd.sort_bytes(keys, argsort=True, vectorized=vectorized)
+    assert list(perm) == sorted(range(len(keys)), key=keys.__getitem__)
+    a = list(keys)
+    lsd.sort_bytes(a, vectorized=vectorized)
+    assert a == sorted(keys)
+    with pytest.raises(ValueError):
+        lsd.sort_bytes([b"ab", b"c"], vectorized=vectorized)
@@ -0,0 +1,47 @@
+import heapq
+import itertools
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.sorting.multiway import merge_sorted, top_k
+
+
+def test_merge_sorted():
+    random.seed(1)
+    shards = [
+        sorted(random.randrange(100) for _ in range(random.randrange(30)))
+        for _ in range(12)
+    ]
+    shards.append([])
+    assert list(merge_sorted(*shards)) == sorted(itertools.chain(*shards))
+    assert list(merge_sorted()) == []
+    assert list(merge_sorted([1, 3], iter([2]))) == [1, 2, 3]
+
+
+def test_merge_sorted_is_stable_and_lazy():
+    a = [(1, "a"), (2, "a"), (2, "a2")]
+    b = [(0, "b"), (2, "b")]
+    merged = merge_sorted(a, b, key=lambda x: x[0])
+    assert list(merged) == [(0, "b"), (1, "a"), (2, "a"), (2, "a2"), (2, "b")]
+    # infinite inputs can be merged as long as only a prefix is consumed
+    evens = itertools.count(0, 2)
+    odds = itertools.count(1, 2)
+    assert list(itertools.islice(merge_sorted(evens, odds), 7)) == list(range(7))
+
+
+@pytest.mark.parametrize("k", [0, 1, 5, 50, 200])
+def test_top_k(k):
+    random.seed(k)
+    items = [(random.randrange(20), i) for i in range(100)]
+    key = lambda x: x[0]  # noqa: E731
+    assert list(top_k(items, k, key=key)) == heapq.nlargest(k, items, key=key)
+    assert list(top_k(iter(items), k)) == heapq.nlargest(k, items)
+
+
+def test_top_k_of_unbounded_stream_prefix():
+    stream = (x * 7919 % 1000 for x in range(10000))
+    assert list(top_k(stream, 3)) == [999, 999, 999]
+    with pytest.raises(IllegalArgumentException):
+        top_k([], -1)
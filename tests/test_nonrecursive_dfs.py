@@ -0,0 +1,115 @@
+import random
+import sys
+
+from itu.algs4.graphs.bipartite import Bipartite
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.cycle import Cycle
+from itu.algs4.graphs.depth_first_order import DepthFirstOrder
+from itu.algs4.graphs.depth_first_paths import DepthFirstPaths
+from itu.algs4.graphs.depth_first_search import DepthFirstSearch
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_cycle import DirectedCycle
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_directed_cycle import EdgeWeightedDirectedCycle
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.kosaraju_sharir_scc import KosarajuSharirSCC
+from itu.algs4.graphs.nonrecursive_dfs import (
+    NONTREE,
+    POSTORDER,
+    PREORDER,
+    orders,
+    reach,
+    walk,
+)
+
+# a path much longer than the recursion limit
+V = 4 * sys.getrecursionlimit()
+
+
+def path_graph(G, closed=False):
+    for v in range(V - 1):
+        G.add_edge(v, v + 1)
+    if closed:
+        G.add_edge(V - 1, 0)
+    return G
+
+
+def test_long_path_graph():
+    G = path_graph(Graph(V))
+    assert DepthFirstSearch(G, 0).count() == V
+    assert len(list(DepthFirstPaths(G, 0).path_to(V - 1))) == V
+    assert CC(G).count() == 1
+    assert Bipartite(G).is_bipartite()
+    assert not Cycle(G).has_cycle()
+
+
+def test_long_cycle_graph():
+    G = path_graph(Graph(V), closed=True)
+    assert len(list(Cycle(G).cycle())) == V + 1
+    assert Bipartite(G).is_bipartite() == (V % 2 == 0)
+
+
+def test_long_path_digraph():
+    G = path_graph(Digraph(V))
+    assert list(DepthFirstOrder(G).reverse_post()) == list(range(V))
+    assert not DirectedCycle(G).has_cycle()
+    assert KosarajuSharirSCC(G).count() == V
+
+    G.add_edge(V - 1, 0)
+    assert len(list(DirectedCycle(G).cycle())) == V + 1
+    assert KosarajuSharirSCC(G).count() == 1
+
+
+def test_long_cycle_edge_weighted_digraph():
+    G = EdgeWeightedDigraph(V)
+    for v in range(V):
+        G.add_edge(DirectedEdge(v, (v + 1) % V, 1.0))
+    assert list(DepthFirstOrder(G).pre()) == list(range(V))
+    assert len(list(EdgeWeightedDirectedCycle(G).cycle())) == V
+
+
+def test_walk_events():
+    G = Digraph(3)
+    G.add_edge(0, 1)
+    G.add_edge(1, 2)
+    G.add_edge(0, 2)
+    marked = [False] * 3
+    edge_to = [None] * 3
+    events = list(walk(G, 0, marked, edge_to))
+    assert events == [
+        (PREORDER, 0, None),
+        (PREORDER, 2, 2),
+        (POSTORDER, 2, None),
+        (PREORDER, 1, 1),
+        (NONTREE, 1, 2),
+        (POSTORDER, 1, None),
+        (POSTORDER, 0, None),
+    ]
+    assert marked == [True] * 3
+    assert edge_to == [None, 0, 0]
+
+
+def test_orders_and_reach_match_walk():
+    random.seed(7)
+    G = EdgeWeightedDigraph(50)
+    for _ in range(120):
+        G.add_edge(DirectedEdge(random.randrange(50), random.randrange(50), 1.0))
+    D = Digraph(50)
+    for e in G.edges():
+        D.add_edge(e.from_vertex(), e.to_vertex())
+    walked = [False] * 50
+    ordered = [False] * 50
+    weighted = [False] * 50
+    reached = [False] * 50
+    edge_to = [None] * 50
+    for s in range(50):
+        if walked[s]:
+            continue
+        events = list(walk(D, s, walked))
+        pre = [v for event, v, _ in events if event == PREORDER]
+        post = [v for event, v, _ in events if event == POSTORDER]
+        assert orders(D, s, ordered) == (pre, post)
+        assert orders(G, s, weighted, DirectedEdge.to_vertex) == (pre, post)
+        assert reach(D, s, reached, edge_to) == pre
+    assert walked == ordered == weighted == reached
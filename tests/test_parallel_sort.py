@@ -0,0 +1,58 @@
+import random
+from array import array
+
+from itu.algs4.sorting import parallel_sort
+
+
+class Record:
+    # compared by key only, so records with equal keys can be told apart
+    def __init__(self, key, name):
+        self.key = key
+        self.name = name
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def test_sample_sort(monkeypatch):
+    monkeypatch.setattr(parallel_sort, "PARALLEL_CUTOFF", 100)
+    rng = random.Random(9)
+    for processes in (2, 3):
+        a = [rng.randrange(-(10**18), 10**18) for _ in range(5000)]
+        b = list(a)
+        parallel_sort.sort(b, processes)
+        assert b == sorted(a)
+        a = [rng.random() for _ in range(5000)]
+        b = list(a)
+        parallel_sort.sort(b, processes)
+        assert b == sorted(a)
+        # many duplicates, in an array that keeps its typecode
+        a = array("i", (rng.randrange(5) for _ in range(5000)))
+        b = array("i", a)
+        parallel_sort.sort(b, processes)
+        assert b == array("i", sorted(a))
+
+
+def test_merge_sort_fallback(monkeypatch):
+    monkeypatch.setattr(parallel_sort, "PARALLEL_CUTOFF", 100)
+    rng = random.Random(10)
+    # ints too large for 64 bits, and strings, can only be compared
+    a = [rng.randrange(10**30) for _ in range(3000)]
+    b = list(a)
+    parallel_sort.sort(b, 3)
+    assert b == sorted(a)
+    # the sort is stable
+    a = [Record(rng.randrange(10), i) for i in range(3000)]
+    b = list(a)
+    parallel_sort.sort(b, 2)
+    assert [r.name for r in b] == [r.name for r in sorted(a, key=lambda r: r.key)]
+
+
+def test_small_inputs():
+    for a in ([], [1], [3, 1, 2], ["b", "a"]):
+        b = list(a)
+        parallel_sort.sort(b, 4)
+        assert b == sorted(a)
+    b = array("d", [2.0, 1.0])
+    parallel_sort.sort(b)
+    assert b == array("d", [1.0, 2.0])
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import NoSuchElementException
+from itu.algs4.sorting.max_pq import MaxPQ
+from itu.algs4.sorting.min_pq import MinPQ
+
+
+def drain(pq, remove):
+    return [remove(pq) for _ in range(pq.size())]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 100])
+def test_heapify_constructor(n):
+    random.seed(n)
+    keys = [random.randrange(50) for _ in range(n)]
+    assert drain(MinPQ(keys=keys), MinPQ.del_min) == sorted(keys)
+    assert drain(MaxPQ(keys=iter(keys)), MaxPQ.del_max) == sorted(keys, reverse=True)
+    pq = MinPQ(keys=keys)
+    pq.insert(-1)
+    assert pq.min() == -1
+    assert pq.size() == n + 1
+
+
+def test_insert_many_and_pop_many():
+    random.seed(1)
+    keys = [random.random() for _ in range(300)]
+    pq = MinPQ()
+    pq.insert_many(keys[:10])  # rebuilds the heap
+    pq.insert_many(keys[10:15])  # inserts one at a time
+    pq.insert_many(keys[15:])
+    assert pq.pop_many(20) == sorted(keys)[:20]
+    assert pq.pop_many(1000) == sorted(keys)[20:]
+    assert pq.is_empty()
+    assert pq.pop_many(3) == []
+    pq.insert(1.0)
+    assert pq.del_min() == 1.0
+
+    pq = MaxPQ(keys=keys)
+    pq.insert_many(range(-3, 0))
+    assert pq.pop_many(5) == sorted(keys, reverse=True)[:5]
+    assert pq.size() == len(keys) - 2
+
+
+def test_pushpop_and_replace():
+    random.seed(2)
+    keys = [random.randrange(1000) for _ in range(200)]
+    # the 10 largest keys, with a min-heap of size 10
+    top = MinPQ(keys=keys[:10])
+    for x in keys[10:]:
+        top.pushpop(x)
+    assert sorted(drain(top, MinPQ.del_min)) == sorted(keys)[-10:]
+    # the 10 smallest keys, with a max-heap of size 10
+    bottom = MaxPQ(keys=keys[:10])
+    for x in keys[10:]:
+        if x < bottom.max():
+            bottom.replace(x)
+    assert sorted(drain(bottom, MaxPQ.del_max)) == sorted(keys)[:10]
+
+    assert MinPQ().pushpop(3) == 3
+    assert MaxPQ(keys=[5]).pushpop(7) == 7
+    pq = MinPQ(keys=[5])
+    assert pq.replace(7) == 5
+    assert pq.min() == 7
+    with pytest.raises(NoSuchElementException):
+        MaxPQ().replace(1)
@@ -0,0 +1,64 @@
+import random
+import sys
+
+from itu.algs4.sorting import heap, quicksort
+
+
+def inputs():
+    rng = random.Random(4)
+    yield []
+    yield [1]
+    yield [rng.random() for _ in range(1000)]
+    yield [rng.randrange(3) for _ in range(1000)]
+    yield list(range(2000))
+    yield list(range(2000, 0, -1))
+    # organ pipe
+    yield list(range(1000)) + list(range(1000, 0, -1))
+
+
+def test_sort():
+    for a in inputs():
+        for introsort in (False, True):
+            b = list(a)
+            quicksort.sort(b, introsort=introsort)
+            assert b == sorted(a)
+            assert quicksort.is_sorted(b)
+
+
+def test_introsort_recursion_is_logarithmic():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(100)
+    try:
+        for a in (list(range(50000)), list(range(50000, 0, -1)), [7] * 50000):
+            b = list(a)
+            quicksort.sort(b, introsort=True)
+            assert b == sorted(a)
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def test_introsort_falls_back_to_heapsort(monkeypatch):
+    calls = []
+    heapsort = heap.sort
+
+    def spy(a, lo=0, hi=None):
+        calls.append((lo, hi))
+        heapsort(a, lo, hi)
+
+    monkeypatch.setattr(heap, "sort", spy)
+    rng = random.Random(6)
+    a = [rng.randrange(100) for _ in range(500)]
+    b = list(a)
+    quicksort._introsort(b, 0, len(b) - 1, 2)
+    assert b == sorted(a)
+    assert calls
+
+
+def test_heapsort_subarray():
+    rng = random.Random(8)
+    a = [rng.randrange(100) for _ in range(200)]
+    b = list(a)
+    heap.sort(b, 50, 150)
+    assert b == a[:50] + sorted(a[50:150]) + a[150:]
+    heap.sort(b)
+    assert b == sorted(a)
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException, NoSuchElementException
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.kruskal_mst import KruskalMST
+from itu.algs4.graphs.prim_mst import PrimMST
+from itu.algs4.sorting.bucket_queue import BucketQueue
+from itu.algs4.sorting.radix_heap import RadixHeap
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_radix_heap_monotone_operations(validate):
+    random.seed(1)
+    n = 300
+    pq = RadixHeap(n, validate)
+    expected = {}  # index -> key
+    last = 0
+    removed = []
+    for _ in range(5000):
+        i = random.randrange(n)
+        op = random.random()
+        if i not in expected and op < 0.5:
+            key = last + random.randrange(1000)
+            pq.insert(i, key)
+            expected[i] = key
+        elif i in expected and op < 0.6 and expected[i] > last:
+            key = random.randrange(last, expected[i])
+            pq.decrease_key(i, float(key))
+            expected[i] = key
+        elif i in expected and op < 0.7:
+            pq.delete(i)
+            del expected[i]
+        elif expected:
+            last = min(expected.values())
+            assert pq.min_key() == last
+            assert expected.pop(pq.del_min()) == last
+            removed.append(last)
+        assert pq.size() == len(expected)
+        assert pq.contains(i) == (i in expected)
+    assert removed == sorted(removed)
+
+
+def test_radix_heap_validation():
+    pq = RadixHeap(3)
+    pq.insert(0, 5)
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(1, 2.5)
+    assert pq.del_min() == 0
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(1, 4)
+    pq.insert(1, 7)
+    with pytest.raises(IllegalArgumentException):
+        pq.decrease_key(1, 8)
+    with pytest.raises(NoSuchElementException):
+        pq.key_of(2)
+    pq.delete(1)
+    with pytest.raises(NoSuchElementException):
+        pq.del_min()
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_bucket_queue_operations(validate):
+    random.seed(2)
+    n = 300
+    pq = BucketQueue(n, 50, validate)
+    expected = {}
+    for _ in range(5000):
+        i = random.randrange(n)
+        key = random.randrange(51)
+        op = random.random()
+        if i not in expected:
+            pq.insert(i, key)
+            expected[i] = key
+        elif op < 0.3:
+            pq.change_key(i, key)
+            expected[i] = key
+        elif op < 0.4:
+            pq.delete(i)
+            del expected[i]
+        else:
+            smallest = min(expected.values())
+            assert pq.min_key() == smallest
+            assert expected.pop(pq.del_min()) == smallest
+        assert pq.size() == len(expected)
+        assert pq.contains(i) == (i in expected)
+    with pytest.raises(IllegalArgumentException):
+        BucketQueue(2, 5).insert(0, 6)
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_prim_mst_with_integer_weights(seed):
+    random.seed(seed)
+    G = EdgeWeightedGraph(100)
+    for _ in range(400):
+        G.add_edge(
+            Edge(random.randrange(100), random.randrange(100), random.randrange(20))
+        )
+    mst = PrimMST(G)
+    assert type(mst._pq).__name__ == "BucketQueue"
+    assert mst.weight() == KruskalMST(G).weight()
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from itu.algs4.sorting import merge, merge_bu, quick3way, timsort, validation
+
+
+def test_sorts_in_both_modes():
+    rng = random.Random(2)
+    data = [rng.randrange(50) for _ in range(500)]
+    for checked in (False, True):
+        with validation.checked_mode(checked):
+            for sort in (merge.sort, merge_bu.sort, quick3way.sort, timsort.sort):
+                a = list(data)
+                sort(a)
+                assert a == sorted(data)
+
+
+def test_checked_mode_catches_broken_invariants():
+    # the second half of a[0..3] is not sorted, so merging is wrong
+    a = [1, 3, 4, 2]
+    merge._merge(a, [None] * 4, 0, 1, 3)
+    with validation.checked_mode():
+        with pytest.raises(AssertionError):
+            merge._merge([1, 3, 4, 2], [None] * 4, 0, 1, 3)
+
+
+def test_checked_mode_is_restored():
+    assert not validation.is_checked()
+    with validation.checked_mode():
+        assert validation.is_checked()
+        with validation.checked_mode(False):
+            assert not validation.is_checked()
+        assert validation.is_checked()
+    assert not validation.is_checked()
+    validation.set_checked(True)
+    try:
+        assert validation.is_checked()
+    finally:
+        validation.set_checked(False)
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from itu.algs4.strings import msd, quick3string
+
+
+def urls(n, seed):
+    rng = random.Random(seed)
+    hosts = ["https://www.example.com/", "https://www.example.org/", "http://a.b/"]
+    paths = ["", "a", "ab", "abc/", "index.html", "é", "\0"]
+    return [
+        rng.choice(hosts) + "/".join(rng.choice(paths) for _ in range(rng.randrange(4)))
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("module", [msd, quick3string])
+def test_sort_str(module):
+    for a in ([], ["b"], ["b", "", "a", "ab"], urls(2000, 1)):
+        expected = sorted(a)
+        module.sort(a)
+        assert a == expected
+
+
+@pytest.mark.parametrize("module", [msd, quick3string])
+def test_sort_bytes_and_memoryviews(module):
+    keys = [url.encode("utf-8") for url in urls(2000, 2)]
+    a = list(keys)
+    module.sort(a)
+    assert a == sorted(keys)
+    # slices of one buffer, sorted without copying them
+    buffer = memoryview(b"".join(keys))
+    views = []
+    start = 0
+    for key in keys:
+        views.append(buffer[start : start + len(key)])
+        start += len(key)
+    module.sort(views)
+    assert [view.tobytes() for view in views] == sorted(keys)
+
+
+def test_quick3string_sorts_any_characters():
+    a = ["\U0001f600b", "\U0001f600", "z", "Ā", "a" * 30, "a" * 29 + "b"]
+    expected = sorted(a)
+    quick3string.sort(a)
+    assert a == expected
+    assert quick3string.is_sorted(a)
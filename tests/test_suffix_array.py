@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from itu.algs4.strings.suffix_array import SuffixArray
+
+
+def naive_lcp(a, b):
+    h = 0
+    while h < min(len(a), len(b)) and a[h] == b[h]:
+        h += 1
+    return h
+
+
+@pytest.fixture(params=[False, True], ids=["python", "numpy"])
+def vectorized(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def test_suffix_array_and_lcp(vectorized):
+    rng = random.Random(14)
+    texts = ["", "a", "aaaaaaaa", "banana", "abracadabra", "it was the best of times"]
+    texts.append("".join(rng.choice("abé\U0001f600") for _ in range(300)))
+    texts.append(bytes(rng.choice(b"acgt") for _ in range(500)))
+    for text in texts:
+        sa = SuffixArray(text, vectorized=vectorized)
+        expected = sorted(range(len(text)), key=lambda i: text[i:])
+        assert sa.length() == len(text)
+        assert [sa.index(i) for i in range(len(text))] == expected
+        for i in range(1, len(text)):
+            assert sa.lcp(i) == naive_lcp(sa.select(i), sa.select(i - 1))
+
+
+def test_blocks(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr("itu.algs4.strings.suffix_array.BLOCK", 7)
+    rng = random.Random(15)
+    for text in ["", "a", "banana", bytes(rng.choice(b"ab") for _ in range(200))]:
+        sa = SuffixArray(text, vectorized=True)
+        expected = sorted(range(len(text)), key=lambda i: text[i:])
+        assert [sa.index(i) for i in range(len(text))] == expected
+
+
+def test_search(vectorized):
+    text = "abracadabra abracadabra"
+    sa = SuffixArray(text, vectorized=vectorized)
+    assert sa.count("abra") == 4
+    assert sa.locate("abra") == [0, 7, 12, 19]
+    assert sa.count("aa") == 0
+    assert sa.locate("zebra") == []
+    assert sa.count("") == len(text)
+    assert sa.rank("b") == sum(1 for i in range(len(text)) if text[i:] < "b")
+    sa = SuffixArray(b"aaaa", vectorized=vectorized)
+    assert sa.locate(b"aa") == [0, 1, 2]
+
+
+def test_longest_repeated_substring(vectorized):
+    sa = SuffixArray("it was the best of times it was the worst of times", vectorized)
+    # "st of times" is as long, but larger
+    assert sa.longest_repeated_substring() == "it was the "
+    assert SuffixArray("abc", vectorized).longest_repeated_substring() == ""
+    assert SuffixArray(b"", vectorized).longest_repeated_substring() == b""
+    assert SuffixArray("aaaa", vectorized).longest_repeated_substring() == "aaa"
+
+
+def test_invalid_indices():
+    sa = SuffixArray("abc", vectorized=False)
+    with pytest.raises(ValueError):
+        sa.index(3)
+    with pytest.raises(ValueError):
+        sa.lcp(0)
+    with pytest.raises(ValueError):
+        sa.select(-1)
@@ -0,0 +1,68 @@
+import random
+
+from itu.algs4.sorting import timsort
+
+
+def cases():
+    rng = random.Random(3)
+    yield []
+    yield [1]
+    yield [2, 1]
+    yield list(range(1000))
+    yield list(range(1000, 0, -1))
+    yield [rng.randrange(10) for _ in range(2000)]
+    yield [rng.random() for _ in range(3000)]
+    # mostly sorted: sorted blocks with a few items out of place
+    a = list(range(5000))
+    for _ in range(50):
+        i, j = rng.randrange(5000), rng.randrange(5000)
+        a[i], a[j] = a[j], a[i]
+    yield a
+    # ascending and descending runs of random lengths
+    a = []
+    while len(a) < 5000:
+        run = sorted(rng.randrange(1000) for _ in range(rng.randrange(1, 400)))
+        a.extend(run if rng.random() < 0.5 else run[::-1])
+    yield a
+
+
+def test_sort():
+    for a in cases():
+        expected = sorted(a)
+        timsort.sort(a)
+        assert a == expected
+        assert timsort.is_sorted(a)
+
+
+def test_sort_is_stable():
+    rng = random.Random(5)
+    for a in cases():
+        items = [(x, rng.random()) for x in a]
+        for reverse in (False, True):
+            expected = sorted(items, key=lambda t: t[0], reverse=reverse)
+            b = list(items)
+            timsort.sort(b, key=lambda t: t[0], reverse=reverse)
+            assert b == expected
+
+
+def test_key_is_called_once_per_item():
+    a = [random.Random(7).randrange(100) for _ in range(3000)]
+    calls = []
+
+    def key(x):
+        calls.append(x)
+        return -x
+
+    timsort.sort(a, key=key)
+    assert len(calls) == 3000
+    assert a == sorted(a, reverse=True)
+    assert timsort.is_sorted(a, key=key)
+    assert not timsort.is_sorted([2, 1])
+
+
+def test_min_run_length():
+    assert timsort.min_run_length(10) == 10
+    assert timsort.min_run_length(64) == 32
+    assert timsort.min_run_length(65) == 33
+    for n in range(64, 5000):
+        assert 32 <= timsort.min_run_length(n) <= 64
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from itu.algs4.graphs.csr_graph import CSRDigraph
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_dfs import DirectedDFS
+from itu.algs4.graphs.kosaraju_sharir_scc import KosarajuSharirSCC
+from itu.algs4.graphs.transitive_closure import TransitiveClosure
+
+
+def random_digraph(V, E, seed):
+    random.seed(seed)
+    G = Digraph(V)
+    for _ in range(E):
+        G.add_edge(random.randrange(V), random.randrange(V))
+    return G
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_transitive_closure(seed):
+    G = random_digraph(40, 20 + 10 * seed, seed)
+    tc = TransitiveClosure(G)
+    for v in range(G.V()):
+        dfs = DirectedDFS(G, v)
+        for w in range(G.V()):
+            assert tc.reachable(v, w) == dfs.is_marked(w)
+
+
+def test_transitive_closure_csr():
+    G = random_digraph(50, 80, 11)
+    tc = TransitiveClosure(G)
+    csr_tc = TransitiveClosure(CSRDigraph.from_graph(G))
+    for v in range(G.V()):
+        for w in range(G.V()):
+            assert csr_tc.reachable(v, w) == tc.reachable(v, w)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_kosaraju_sharir_scc(seed):
+    G = random_digraph(40, 60, seed)
+    scc = KosarajuSharirSCC(G)
+    reach = [DirectedDFS(G, v) for v in range(G.V())]
+    for v in range(G.V()):
+        for w in range(G.V()):
+            assert scc.strongly_connected(v, w) == (
+                reach[v].is_marked(w) and reach[w].is_marked(v)
+            )
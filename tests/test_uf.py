@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from itu.algs4.fundamentals.uf import (
+    UF,
+    ArrayUF,
+    RollbackUF,
+    WeightedQuickUnionUF,
+    find_root,
+    link_roots,
+)
+
+
+def random_pairs(n, m, seed):
+    random.seed(seed)
+    return [(random.randrange(n), random.randrange(n)) for _ in range(m)]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_array_uf_matches_uf(seed):
+    pairs = random_pairs(200, 150, seed)
+    expected = WeightedQuickUnionUF(200)
+    uf = ArrayUF(200)
+    for p, q in pairs:
+        expected.union(p, q)
+        uf.union(p, q)
+        assert uf.count() == expected.count()
+    for p in range(200):
+        for q in range(0, 200, 7):
+            assert uf.connected(p, q) == expected.connected(p, q)
+
+
+def test_find_root_link_roots():
+    parent = list(range(100))
+    rank = [0] * 100
+    expected = UF(100)
+    for p, q in random_pairs(100, 80, 7):
+        expected.union(p, q)
+        root_p = find_root(parent, p)
+        root_q = find_root(parent, q)
+        if root_p != root_q:
+            link_roots(parent, rank, root_p, root_q)
+    for p in range(100):
+        root = find_root(parent, p)
+        assert parent[p] == root
+        for q in range(0, 100, 9):
+            assert (root == find_root(parent, q)) == expected.connected(p, q)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_union_many_find_many(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    pairs = random_pairs(300, 250, 4)
+    expected = UF(300)
+    for p, q in pairs:
+        expected.union(p, q)
+    uf = ArrayUF(300, vectorized=vectorized)
+    merged = uf.union_many(pairs)
+    assert merged == 300 - expected.count()
+    assert uf.count() == expected.count()
+    roots = list(uf.find_many(range(300)))
+    assert roots == [uf.find(p) for p in range(300)]
+    for p in range(300):
+        for q in range(0, 300, 11):
+            assert (roots[p] == roots[q]) == expected.connected(p, q)
+
+
+def test_batch_validation():
+    uf = ArrayUF(5)
+    with pytest.raises(ValueError):
+        uf.union_many([(0, 1), (2, 5)])
+    assert uf.count() == 5
+    assert not uf.connected(0, 1)
+    with pytest.raises(ValueError):
+        uf.find_many([0, -1])
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_snapshot_restore(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    uf = ArrayUF(100, vectorized=vectorized)
+    uf.union_many(random_pairs(100, 40, 5))
+    labels = uf.snapshot()
+    count = uf.count()
+    components = [[uf.connected(p, q) for q in range(100)] for p in range(100)]
+    uf.union_many(random_pairs(100, 60, 6))
+    assert uf.count() < count
+    uf.restore(labels)
+    assert uf.count() == count
+    assert [[uf.connected(p, q) for q in range(100)] for p in range(100)] == components
+    other = ArrayUF(100)
+    other.restore(labels)
+    assert list(other.snapshot()) == list(labels)
+    with pytest.raises(ValueError):
+        other.restore([1, 0] + list(range(2, 100)))
+
+
+def test_rollback_uf():
+    pairs = random_pairs(100, 120, 5)
+    uf = RollbackUF(100)
+    for p, q in pairs[:40]:
+        uf.union(p, q)
+    before = [uf.find(p) for p in range(100)], uf.count()
+    uf.checkpoint()
+    for p, q in pairs[40:80]:
+        uf.union(p, q)
+    uf.checkpoint()
+    for p, q in pairs[80:]:
+        uf.union(p, q)
+    expected = WeightedQuickUnionUF(100)
+    for p, q in pairs:
+        expected.union(p, q)
+    assert uf.count() == expected.count()
+    uf.rollback()
+    uf.rollback()
+    assert ([uf.find(p) for p in range(100)], uf.count()) == before
+    with pytest.raises(ValueError):
+        uf.rollback()